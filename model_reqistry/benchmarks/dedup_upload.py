@@ -0,0 +1,67 @@
+"""
+Benchmark uploads of duplicate model files.
+
+Uploads the same random artifact as several model versions and reports the
+time of the first upload against the duplicates. Duplicates are registered
+by content digest without sending the file, so they should take a few
+milliseconds regardless of the artifact size.
+
+Usage
+-----
+python benchmarks/dedup_upload.py --url http://localhost:8000 --upload-mb 256 --copies 5
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from registry.client import ModelRegistryClient  # noqa: E402
+from registry.schemas import ModelMetadata  # noqa: E402
+
+# Versions are unique per model name, so every run registers its own versions
+RUN_ID = int(time.time())
+
+
+def make_metadata(index):
+    return ModelMetadata(
+        id=f"dedup{index}",
+        name="dedup_benchmark_model",
+        version=f"0.0.{index}+{RUN_ID}",
+        file_extension="bin",
+        storage_group="benchmarks",
+        framework="none",
+        tags={"purpose": "benchmark"},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--upload-mb", type=int, default=256)
+    parser.add_argument("--copies", type=int, default=5)
+    args = parser.parse_args()
+
+    client = ModelRegistryClient(args.url, timeout=600)
+    payload = os.urandom(args.upload_mb * 1024 * 1024)
+
+    paths = set()
+    for index in range(args.copies):
+        started = time.perf_counter()
+        info = client.upload_model(io.BytesIO(payload), make_metadata(index))
+        elapsed = (time.perf_counter() - started) * 1000
+        paths.add(info.file_path)
+        label = "first upload" if index == 0 else f"duplicate {index}"
+        print(f"{label:<14} {elapsed:10.1f} ms")
+
+    print(f"stored blobs: {len(paths)} for {args.copies} versions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark delta storage of fine-tuned model versions.
+
+Registers a random base artifact, then a chain of versions that each rewrite
+a fraction of the previous version's blocks and declare it as their parent.
+Reports the bytes stored for every version against its full size, and the
+latency of the first (reconstructing) and a repeated (cached) download.
+Versions beyond ``DELTA_MAX_CHAIN`` are re-based to full copies.
+
+Usage
+-----
+python benchmarks/delta_storage.py --url http://localhost:8000 --upload-mb 128 \
+    --versions 6 --changed 0.05
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from registry.client import ModelRegistryClient  # noqa: E402
+from registry.schemas import ModelMetadata  # noqa: E402
+
+# Versions are unique per model name, so every run registers its own versions
+RUN_ID = int(time.time())
+
+BLOCK = 64 * 1024
+
+
+def make_metadata(index):
+    return ModelMetadata(
+        id=f"delta{index}",
+        name="delta_benchmark_model",
+        version=f"0.0.{index}+{RUN_ID}",
+        file_extension="bin",
+        storage_group="benchmarks",
+        framework="none",
+        tags={"purpose": "benchmark"},
+        parent_version=f"0.0.{index - 1}+{RUN_ID}" if index else None,
+    )
+
+
+def fine_tune(payload, changed):
+    """Return a copy of ``payload`` with a fraction ``changed`` of its blocks rewritten."""
+    data = bytearray(payload)
+    blocks = len(data) // BLOCK
+    for block in random.sample(range(blocks), int(blocks * changed)):
+        data[block * BLOCK:(block + 1) * BLOCK] = os.urandom(BLOCK)
+    return bytes(data)
+
+
+def timed_download(client, info):
+    started = time.perf_counter()
+    buffer = client.get_model_file(info.file_path, info.storage_group)
+    return (time.perf_counter() - started) * 1000, buffer.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--upload-mb", type=int, default=128)
+    parser.add_argument("--versions", type=int, default=6)
+    parser.add_argument(
+        "--changed", type=float, default=0.05, help="Fraction of blocks changed per version"
+    )
+    args = parser.parse_args()
+
+    client = ModelRegistryClient(args.url, timeout=600)
+    payload = os.urandom(args.upload_mb * 1024 * 1024)
+
+    total_size = total_stored = 0
+    print(
+        f"{'version':<8} {'stored':>12} {'size':>12} {'depth':>6} "
+        f"{'first ms':>10} {'cached ms':>10}"
+    )
+    for index in range(args.versions):
+        if index:
+            payload = fine_tune(payload, args.changed)
+        info = client.upload_model(io.BytesIO(payload), make_metadata(index))
+        storage_info = client.get_metadata(info.metadata_id)["storage_info"]
+
+        first, content = timed_download(client, info)
+        cached, _ = timed_download(client, info)
+        assert content == payload, f"version {index} was not reconstructed correctly"
+
+        stored = storage_info.get("stored_size", storage_info["size"])
+        total_size += storage_info["size"]
+        total_stored += stored
+        print(
+            f"{index:<8} {stored:>12} {storage_info['size']:>12} "
+            f"{storage_info.get('delta_depth', 0):>6} "
+            f"{first:>10.1f} {cached:>10.1f}"
+        )
+
+    print(
+        f"stored {total_stored} of {total_size} bytes "
+        f"({100 * (1 - total_stored / total_size):.1f}% saved)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark metadata read latency while large uploads are running.
+
+Measures ``GET /model/metadata/{id}`` latency percentiles against a running
+registry, first idle and then while several large model uploads are in
+flight. With blocking storage calls kept off the event loop, p99 during
+uploads should stay close to the idle p99.
+
+Usage
+-----
+python benchmarks/metadata_latency_under_upload.py --url http://localhost:8000 \\
+    --uploads 4 --upload-mb 512 --reads 500
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import io
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+
+from registry.client import ModelRegistryClient  # noqa: E402
+from registry.schemas import ModelMetadata  # noqa: E402
+
+
+def percentile(values, q):
+    """Return the q-th percentile (0-100) of values."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure_reads(url, metadata_id, reads, concurrency):
+    """Issue metadata reads and return their latencies in milliseconds."""
+    session = requests.Session()
+    latencies = []
+    lock = threading.Lock()
+
+    def read(_):
+        started = time.perf_counter()
+        session.get(f"{url}/model/metadata/{metadata_id}", timeout=60).raise_for_status()
+        with lock:
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(read, range(reads)))
+    return latencies
+
+
+# Versions are unique per model name, so every run registers its own versions
+RUN_ID = int(time.time())
+
+
+def make_metadata(index):
+    return ModelMetadata(
+        id=f"bench{index}",
+        name="benchmark_model",
+        version=f"0.0.{index}+{RUN_ID}",
+        file_extension="bin",
+        storage_group="benchmarks",
+        framework="none",
+        tags={"purpose": "benchmark"},
+    )
+
+
+def report(label, latencies):
+    print(
+        f"{label:<16} n={len(latencies):<5} p50={statistics.median(latencies):8.2f} ms  "
+        f"p99={percentile(latencies, 99):8.2f} ms  max={max(latencies):8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument(
+        "--uploads", type=int, default=4, help="concurrent uploads during the loaded phase"
+    )
+    parser.add_argument(
+        "--upload-mb", type=int, default=256, help="size of each uploaded model in MiB"
+    )
+    parser.add_argument(
+        "--reads", type=int, default=500, help="metadata reads per measurement batch"
+    )
+    parser.add_argument("--read-concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    client = ModelRegistryClient(args.url, timeout=600)
+    seed = client.upload_model(io.BytesIO(os.urandom(1024)), make_metadata(0))
+
+    report("idle", measure_reads(args.url, seed.metadata_id, args.reads, args.read_concurrency))
+
+    payload = os.urandom(args.upload_mb * 1024 * 1024)
+
+    def upload(index):
+        client.upload_model(io.BytesIO(payload), make_metadata(index))
+
+    with ThreadPoolExecutor(max_workers=args.uploads) as executor:
+        futures = [executor.submit(upload, index) for index in range(1, args.uploads + 1)]
+        # Give the uploads time to reach the server before measuring
+        time.sleep(0.5)
+        # Keep reading until every upload has finished
+        loaded = []
+        while not loaded or not all(future.done() for future in futures):
+            loaded += measure_reads(args.url, seed.metadata_id, args.reads, args.read_concurrency)
+        for future in futures:
+            future.result()
+
+    report(f"{args.uploads} uploads", loaded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Admission control for model uploads.
+
+Every upload request holds its body in memory (upload session parts) or in
+a spooled file plus one storage part buffer (``POST /model/upload``), and a
+storage connection while it is written. Versions stored as deltas are
+encoded through temporary files and add only chunk sized buffers. This module bounds the number of
+concurrent uploads and the bytes they declare, queueing excess requests in
+arrival order for a limited time and rejecting them with
+``429 Too Many Requests`` and ``Retry-After`` when the queue is full or the
+wait times out.
+
+Notes
+-----
+Admission happens before the request body is read, so rejected uploads cost
+neither memory nor storage traffic. Requests without ``Content-Length`` are
+charged ``UPLOAD_PART_MAX_SIZE``, and every request is charged at most the
+whole byte budget, so a single oversized upload runs alone instead of never.
+
+Completing an upload session reads the assembled file back from storage to
+hash (and possibly compress) it, so it is charged the session's total size.
+Its small JSON body is read first, since it lists the parts uploaded
+directly to storage. Registering by hash copies stored content inside the
+object store and only holds a slot.
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+from .core.config import settings
+from .logger import logger
+from .metrics import (
+    UPLOAD_ADMISSIONS,
+    UPLOAD_INFLIGHT_BYTES,
+    UPLOAD_QUEUE_DEPTH,
+    UPLOAD_QUEUE_WAIT,
+    UPLOADS_IN_PROGRESS,
+)
+
+# Requests subject to admission control, matched before routing
+UPLOAD_REQUESTS = (
+    ("POST", re.compile(r"^/model/upload$")),
+    ("POST", re.compile(r"^/model/upload/by-hash$")),
+    ("PUT", re.compile(r"^/model/upload-sessions/[^/]+/parts/\d+$")),
+    ("POST", re.compile(r"^/model/upload-sessions/[^/]+/complete$")),
+)
+
+# Upload requests whose body describes content already stored, charged its size
+DESCRIBED_UPLOADS = (("POST", re.compile(r"^/model/upload-sessions/[^/]+/complete$")),)
+
+
+def _matches(scope: Dict[str, Any], requests: Tuple[Tuple[str, "re.Pattern"], ...]) -> bool:
+    """Return whether an HTTP request is one of ``requests``."""
+    method, path = scope["method"], scope["path"]
+    return any(method == expected and pattern.match(path) for expected, pattern in requests)
+
+
+class AdmissionController:
+    """
+    FIFO admission of uploads within a concurrency and an in-flight byte budget.
+
+    Parameters
+    ----------
+    max_uploads : int
+        Maximum number of uploads admitted at the same time
+    max_bytes : int
+        Maximum sum of the sizes of admitted uploads
+    max_queue : int
+        Maximum number of uploads waiting for admission, more are rejected immediately
+    queue_timeout : float
+        Seconds an upload waits for admission before it is rejected
+
+    Notes
+    -----
+    Not thread-safe, all calls must come from the event loop. Waiting uploads
+    are admitted strictly in arrival order, so a large upload at the head of
+    the queue is not starved by smaller ones behind it.
+    """
+
+    def __init__(self, max_uploads: int, max_bytes: int, max_queue: int, queue_timeout: float):
+        self.max_uploads = max_uploads
+        self.max_bytes = max_bytes
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.uploads = 0
+        self.bytes = 0
+        self._queue: Deque[Tuple[int, asyncio.Future]] = deque()
+
+    def charge(self, content_length: Optional[int]) -> int:
+        """Return the bytes an upload counts against the budget."""
+        size = settings.UPLOAD_PART_MAX_SIZE if content_length is None else content_length
+        return max(0, min(size, self.max_bytes))
+
+    def _fits(self, size: int) -> bool:
+        return self.uploads < self.max_uploads and self.bytes + size <= self.max_bytes
+
+    def _admit(self, size: int) -> None:
+        self.uploads += 1
+        self.bytes += size
+        UPLOADS_IN_PROGRESS.set(self.uploads)
+        UPLOAD_INFLIGHT_BYTES.set(self.bytes)
+
+    def _admit_waiting(self) -> None:
+        """Admit queued uploads from the head of the queue while they fit."""
+        while self._queue and self._fits(self._queue[0][0]):
+            size, future = self._queue.popleft()
+            self._admit(size)
+            future.set_result(True)
+        UPLOAD_QUEUE_DEPTH.set(len(self._queue))
+
+    async def acquire(self, size: int) -> bool:
+        """
+        Wait until an upload of ``size`` bytes may start.
+
+        Parameters
+        ----------
+        size : int
+            Bytes charged to the upload, see ``charge``
+
+        Returns
+        -------
+        bool
+            True once admitted, False if the queue is full or the wait timed
+            out. Admitted uploads must call ``release`` with the same size.
+        """
+        if not self._queue and self._fits(size):
+            self._admit(size)
+            UPLOAD_ADMISSIONS.labels("admitted").inc()
+            return True
+        if len(self._queue) >= self.max_queue:
+            UPLOAD_ADMISSIONS.labels("queue_full").inc()
+            return False
+
+        loop = asyncio.get_running_loop()
+        entry = (size, loop.create_future())
+        self._queue.append(entry)
+        UPLOAD_QUEUE_DEPTH.set(len(self._queue))
+        timer = loop.call_later(
+            self.queue_timeout, lambda: entry[1].done() or entry[1].set_result(False)
+        )
+        started = time.perf_counter()
+        try:
+            admitted = await entry[1]
+        except asyncio.CancelledError:
+            # The client went away, give back a slot granted in the meantime
+            if entry[1].done() and not entry[1].cancelled() and entry[1].result():
+                self.release(size)
+            raise
+        finally:
+            timer.cancel()
+            UPLOAD_QUEUE_WAIT.observe(time.perf_counter() - started)
+            try:
+                self._queue.remove(entry)
+            except ValueError:
+                pass
+            # A timed out head of the queue may have been blocking smaller uploads
+            self._admit_waiting()
+
+        UPLOAD_ADMISSIONS.labels("admitted" if admitted else "timeout").inc()
+        return admitted
+
+    def release(self, size: int) -> None:
+        """Return an admitted upload's slot and bytes, admitting waiting uploads."""
+        self.uploads -= 1
+        self.bytes -= size
+        UPLOADS_IN_PROGRESS.set(self.uploads)
+        UPLOAD_INFLIGHT_BYTES.set(self.bytes)
+        self._admit_waiting()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return admitted uploads, their bytes and the queue depth next to the limits."""
+        return {
+            "uploads": self.uploads,
+            "bytes": self.bytes,
+            "queued": len(self._queue),
+            "max_uploads": self.max_uploads,
+            "max_bytes": self.max_bytes,
+            "max_queue": self.max_queue,
+        }
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware passing upload requests through an ``AdmissionController``.
+
+    Rejected requests get ``429 Too Many Requests`` with a ``Retry-After`` of
+    the queue timeout. The slot is held until the response is sent.
+
+    Parameters
+    ----------
+    app : ASGI application
+        Application to protect
+    controller : AdmissionController
+        Budgets shared by all upload requests
+    described_size : callable, optional
+        Coroutine function returning the bytes moved by one of the
+        ``DESCRIBED_UPLOADS`` from its path and body, or None if unknown.
+        Those requests are charged their ``Content-Length`` without it.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        controller: AdmissionController,
+        described_size: Optional[Callable[[str, bytes], Awaitable[Optional[int]]]] = None,
+    ):
+        self.app = app
+        self.controller = controller
+        self.described_size = described_size
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not _matches(scope, UPLOAD_REQUESTS):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit():
+                content_length = int(value)
+        if self.described_size is not None and _matches(scope, DESCRIBED_UPLOADS):
+            body, receive = await self._buffer_body(receive)
+            try:
+                content_length = await self.described_size(scope["path"], body)
+            except Exception as e:
+                # Unknown sessions and malformed bodies are reported by the route
+                logger.debug(f"Cannot size upload {scope['path']}: {str(e)}")
+        size = self.controller.charge(content_length)
+
+        if not await self.controller.acquire(size):
+            logger.warning(
+                f"Rejected upload {scope['method']} {scope['path']}: {self.controller.stats()}"
+            )
+            response = JSONResponse(
+                {"detail": "Too many uploads in progress, retry later"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, math.ceil(self.controller.queue_timeout)))},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(size)
+
+    @staticmethod
+    async def _buffer_body(receive: Callable) -> Tuple[bytes, Callable]:
+        """Read a whole request body, returning it and a ``receive`` replaying it to the app."""
+        chunks = []
+        message = await receive()
+        while message["type"] == "http.request":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                message = {"type": "http.request", "body": b"".join(chunks), "more_body": False}
+                break
+            message = await receive()
+        # A disconnect is passed on to the app as is
+        pending = [message]
+
+        async def replay() -> Dict[str, Any]:
+            return pending.pop() if pending else await receive()
+
+        return (message.get("body", b"") if message["type"] == "http.request" else b""), replay
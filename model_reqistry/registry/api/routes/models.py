@@ -1,17 +1,62 @@
-from typing import Optional, Dict
-import io
+from typing import Optional, Dict, Any, AsyncIterator, List, Literal, Tuple
 import json
+import hashlib
+import secrets
 from datetime import datetime
 
-from fastapi import APIRouter,HTTPException, Depends, Form, File, UploadFile, status
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    Form,
+    File,
+    Header,
+    Path,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse, JSONResponse, RedirectResponse
 
-from registry.schemas import ModelResponse, ModelMetadata,GetMetadataModelResponse
+from registry.schemas import (
+    ModelResponse,
+    ModelMetadata,
+    GetMetadataModelResponse,
+    MetadataBatchRequest,
+    MetadataBatchResponse,
+    ModelListResponse,
+    AliasRequest,
+    AliasResponse,
+    RegisterByHashRequest,
+    UploadSessionRequest,
+    UploadSessionResponse,
+    UploadPartResponse,
+    UploadPartUrlResponse,
+    UploadCompleteRequest,
+    UploadSessionStatus,
+)
 from registry.core.dependencies import registry_container
 from registry.core.dependencies import get_registry
-from registry.services import ModelRegistry
-from registry.exceptions import RegistryError,ModelNotFoundError
+from registry.services import AsyncModelRegistry
+from registry.exceptions import (
+    RegistryError,
+    ModelNotFoundError,
+    ValidationError,
+    DuplicateModelError,
+    ResourceBusyError,
+)
 from registry.logger import logger
+from registry.core.config import settings
+from registry.util import (
+    METADATA_HEADER,
+    METADATA_HEADER_MAX_SIZE,
+    encode_metadata_header,
+    etag_matches,
+    parse_range_header,
+)
+from registry.codec import ZSTD, accepts_encoding
+from registry.events import RESET, format_event
 
 
 app = APIRouter()
@@ -40,11 +85,36 @@ async def health_check():
         )
 
 
+@app.get("/health/live", response_model=Dict[str, str])
+async def liveness_check():
+    """Liveness probe, answers as long as the event loop is responsive"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", response_model=Dict[str, Any])
+async def readiness_check():
+    """Readiness probe, pings the model file and metadata backends and reports their latency"""
+    try:
+        registry = await registry_container.get_registry()
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "error": str(e)},
+        )
+
+    backends = await registry.check_backends()
+    ready = all(check["status"] == "ok" for check in backends.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "unavailable", "backends": backends},
+    )
+
+
 @app.post("/model/upload", response_model=ModelResponse,summary="Upload Model",description="Upload a model file with its metadata")
 async def upload_model_file_and_metadata(
     metadata: str = Form(...),
     model_file: UploadFile = File(...),
-    registry: ModelRegistry = Depends(get_registry),
+    registry: AsyncModelRegistry = Depends(get_registry),
 ):
     """Upload a model file with its metadata"""
 
@@ -76,36 +146,252 @@ async def upload_model_file_and_metadata(
 
  
     try:
-        content = await model_file.read()
-        file_obj = io.BytesIO(content)
+        # The multipart parser spools large files to disk, so the underlying
+        # file is streamed to storage part by part instead of read into memory.
+        await model_file.seek(0)
 
-        return registry.register_model(model_file=file_obj, metadata=metadata_model.model_dump())
+        return await registry.register_model(
+            model_file=model_file.file, metadata=metadata_model.model_dump()
+        )
 
+    except DuplicateModelError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ResourceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    except RegistryError as e:
+        logger.error(f"Model registration failed: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.post("/model/upload/by-hash", response_model=ModelResponse, summary="Register Stored Model")
+async def register_model_by_hash(
+    request: RegisterByHashRequest,
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Register a model whose file content is already stored, 404 if it has to be uploaded"""
+    try:
+        return await registry.register_model_by_hash(
+            metadata=request.metadata.model_dump(), digest=request.sha256
+        )
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except DuplicateModelError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ResourceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except RegistryError as e:
         logger.error(f"Model registration failed: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
-@app.get("/model/metadata/{metadata_id}")
-async def get_model_medata(metadata_id:str,registry: ModelRegistry = Depends(get_registry)):
+@app.post(
+    "/model/upload-sessions",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_upload_session(
+    request: UploadSessionRequest,
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Start a chunked upload of a large model, registered once the session is completed"""
+    try:
+        session = await registry.create_upload_session(
+            metadata=request.metadata.model_dump(), digest=request.sha256
+        )
+        return UploadSessionResponse(**session)
+
+    except DuplicateModelError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to start upload session: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.get("/model/upload-sessions/{session_id}", response_model=UploadSessionStatus)
+async def get_upload_session(session_id: str, registry: AsyncModelRegistry = Depends(get_registry)):
+    """Parts stored so far, so interrupted uploads can resume"""
+    try:
+        return UploadSessionStatus(**await registry.get_upload_session(session_id))
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to retrieve upload session: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.put(
+    "/model/upload-sessions/{session_id}/parts/{part_number}", response_model=UploadPartResponse
+)
+async def upload_session_part(
+    request: Request,
+    session_id: str,
+    part_number: int = Path(..., ge=1, le=10000),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Store one part sent as the raw request body, parts may be sent concurrently and retried"""
+    # Parts are buffered in memory, so oversized bodies are rejected before being read completely
+    declared = request.headers.get("content-length")
+    if (
+        declared is not None
+        and declared.isdigit()
+        and int(declared) > settings.UPLOAD_PART_MAX_SIZE
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Part too large"
+        )
+    data = bytearray()
+    async for chunk in request.stream():
+        data += chunk
+        if len(data) > settings.UPLOAD_PART_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Part too large"
+            )
+    if not data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty part")
+
+    try:
+        return UploadPartResponse(
+            **await registry.upload_session_part(session_id, part_number, bytes(data))
+        )
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to upload part: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.get(
+    "/model/upload-sessions/{session_id}/parts/{part_number}/url",
+    response_model=UploadPartUrlResponse,
+)
+async def get_upload_part_url(
+    session_id: str,
+    part_number: int = Path(..., ge=1, le=10000),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Presigned URL uploading one part straight to storage, for ``direct_upload`` sessions"""
+    try:
+        return UploadPartUrlResponse(**await registry.presigned_part_url(session_id, part_number))
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to sign part upload: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+
+@app.post("/model/upload-sessions/{session_id}/complete", response_model=ModelResponse)
+async def complete_upload_session(
+    session_id: str,
+    request: Optional[UploadCompleteRequest] = None,
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Assemble the uploaded parts, verify the content and register the model"""
+    parts = [part.model_dump() for part in request.parts] if request else None
     try:
-        metadata = registry.get_metadata(metadata_id=metadata_id)
-        return GetMetadataModelResponse(
-            id=metadata["id"],
-            name=metadata["name"],
-            file_extension=metadata["file_extension"],
-            storage_group=metadata["storage_group"],
-            version=metadata["version"],
-            description=metadata.get("description"),
-            framework=metadata.get("framework"),
-            metrics=metadata.get("metrics", {}),
-            parameters=metadata.get("parameters", {}),
-            metadata_id=metadata["_id"],
-            storage_info=metadata["storage_info"],
-            storage_path=metadata["storage_path"],
-            registration_time=metadata["registration_time"],
+        return await registry.complete_upload_session(session_id, parts)
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DuplicateModelError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ResourceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
         )
+    except RegistryError as e:
+        logger.error(f"Failed to complete upload session: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.delete("/model/upload-sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload_session(
+    session_id: str, registry: AsyncModelRegistry = Depends(get_registry)
+):
+    """Abort a chunked upload and discard its parts"""
+    try:
+        await registry.abort_upload_session(session_id)
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to abort upload session: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.delete("/model/{metadata_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_model(metadata_id: str, registry: AsyncModelRegistry = Depends(get_registry)):
+    """Delete a model version, its file is removed once no other version shares it"""
+    try:
+        await registry.delete_model(metadata_id)
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to delete model: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+def _metadata_response(metadata: Dict[str, Any]) -> GetMetadataModelResponse:
+    """Build the API representation of a stored metadata document."""
+    return GetMetadataModelResponse(
+        id=metadata["id"],
+        name=metadata["name"],
+        file_extension=metadata["file_extension"],
+        storage_group=metadata["storage_group"],
+        version=metadata["version"],
+        description=metadata.get("description"),
+        framework=metadata.get("framework"),
+        metrics=metadata.get("metrics", {}),
+        parameters=metadata.get("parameters", {}),
+        metadata_id=metadata["_id"],
+        storage_info=metadata["storage_info"],
+        storage_path=metadata["storage_path"],
+        registration_time=metadata["registration_time"],
+        parent_version=metadata.get("parent_version"),
+    )
+
+
+@app.get("/model/metadata/{metadata_id}", response_model=GetMetadataModelResponse)
+async def get_model_medata(
+    metadata_id: str,
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Model metadata, cacheable by HTTP caches through ETag and Cache-Control"""
+    try:
+        metadata = await registry.get_metadata(metadata_id=metadata_id)
+        body = _metadata_response(metadata).model_dump_json()
+
+        headers = {
+            "ETag": f'"{hashlib.sha1(body.encode()).hexdigest()}"',
+            "Cache-Control": f"public, max-age={int(settings.METADATA_CACHE_TTL)}",
+        }
+        if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
     except ModelNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,32 +405,397 @@ async def get_model_medata(metadata_id:str,registry: ModelRegistry = Depends(get
         )
 
 
-@app.get("/model/file/{file_path}")
-async def get_model_file(
-    file_path: str,
-    bucket_name: str,
-    registry: ModelRegistry = Depends(get_registry),
+@app.post("/model/metadata:batch", response_model=MetadataBatchResponse)
+async def get_model_metadata_batch(
+    request: MetadataBatchRequest,
+    registry: AsyncModelRegistry = Depends(get_registry),
 ):
-    """Stream model file content"""
+    """Metadata of several models in one request, with per-ID errors"""
+    if len(request.ids) > settings.METADATA_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many metadata IDs: {len(request.ids)} > {settings.METADATA_BATCH_MAX_IDS}",
+        )
+
     try:
-    
-        file_obj = registry.get_model_file(file_path=file_path,bucket_name=bucket_name)
+        found, errors = await registry.get_metadata_many(request.ids)
+    except RegistryError as e:
+        logger.error(f"Failed to retrieve metadata batch: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    results = {}
+    for metadata_id, metadata in found.items():
+        try:
+            results[metadata_id] = _metadata_response(metadata)
+        except (KeyError, ValueError) as e:
+            errors[metadata_id] = f"Invalid metadata document: {str(e)}"
+    return MetadataBatchResponse(results=results, errors=errors)
+
+
+def _parse_tag_filters(tags: Optional[List[str]]) -> Dict[str, str]:
+    """Parse repeated ``key:value`` tag filters into a dictionary."""
+    parsed = {}
+    for tag in tags or []:
+        key, sep, value = tag.partition(":")
+        if not sep or not key or "." in key or key.startswith("$"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid tag filter, expected key:value: {tag}",
+            )
+        parsed[key] = value
+    return parsed
 
-        # Get file size
-        file_obj.seek(0, 2)
-        file_size = file_obj.tell()
-        file_obj.seek(0)
 
-        
+@app.get("/models", response_model=ModelListResponse)
+async def list_models(
+    name: Optional[str] = None,
+    version: Optional[str] = None,
+    framework: Optional[str] = None,
+    storage_group: Optional[str] = None,
+    tag: Optional[List[str]] = Query(
+        default=None, description="Tag filter as key:value, repeatable"
+    ),
+    registered_after: Optional[datetime] = None,
+    registered_before: Optional[datetime] = None,
+    sort: Literal["registration_time", "name", "version"] = "registration_time",
+    order: Literal["asc", "desc"] = "desc",
+    limit: int = Query(default=50, ge=1, le=settings.MODEL_LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """List and search registered models with cursor pagination"""
+    filters = {
+        "name": name,
+        "version": version,
+        "framework": framework,
+        "storage_group": storage_group,
+        "tags": _parse_tag_filters(tag),
+        "registered_after": registered_after,
+        "registered_before": registered_before,
+    }
+    try:
+        items, next_cursor = await registry.list_models(
+            filters, sort=sort, descending=order == "desc", limit=limit, cursor=cursor
+        )
+        return ModelListResponse(
+            items=[_metadata_response(item) for item in items], next_cursor=next_cursor
+        )
+
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to list models: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.get("/models/{name}/latest", response_model=GetMetadataModelResponse)
+async def get_latest_model(name: str, registry: AsyncModelRegistry = Depends(get_registry)):
+    """Metadata of the most recently registered version of a model"""
+    try:
+        return _metadata_response(await registry.get_latest_metadata(name))
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to retrieve latest model: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.get("/models/{name}/alias/{alias}", response_model=GetMetadataModelResponse)
+async def get_model_alias(
+    name: str, alias: str, registry: AsyncModelRegistry = Depends(get_registry)
+):
+    """Metadata of the model version an alias points to"""
+    try:
+        return _metadata_response(await registry.resolve_alias(name, alias))
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to resolve alias: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.put("/models/{name}/alias/{alias}", response_model=AliasResponse)
+async def set_model_alias(
+    name: str,
+    alias: str,
+    request: AliasRequest,
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Create an alias or move it to another version of the model"""
+    try:
+        await registry.set_alias(name, alias, request.metadata_id)
+        return AliasResponse(name=name, alias=alias, metadata_id=request.metadata_id)
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to set alias: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.delete("/models/{name}/alias/{alias}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_model_alias(
+    name: str, alias: str, registry: AsyncModelRegistry = Depends(get_registry)
+):
+    """Remove an alias of a model"""
+    try:
+        await registry.delete_alias(name, alias)
+
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RegistryError as e:
+        logger.error(f"Failed to delete alias: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@app.get("/model/metadata-cache/stats", response_model=Dict[str, Any])
+async def get_metadata_cache_stats(registry: AsyncModelRegistry = Depends(get_registry)):
+    """Size, hit/miss counters and hit ratio of the metadata read cache"""
+    return registry.metadata_cache_stats()
+
+
+@app.get("/model/file-cache/stats", response_model=Dict[str, Any])
+async def get_file_cache_stats(registry: AsyncModelRegistry = Depends(get_registry)):
+    """Number and size of model files held in the disk cache"""
+    return registry.file_cache_stats()
+
+
+@app.get("/events")
+async def stream_events(
+    name: Optional[str] = None,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """
+    Stream registrations, deletions and alias changes as server-sent events.
+
+    Every event carries an ``id``, reconnecting with it as ``Last-Event-ID``
+    replays the events missed meanwhile. A ``reset`` event tells the client
+    they are no longer available and the models it follows must be re-read.
+    ``name`` restricts the stream to one model.
+    """
+
+    async def stream() -> AsyncIterator[bytes]:
+        # Browsers and ModelRegistryClient.watch reconnect after one second
+        yield b"retry: 1000\n\n"
+        async for event in registry.watch_events(last_event_id, settings.EVENTS_HEARTBEAT):
+            if (
+                event is None
+                or event["type"] == RESET
+                or name is None
+                or event["data"]["name"] == name
+            ):
+                yield format_event(event)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/events/stats", response_model=Dict[str, Any])
+async def get_event_stats(registry: AsyncModelRegistry = Depends(get_registry)):
+    """Latest event ID, buffered events and connected subscribers of the event stream"""
+    return registry.event_stats()
+
+
+def _byterange_part_header(boundary: str, start: int, end: int, size: int) -> bytes:
+    """Build the header block of one part in a multipart/byteranges body."""
+    return (
+        f"--{boundary}\r\n"
+        f"Content-Type: application/octet-stream\r\n"
+        f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+    ).encode()
+
+
+async def _stream_byteranges(
+    registry: AsyncModelRegistry,
+    file_path: str,
+    bucket_name: str,
+    ranges: List[Tuple[int, int]],
+    size: int,
+    boundary: str,
+    codec: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Stream a multipart/byteranges body, reading each range from storage."""
+    for start, end in ranges:
+        yield _byterange_part_header(boundary, start, end, size)
+        stream = await registry.stream_model_file(
+            file_path=file_path,
+            bucket_name=bucket_name,
+            chunk_size=settings.DOWNLOAD_CHUNK_SIZE,
+            offset=start,
+            length=end - start + 1,
+            codec=codec,
+        )
+        async for chunk in stream:
+            yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+async def _file_response(
+    registry: AsyncModelRegistry,
+    file_path: str,
+    bucket_name: str,
+    range_header: Optional[str],
+    if_range: Optional[str],
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Build the response streaming a model file, honoring single and multi-range requests.
+
+    Compressed files are sent as stored with ``Content-Encoding`` to clients
+    accepting their codec, and decompressed for everyone else. The two
+    representations have different ETags. Ranges of compressed files are
+    not served, since reaching an offset means decompressing everything
+    before it, so their ``Range`` headers are ignored. Delta versions are
+    reconstructed and ranges refer to the full content; the same holds for
+    versions too large for the reconstruction cache, which would be rebuilt
+    for every range.
+    ``extra_headers`` are sent with every response, including 304 and 206.
+
+    With ``PRESIGNED_URLS``, requests storage can answer as well are
+    redirected to it with ``307 Temporary Redirect``: plain files with at
+    most one range, and compressed files for clients accepting their codec.
+    """
+    file_info = await registry.get_model_file_info(file_path=file_path, bucket_name=bucket_name)
+    size = file_info["size"]
+    codec = file_info.get("codec")
+    encoded = codec == ZSTD and accepts_encoding(accept_encoding, codec)
+    ranged = registry.serves_ranges(file_info)
+    # The stored ETag belongs to the stored bytes, decompressed content is another representation
+    etag = (
+        f'"{file_info["etag"]}-identity"'
+        if codec == ZSTD and not encoded
+        else f'"{file_info["etag"]}"'
+    )
+    headers = {
+        "Content-Disposition": f'attachment; filename="{file_path}"',
+        "Accept-Ranges": "bytes" if ranged else "none",
+        "ETag": etag,
+        **(extra_headers or {}),
+    }
+    if codec:
+        headers["Vary"] = "Accept-Encoding"
+
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if settings.PRESIGNED_URLS:
+        direct_headers = None
+        if codec is None and (not range_header or "," not in range_header):
+            direct_headers = {"Content-Disposition": headers["Content-Disposition"]}
+        elif encoded:
+            direct_headers = {
+                "Content-Disposition": headers["Content-Disposition"],
+                "Content-Encoding": codec,
+            }
+        url = direct_headers and await registry.presigned_download_url(
+            file_path, bucket_name, direct_headers
+        )
+        if url:
+            # The URL expires, so the redirect itself must not be cached
+            return RedirectResponse(
+                url,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={**headers, "Cache-Control": "no-store"},
+            )
+
+    if encoded:
+        stream = await registry.stream_model_file(
+            file_path=file_path, bucket_name=bucket_name, chunk_size=settings.DOWNLOAD_CHUNK_SIZE
+        )
         return StreamingResponse(
-            file_obj,
+            stream,
             media_type="application/octet-stream",
             headers={
-                "Content-Disposition": f'attachment; filename="{file_path}"',
-                "Content-Length": str(file_size),
+                **headers,
+                "Content-Encoding": codec,
+                "Content-Length": str(file_info["stored_size"]),
             },
         )
-    
+
+    # A stale If-Range validator means the client must get the full file
+    ranges = None
+    if range_header and ranged and (if_range is None or if_range.strip() == etag):
+        try:
+            ranges = parse_range_header(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"},
+            )
+
+    if not ranges:
+        stream = await registry.stream_model_file(
+            file_path=file_path,
+            bucket_name=bucket_name,
+            chunk_size=settings.DOWNLOAD_CHUNK_SIZE,
+            codec=codec,
+        )
+        return StreamingResponse(
+            stream,
+            media_type="application/octet-stream",
+            headers={**headers, "Content-Length": str(size)},
+        )
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        stream = await registry.stream_model_file(
+            file_path=file_path,
+            bucket_name=bucket_name,
+            chunk_size=settings.DOWNLOAD_CHUNK_SIZE,
+            offset=start,
+            length=end - start + 1,
+            codec=codec,
+        )
+        return StreamingResponse(
+            stream,
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type="application/octet-stream",
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            },
+        )
+
+    boundary = secrets.token_hex(16)
+    content_length = len(f"--{boundary}--\r\n") + sum(
+        len(_byterange_part_header(boundary, start, end, size)) + (end - start + 1) + 2
+        for start, end in ranges
+    )
+    return StreamingResponse(
+        _stream_byteranges(registry, file_path, bucket_name, ranges, size, boundary, codec),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers={**headers, "Content-Length": str(content_length)},
+    )
+
+
+@app.get("/model/file/{file_path}")
+async def get_model_file(
+    file_path: str,
+    bucket_name: str,
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+    if_range: Optional[str] = Header(default=None, alias="If-Range"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    accept_encoding: Optional[str] = Header(default=None, alias="Accept-Encoding"),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """Stream model file content, see ``_file_response``"""
+    try:
+        return await _file_response(
+            registry, file_path, bucket_name, range_header, if_range, if_none_match, accept_encoding
+        )
 
     except RegistryError as e:
         logger.error(f"Failed to retrieve file: {str(e)}")
@@ -158,3 +809,55 @@ async def get_model_file(
         )
 
 
+@app.get("/model/{metadata_id}/bundle")
+async def get_model_bundle(
+    metadata_id: str,
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+    if_range: Optional[str] = Header(default=None, alias="If-Range"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    accept_encoding: Optional[str] = Header(default=None, alias="Accept-Encoding"),
+    registry: AsyncModelRegistry = Depends(get_registry),
+):
+    """
+    Stream a model file together with its metadata in one round trip.
+
+    The metadata is sent base64 encoded in the ``X-Model-Metadata`` header of
+    every response, including 304 and 206, and left out if it is too large
+    for a header. The file is always the model's own ``storage_path`` in its
+    storage group, as recorded in the metadata, and is served like
+    ``GET /model/file/{file_path}``.
+    """
+    try:
+        metadata = await registry.get_metadata(metadata_id=metadata_id)
+    except ModelNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Model metadata not found: {metadata_id}"
+        )
+    except RegistryError as e:
+        logger.error(f"Failed to retrieve metadata: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    encoded = encode_metadata_header(_metadata_response(metadata).model_dump_json())
+    extra_headers = {METADATA_HEADER: encoded} if len(encoded) <= METADATA_HEADER_MAX_SIZE else {}
+    try:
+        return await _file_response(
+            registry,
+            metadata["storage_path"],
+            metadata["storage_group"],
+            range_header,
+            if_range,
+            if_none_match,
+            accept_encoding,
+            extra_headers,
+        )
+
+    except RegistryError as e:
+        logger.error(f"Failed to retrieve file: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    except Exception as e:
+        logger.error(f"Unexpected error retrieving file: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve file",
+        )
@@ -12,29 +12,60 @@ multipart/form-data for file uploads along with JSON metadata.
 
 
 from typing import Optional, Dict
+from contextlib import asynccontextmanager
 import io
 import json
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Depends, Form, File, UploadFile, status
-from fastapi.responses import StreamingResponse, JSONResponse,FileResponse
+from fastapi.responses import StreamingResponse, JSONResponse,FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from .logger import logger
 from .api.routes.models import app as api
 from .version import __version__
+from .metrics import MetricsMiddleware
+from .admission import AdmissionController, AdmissionMiddleware
+from .core.config import settings
+from .core.dependencies import registry_container
 
 BASE_DIR = Path(__file__).resolve().parent
 logger.info(f"{__version__}")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the registry and its backends before serving, close its pools on shutdown."""
+    try:
+        await registry_container.initialize()
+    except Exception:
+        # Serve anyway, /health/ready reports unavailable until a request manages to initialize
+        logger.error("Registry not ready at startup, initialization is retried on request")
+    yield
+    await registry_container.close()
+
+
+async def upload_session_size(path: str, body: bytes) -> Optional[int]:
+    """Return the size of the upload session a request completes, see ``AdmissionMiddleware``."""
+    registry = await registry_container.get_registry()
+    session = await registry.get_upload_session(path.split("/")[-2])
+    sizes = {part["part_number"]: part["size"] for part in session["parts"]}
+    # Parts uploaded directly to storage are only listed in the request
+    for part in (json.loads(body) if body else {}).get("parts", []):
+        sizes[part["part_number"]] = part["size"]
+    return sum(sizes.values())
+
+
 app = FastAPI(
     title="Model Registry API",
     description="REST API for managing ML models and their metadata",
     version= __version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -44,9 +75,26 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Inside the metrics middleware, so rejected uploads are counted as 429 responses
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=AdmissionController(
+        max_uploads=settings.UPLOAD_MAX_CONCURRENCY,
+        max_bytes=settings.UPLOAD_MAX_INFLIGHT_BYTES,
+        max_queue=settings.UPLOAD_QUEUE_SIZE,
+        queue_timeout=settings.UPLOAD_QUEUE_TIMEOUT,
+    ),
+    described_size=upload_session_size,
+)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(api,prefix="")
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Expose request, transfer and storage metrics in the Prometheus text format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @app.get("/")
 async def root():
     return FileResponse(str(BASE_DIR / "static" / "index.html"))
@@ -0,0 +1,519 @@
+from typing import Optional, Dict, Any, Tuple, BinaryIO, Union, Iterable, List, Awaitable, Callable
+from pathlib import Path
+import asyncio
+import io
+import json
+import os
+
+import anyio
+import httpx
+
+from .schemas import ModelMetadata, ModelInfo
+from .client import (
+    RegistryClientError,
+    RegistryConnectionError,
+    ModelUploadError,
+    MetadataDownloadError,
+    ModelFileDownloadError,
+)
+from .logger import logger
+from .util import METADATA_HEADER, decode_metadata_header, stream_sha256
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class AsyncModelRegistryClient:
+    """
+    Asyncio client for interacting with the Model Registry API.
+
+    Mirrors ``ModelRegistryClient`` on top of a pooled ``httpx.AsyncClient`` and
+    adds bulk helpers that fetch or upload many models with bounded concurrency.
+
+    Parameters
+    ----------
+    base_url : str
+        The base URL of the registry service.
+    timeout : int, optional
+        Request timeout in seconds. Default is 30.
+    max_retries : int, optional
+        Maximum number of retry attempts for failed requests. Default is 3.
+    max_connections : int, optional
+        Maximum number of pooled HTTP connections. Default is 20.
+    max_concurrency : int, optional
+        Maximum number of models transferred at once by ``get_many`` and
+        ``upload_many``. Default is 8.
+
+    Attributes
+    ----------
+    base_url : str
+        The base URL of the registry service.
+    timeout : int
+        Request timeout in seconds.
+    max_retries : int
+        Maximum number of retry attempts for failed requests.
+    max_concurrency : int
+        Maximum number of concurrent transfers in bulk operations.
+    http : httpx.AsyncClient
+        Pooled HTTP client used for making requests.
+
+    Raises
+    ------
+    ValueError
+        If base_url is empty, timeout, max_connections or max_concurrency is not
+        positive, or max_retries is negative.
+
+    Notes
+    -----
+    Failed requests are retried like ``ModelRegistryClient`` does: on connection
+    errors and 500/502/503/504 responses, with exponential backoff (factor 1).
+
+    Examples
+    --------
+    >>> async with AsyncModelRegistryClient("http://registry-service.com") as client:
+    ...     models = await client.get_many([("a.pkl", "id-a"), ("b.pkl", "id-b")])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_connections: int = 20,
+        max_concurrency: int = 8,
+    ):
+        if not base_url:
+            raise ValueError("base_url cannot be empty")
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        if max_connections <= 0:
+            raise ValueError("max_connections must be positive")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            # Registries serving presigned URLs redirect downloads to their object storage
+            follow_redirects=True,
+        )
+
+        logger.info(f"Initialized async registry client with base URL: {base_url}")
+
+    async def __aenter__(self) -> "AsyncModelRegistryClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.http.aclose()
+
+    async def _retry(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``send`` with the retry policy of ``ModelRegistryClient``.
+
+        ``send`` must perform one complete attempt and raise ``httpx.HTTPStatusError``
+        for error responses. Connection errors and retryable status codes are
+        retried with exponential backoff; the first retry is immediate. A
+        ``Retry-After`` header (sent with 429 and 503) extends the backoff.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await send()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if (
+                    isinstance(e, httpx.HTTPStatusError)
+                    and e.response.status_code not in RETRY_STATUS_CODES
+                ):
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                backoff = 0 if attempt == 1 else 2 ** (attempt - 1)
+                retry_after = (
+                    e.response.headers.get("Retry-After", "")
+                    if isinstance(e, httpx.HTTPStatusError)
+                    else ""
+                )
+                if retry_after.isdigit():
+                    backoff = max(backoff, int(retry_after))
+                logger.warning(
+                    f"Request failed, retrying in {backoff}s ({attempt}/{self.max_retries}): {e}"
+                )
+                await asyncio.sleep(backoff)
+
+    async def _get_json(self, path: str) -> Any:
+        """GET ``path`` with retries and return the decoded JSON body."""
+
+        async def send():
+            response = await self.http.get(path)
+            response.raise_for_status()
+            return response.json()
+
+        return await self._retry(send)
+
+    async def health_check(self) -> bool:
+        """
+        Check if the registry service is healthy.
+
+        Returns
+        -------
+        bool
+            True if service is healthy, False otherwise.
+
+        Raises
+        ------
+        RegistryConnectionError
+            If connection to registry fails.
+        """
+        try:
+            is_healthy = (await self._get_json("/health"))["status"] == "healthy"
+            logger.info(f"Health check status: {'healthy' if is_healthy else 'unhealthy'}")
+            return is_healthy
+        except httpx.HTTPError as e:
+            logger.error(f"Health check failed: {str(e)}")
+            raise RegistryConnectionError(f"Failed to connect to registry: {str(e)}")
+
+    async def upload_model(
+        self,
+        model_buffer: Union[BinaryIO, bytes, io.BytesIO],
+        metadata: ModelMetadata,
+        filename: Optional[str] = None,
+    ) -> ModelInfo:
+        """
+        Upload a model to the registry.
+
+        Parameters
+        ----------
+        model_buffer : Union[BinaryIO, bytes, io.BytesIO]
+            Buffer or seekable file containing the model data. File objects are
+            streamed in chunks rather than read into memory, and not sent at all
+            if the registry already stores the same content.
+        metadata : ModelMetadata
+            Metadata associated with the model.
+        filename : str, optional
+            Name for the uploaded file. If not provided, generated from metadata.
+
+        Returns
+        -------
+        ModelInfo
+            Information about the uploaded model including its location and metadata.
+
+        Raises
+        ------
+        ModelUploadError
+            If the upload operation fails.
+        """
+        if not filename:
+            filename = f"{metadata.name}.{metadata.file_extension}"
+        if isinstance(model_buffer, bytes):
+            model_buffer = io.BytesIO(model_buffer)
+        model_buffer.seek(0)
+        digest = stream_sha256(model_buffer)
+
+        async def register_by_hash():
+            # Content the registry already stores is registered without sending it
+            response = await self.http.post(
+                "/model/upload/by-hash",
+                json={"metadata": json.loads(metadata.model_dump_json()), "sha256": digest},
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+
+        async def send():
+            # Rewind so retries resend the whole file
+            model_buffer.seek(0)
+            response = await self.http.post(
+                "/model/upload",
+                files={"model_file": (filename, model_buffer, "application/octet-stream")},
+                data={"metadata": metadata.model_dump_json()},
+            )
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            result = await self._retry(register_by_hash)
+            if result is None:
+                logger.info(f"Uploading model: {filename}")
+                result = await self._retry(send)
+            logger.info(f"Successfully uploaded model: {filename}")
+            return ModelInfo(
+                name=result["name"],
+                version=result["version"],
+                metadata_id=result["metadata_id"],
+                file_path=result["storage_path"],
+                storage_group=result["storage_group"],
+                registration_time=result["created_at"],
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to upload model: {str(e)}")
+            raise ModelUploadError(f"Failed to upload model: {str(e)}")
+
+    async def get_metadata(self, metadata_id: str) -> Dict[str, Any]:
+        """
+        Retrieve metadata for a model.
+
+        Parameters
+        ----------
+        metadata_id : str
+            Unique identifier for the model metadata.
+
+        Returns
+        -------
+        dict
+            Dictionary containing model metadata.
+
+        Raises
+        ------
+        MetadataDownloadError
+            If metadata retrieval fails.
+        """
+        try:
+            logger.info(f"Retrieving metadata: {metadata_id}")
+            return await self._get_json(f"/model/metadata/{metadata_id}")
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to get model metadata: {str(e)}")
+            raise MetadataDownloadError(f"Failed to get model metadata: {str(e)}")
+
+    async def _download(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        dest: Optional[Union[str, os.PathLike]],
+        response_headers: Optional[httpx.Headers] = None,
+    ) -> Union[io.BytesIO, Path]:
+        """Stream a response body into ``dest`` or a buffer, copying its headers if requested."""
+        async with self.http.stream("GET", path, params=params) as response:
+            response.raise_for_status()
+            if response_headers is not None:
+                for hop in (*response.history, response):
+                    response_headers.update(hop.headers)
+            if dest is None:
+                buffer = io.BytesIO()
+                async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                    buffer.write(chunk)
+                buffer.seek(0)
+                return buffer
+            # File writes run on worker threads, slow disks must not stall the event loop
+            async with await anyio.open_file(dest, "wb") as out:
+                async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                    await out.write(chunk)
+            return Path(dest)
+
+    async def get_model_file(
+        self, file_path: str, bucket_name: str, dest: Optional[Union[str, os.PathLike]] = None
+    ) -> Union[io.BytesIO, Path]:
+        """
+        Download a model file from storage.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage.
+        bucket_name : str
+            Name of the storage bucket containing the model.
+        dest : str or os.PathLike, optional
+            Local path to stream the file to instead of an in-memory buffer.
+
+        Returns
+        -------
+        io.BytesIO or pathlib.Path
+            Buffer containing the file, or the path it was written to if ``dest`` is given.
+
+        Raises
+        ------
+        ModelFileDownloadError
+            If file download fails.
+        """
+        params = {"bucket_name": bucket_name}
+        try:
+            logger.info(f"Retrieving model file: {file_path}")
+            return await self._retry(
+                lambda: self._download(f"/model/file/{file_path}", params, dest)
+            )
+        except (httpx.HTTPError, OSError) as e:
+            logger.error(f"Failed to retrieve model file: {str(e)}")
+            raise ModelFileDownloadError(f"Failed to retrieve model file: {str(e)}")
+
+    async def _get_bundle(
+        self,
+        file_path: str,
+        metadata_id: str,
+        bucket_name: Optional[str],
+        dest: Optional[Union[str, os.PathLike]],
+    ) -> Optional[Tuple[Union[io.BytesIO, Path], Dict[str, Any]]]:
+        """Download a model file and its metadata with one request, see ``ModelRegistryClient``."""
+        headers = httpx.Headers()
+        try:
+            logger.info(f"Retrieving model bundle: {metadata_id}")
+            model_file = await self._retry(
+                lambda: self._download(
+                    f"/model/{metadata_id}/bundle", {}, dest, response_headers=headers
+                )
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            logger.error(f"Failed to retrieve model bundle: {str(e)}")
+            raise ModelFileDownloadError(f"Failed to retrieve model bundle: {str(e)}")
+        except (httpx.HTTPError, OSError) as e:
+            logger.error(f"Failed to retrieve model bundle: {str(e)}")
+            raise ModelFileDownloadError(f"Failed to retrieve model bundle: {str(e)}")
+
+        encoded = headers.get(METADATA_HEADER)
+        metadata = (
+            decode_metadata_header(encoded)
+            if encoded
+            else await self.get_metadata(metadata_id=metadata_id)
+        )
+        if file_path != metadata.get("storage_path") or bucket_name not in (
+            None,
+            metadata.get("storage_group"),
+        ):
+            logger.warning(
+                f"Model {metadata_id} is not stored at {file_path}, fetching the file separately"
+            )
+            if not isinstance(model_file, Path):
+                model_file.close()
+            return None
+        return model_file, metadata
+
+    async def get_model(
+        self,
+        file_path: str,
+        metadata_id: str,
+        bucket_name: Optional[str] = None,
+        dest: Optional[Union[str, os.PathLike]] = None,
+        bundle: bool = True,
+    ) -> Tuple[Union[io.BytesIO, Path], Dict[str, Any]]:
+        """
+        Retrieve a model and its metadata from the registry.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage.
+        metadata_id : str
+            Unique identifier for the model metadata.
+        bucket_name : str, optional
+            Storage bucket name. If not provided, extracted from metadata.
+        dest : str or os.PathLike, optional
+            Local path to stream the model file to.
+        bundle : bool, optional
+            Fetch the file and its metadata with a single request, see
+            ``ModelRegistryClient.get_model``. Default is True.
+
+        Returns
+        -------
+        tuple
+            The model file (buffer or path) and the model metadata dictionary.
+
+        Raises
+        ------
+        RegistryClientError
+            If model retrieval fails.
+        MetadataDownloadError
+            If metadata retrieval fails.
+        ModelFileDownloadError
+            If file download fails.
+        """
+        if bundle:
+            result = await self._get_bundle(file_path, metadata_id, bucket_name, dest)
+            if result is not None:
+                logger.info(f"Successfully retrieved model: {file_path}")
+                return result
+
+        metadata = await self.get_metadata(metadata_id=metadata_id)
+
+        bucket_name = bucket_name or metadata.get("storage_group")
+        if not bucket_name:
+            raise RegistryClientError("No bucket name provided and no storage group in metadata")
+
+        buffer = await self.get_model_file(file_path=file_path, bucket_name=bucket_name, dest=dest)
+        logger.info(f"Successfully retrieved model: {file_path}")
+        return buffer, metadata
+
+    async def _bounded(self, calls: List[Callable[[], Awaitable[Any]]]) -> List[Any]:
+        """Run ``calls`` with at most ``max_concurrency`` in flight, preserving order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(call):
+            async with semaphore:
+                return await call()
+
+        return await asyncio.gather(*(run(call) for call in calls))
+
+    async def get_many(
+        self, models: Iterable[Tuple[str, str]], dest_dir: Optional[Union[str, os.PathLike]] = None
+    ) -> List[Tuple[Union[io.BytesIO, Path], Dict[str, Any]]]:
+        """
+        Retrieve several models and their metadata concurrently.
+
+        Parameters
+        ----------
+        models : iterable of (file_path, metadata_id)
+            Models to retrieve.
+        dest_dir : str or os.PathLike, optional
+            Directory to stream the model files into instead of memory.
+
+        Returns
+        -------
+        list
+            ``(file, metadata)`` tuples in the same order as ``models``.
+
+        Raises
+        ------
+        RegistryClientError
+            If any model cannot be retrieved.
+        """
+        calls = [
+            lambda file_path=file_path, metadata_id=metadata_id: self.get_model(
+                file_path,
+                metadata_id,
+                dest=Path(dest_dir) / file_path if dest_dir is not None else None,
+            )
+            for file_path, metadata_id in models
+        ]
+        return await self._bounded(calls)
+
+    async def upload_many(
+        self, models: Iterable[Tuple[Union[BinaryIO, bytes], ModelMetadata]]
+    ) -> List[ModelInfo]:
+        """
+        Upload several models concurrently.
+
+        Parameters
+        ----------
+        models : iterable of (model_buffer, metadata)
+            Models to upload, see ``upload_model``.
+
+        Returns
+        -------
+        list of ModelInfo
+            Upload results in the same order as ``models``.
+
+        Raises
+        ------
+        ModelUploadError
+            If any upload fails.
+        """
+        calls = [
+            lambda model_buffer=model_buffer, metadata=metadata: self.upload_model(
+                model_buffer, metadata
+            )
+            for model_buffer, metadata in models
+        ]
+        return await self._bounded(calls)
@@ -0,0 +1,179 @@
+"""
+Local on-disk cache for model files downloaded by the registry client.
+
+Entries are content addressed by the storage ETag of the model file, so a
+cached file never has to be invalidated: a new model version has a new ETag.
+The cache is bounded in size and evicts the least recently used entries.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+import json
+import os
+import re
+import tempfile
+import threading
+
+from .logger import logger
+
+
+class ModelCache:
+    """
+    Size-bounded, content-addressed LRU cache of model files on local disk.
+
+    Files are stored under ``<directory>/objects/<etag>``. Recency is tracked
+    through file modification times so it survives process restarts, and all
+    writes go through a temporary file followed by an atomic rename.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        Root directory of the cache. Created if it does not exist.
+    max_bytes : int, optional
+        Maximum total size of cached files in bytes. Default is 10 GiB.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that required downloading the file.
+
+    Raises
+    ------
+    ValueError
+        If max_bytes is not positive.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_bytes: int = 10 * 1024**3):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.objects_dir = self.directory / "objects"
+        self.tmp_dir = self.directory / "tmp"
+        self.index_path = self.directory / "index.json"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    @staticmethod
+    def _key(etag: str) -> str:
+        """Turn an ETag header value into a safe file name."""
+        return re.sub(r"[^A-Za-z0-9_-]", "", etag.replace("W/", ""))
+
+    def _load_index(self) -> Dict[str, str]:
+        """Load the file path to ETag index, ignoring a missing or corrupt file."""
+        try:
+            return json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, etag: str) -> Optional[Path]:
+        """
+        Return the cached file for ``etag`` and mark it as recently used.
+
+        Parameters
+        ----------
+        etag : str
+            ETag of the model file.
+
+        Returns
+        -------
+        Optional[Path]
+            Path of the cached file, or None if it is not cached.
+        """
+        path = self.objects_dir / self._key(etag)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def etag_for(self, file_key: str) -> Optional[str]:
+        """Return the last known ETag of the file identified by ``file_key``."""
+        return self._index.get(file_key)
+
+    def temp_file(self):
+        """Open a temporary file in the cache directory to download into."""
+        return tempfile.NamedTemporaryFile(dir=self.tmp_dir, delete=False)
+
+    def put(self, file_key: str, etag: str, tmp_path: Union[str, os.PathLike]) -> Path:
+        """
+        Atomically move a downloaded file into the cache.
+
+        Parameters
+        ----------
+        file_key : str
+            Identifier of the remote file, e.g. ``"bucket/path"``.
+        etag : str
+            ETag of the downloaded content.
+        tmp_path : str or os.PathLike
+            Temporary file created with ``temp_file``.
+
+        Returns
+        -------
+        Path
+            Path of the cached file.
+        """
+        path = self.objects_dir / self._key(etag)
+        os.replace(tmp_path, path)
+        self.remember(file_key, etag)
+        self._evict(keep=path)
+        return path
+
+    def remember(self, file_key: str, etag: str) -> None:
+        """Record ``etag`` as the current version of ``file_key``."""
+        with self._lock:
+            if self._index.get(file_key) == etag:
+                return
+            self._index[file_key] = etag
+            with tempfile.NamedTemporaryFile("w", dir=self.tmp_dir, delete=False) as f:
+                json.dump(self._index, f)
+            os.replace(f.name, self.index_path)
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Remove least recently used files until the cache fits in ``max_bytes``."""
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.objects_dir):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                    logger.info(f"Evicted cached model file: {path.name}")
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache counters and usage.
+
+        Returns
+        -------
+        Dict[str, int]
+            Hits, misses, number of entries and total size in bytes.
+        """
+        sizes = [entry.stat().st_size for entry in os.scandir(self.objects_dir)]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+        }
@@ -1,11 +1,25 @@
-from typing import Optional, Dict, Any, Tuple, BinaryIO, Union
+from typing import Optional, Dict, Any, Iterator, List, Tuple, BinaryIO, Union
 from urllib3.util.retry import Retry
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from pathlib import Path
+from datetime import datetime
+from urllib.parse import quote
 import requests
+import tempfile
+import time
+import shutil
 import json
+import mmap
 import io
+import os
 
-from .schemas import ModelMetadata, ModelInfo
+from .schemas import ModelMetadata, ModelInfo, TransferStats
+from .transfer import TransferManager, TransferError, file_sha256
+from .cache import ModelCache
+from .util import METADATA_HEADER, TTLCache, decode_metadata_header, stream_sha256
+from .codec import ZSTD, decompress_chunks
 from .logger import logger
 
 
@@ -94,6 +108,18 @@ class ModelRegistryClient:
         Request timeout in seconds. Default is 30.
     max_retries : int, optional
         Maximum number of retry attempts for failed requests. Default is 3.
+        Also bounds how many times an interrupted download is resumed.
+    transfer_concurrency : int, optional
+        Number of parallel range requests used by ``download_model_file``. Default is 8.
+    transfer_part_size : int, optional
+        Size in bytes of each range request used by ``download_model_file``. Default is 16 MiB.
+    cache_dir : str or os.PathLike, optional
+        Directory of a local model file cache. Caching is disabled if not given.
+    cache_max_bytes : int, optional
+        Maximum size of the local cache in bytes. Default is 10 GiB.
+    resolve_ttl : float, optional
+        Seconds ``resolve`` reuses a resolved alias or latest version. Default is 5,
+        0 disables caching.
 
     Attributes
     ----------
@@ -101,8 +127,14 @@ class ModelRegistryClient:
         The base URL of the registry service.
     timeout : int
         Request timeout in seconds.
+    max_retries : int
+        Maximum number of retry attempts for failed requests.
     session : requests.Session
         HTTP session used for making requests.
+    transfer_manager : TransferManager
+        Parallel ranged downloader sharing the session's connection pool.
+    cache : ModelCache or None
+        Local content-addressed model file cache, if enabled.
 
     Raises
     ------
@@ -121,7 +153,17 @@ class ModelRegistryClient:
     >>> print(f"Service health status: {is_healthy}")
     """
 
-    def __init__(self, base_url: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        transfer_concurrency: int = 8,
+        transfer_part_size: int = 16 * 1024 * 1024,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        cache_max_bytes: int = 10 * 1024**3,
+        resolve_ttl: float = 5.0,
+    ):
         if not base_url:
             raise ValueError("base_url cannot be empty")
         if timeout <= 0:
@@ -131,15 +173,33 @@ class ModelRegistryClient:
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
         self.session = requests.Session()
 
+        # Retries of 429 and 503 responses wait for the server's Retry-After
         retry_strategy = Retry(
-            total=max_retries, backoff_factor=1, status_forcelist=[500, 502, 503, 504], allowed_methods=["GET", "POST"]
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        )
+        # Size the pool so parallel part requests can reuse connections
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy, pool_maxsize=max(10, transfer_concurrency)
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        self.transfer_manager = TransferManager(
+            self.session,
+            timeout=timeout,
+            max_concurrency=transfer_concurrency,
+            part_size=transfer_part_size,
+            max_retries=max_retries,
+        )
+        self.cache = ModelCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None
+        self._resolved = TTLCache(max_size=1024, ttl=resolve_ttl) if resolve_ttl > 0 else None
+
         logger.info(f"Initialized registry client with base URL: {base_url}")
 
     def health_check(self) -> bool:
@@ -175,6 +235,21 @@ class ModelRegistryClient:
             logger.error(f"Health check failed: {str(e)}")
             raise RegistryConnectionError(f"Failed to connect to registry: {str(e)}")
 
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Counters and usage of the local model cache.
+
+        Returns
+        -------
+        dict
+            Cache ``hits``, ``misses``, number of ``entries`` and total ``bytes``.
+            Empty if caching is disabled.
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
+
     def upload_model(
         self, model_buffer: Union[BinaryIO, bytes, io.BytesIO], metadata: ModelMetadata, filename: Optional[str] = None
     ) -> ModelInfo:
@@ -202,7 +277,9 @@ class ModelRegistryClient:
 
         Notes
         -----
-        The model buffer will be reset to position 0 before upload if it supports seeking.
+        The model buffer is hashed first and reset to position 0. If the
+        registry already stores a file with the same SHA-256, the model is
+        registered by reference and the file is not sent again.
 
         Examples
         --------
@@ -213,10 +290,18 @@ class ModelRegistryClient:
         """
 
         try:
+            if isinstance(model_buffer, bytes):
+                model_buffer = io.BytesIO(model_buffer)
             model_buffer.seek(0)
             if not filename:
                 filename = f"{metadata.name}.{metadata.file_extension}"
 
+            digest = stream_sha256(model_buffer)
+            result = self._register_by_hash(metadata, digest)
+            if result is not None:
+                logger.info(f"Registered model without upload, content already stored: {filename}")
+                return self._model_info(result)
+
             files = {"model_file": (filename, model_buffer, "application/octet-stream")}
             data = {"metadata": metadata.model_dump_json()}
 
@@ -226,19 +311,171 @@ class ModelRegistryClient:
 
             result = response.json()
             logger.info(f"Successfully uploaded model: {filename}")
-            return ModelInfo(
-                name=result["name"],
-                version=result["version"],
-                metadata_id=result["metadata_id"],
-                file_path=result["storage_path"],
-                storage_group=result["storage_group"],
-                registration_time=result["created_at"],
-            )
+            return self._model_info(result)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to upload model: {str(e)}")
             raise ModelUploadError(f"Failed to upload model: {str(e)}")
 
+    def _register_by_hash(self, metadata: ModelMetadata, digest: str) -> Optional[Dict[str, Any]]:
+        """Register a model by content digest, returning None if the content must be uploaded."""
+        response = self.session.post(
+            f"{self.base_url}/model/upload/by-hash",
+            json={"metadata": json.loads(metadata.model_dump_json()), "sha256": digest},
+            timeout=self.timeout,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _model_info(result: Dict[str, Any]) -> ModelInfo:
+        """Build a ModelInfo from a registration response."""
+        return ModelInfo(
+            name=result["name"],
+            version=result["version"],
+            metadata_id=result["metadata_id"],
+            file_path=result["storage_path"],
+            storage_group=result["storage_group"],
+            registration_time=result["created_at"],
+        )
+
+    def upload_model_file(
+        self,
+        path: Union[str, os.PathLike],
+        metadata: ModelMetadata,
+        part_size: int = 64 * 1024 * 1024,
+    ) -> ModelInfo:
+        """
+        Upload a large model file in parallel parts through an upload session.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the model file.
+        metadata : ModelMetadata
+            Metadata associated with the model.
+        part_size : int, optional
+            Size in bytes of each part, at least 5 MiB. Default is 64 MiB.
+            Capped at the largest part the registry accepts.
+
+        Returns
+        -------
+        ModelInfo
+            Information about the uploaded model including its location and metadata.
+
+        Raises
+        ------
+        ValueError
+            If part_size is smaller than 5 MiB.
+        ModelUploadError
+            If the upload operation fails. The session is aborted.
+
+        Notes
+        -----
+        Parts are sent by up to ``transfer_concurrency`` threads and each
+        failed part is retried on its own. Registries serving presigned URLs
+        have the parts uploaded directly to their object storage. The model is
+        only registered once all parts are stored and the registry verified
+        the SHA-256 of the assembled file. Files no larger than one part, and files whose content
+        is already stored, are registered with a single request.
+
+        Examples
+        --------
+        >>> metadata = ModelMetadata(name='llm', version='2.0', file_extension='bin', ...)
+        >>> info = client.upload_model_file('weights.bin', metadata, part_size=128 * 1024 * 1024)
+        """
+        if part_size < 5 * 1024 * 1024:
+            raise ValueError("part_size must be at least 5 MiB")
+
+        path = os.fspath(path)
+        if os.path.getsize(path) <= part_size:
+            with open(path, "rb") as f:
+                return self.upload_model(f, metadata, filename=os.path.basename(path))
+
+        session_url = None
+        try:
+            digest = file_sha256(path)
+            result = self._register_by_hash(metadata, digest)
+            if result is not None:
+                logger.info(f"Registered model without upload, content already stored: {path}")
+                return self._model_info(result)
+
+            response = self.session.post(
+                f"{self.base_url}/model/upload-sessions",
+                json={"metadata": json.loads(metadata.model_dump_json()), "sha256": digest},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            session = response.json()
+            session_url = f"{self.base_url}/model/upload-sessions/{session['session_id']}"
+
+            # Registries with presigned URLs let the parts go straight to storage
+            direct_parts = [] if session.get("direct_upload") else None
+            self.transfer_manager.upload(
+                session_url,
+                path,
+                min(part_size, session["max_part_size"]),
+                digest,
+                direct_parts=direct_parts,
+            )
+
+            # The registry hashes the assembled file before answering, only connecting times out
+            response = self.session.post(
+                f"{session_url}/complete",
+                json={"parts": direct_parts} if direct_parts else None,
+                timeout=(self.timeout, None),
+            )
+            session_url = None
+            response.raise_for_status()
+
+            result = response.json()
+            logger.info(f"Successfully uploaded model: {path}")
+            return self._model_info(result)
+
+        except (requests.exceptions.RequestException, TransferError) as e:
+            logger.error(f"Failed to upload model: {str(e)}")
+            if session_url is not None:
+                try:
+                    self.session.delete(session_url, timeout=self.timeout)
+                except requests.exceptions.RequestException:
+                    logger.warning(f"Failed to abort upload session {session_url}")
+            raise ModelUploadError(f"Failed to upload model: {str(e)}")
+
+    def delete_model(self, metadata_id: str) -> None:
+        """
+        Delete a registered model version.
+
+        Parameters
+        ----------
+        metadata_id : str
+            Unique identifier for the model metadata.
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model version does not exist.
+        RegistryClientError
+            If the deletion fails.
+
+        Notes
+        -----
+        The stored file is only removed once no other registered version
+        shares its content.
+        """
+        try:
+            response = self.session.delete(
+                f"{self.base_url}/model/{metadata_id}", timeout=self.timeout
+            )
+            if response.status_code == 404:
+                raise ModelNotFoundError(f"Model not found: {metadata_id}")
+            response.raise_for_status()
+            logger.info(f"Deleted model: {metadata_id}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to delete model: {str(e)}")
+            raise RegistryClientError(f"Failed to delete model: {str(e)}")
+
     def get_metadata(self, metadata_id: str) -> Dict[str, Any]:
         """
         Retrieve metadata for a model.
@@ -275,7 +512,391 @@ class ModelRegistryClient:
             logger.error(f"Failed to get model metadata: {str(e)}")
             raise MetadataDownloadError(f"Failed to get model metadata: {str(e)}")
 
-    def get_model_file(self, file_path: str, bucket_name: str) -> io.BytesIO:
+    def get_metadata_many(
+        self, metadata_ids: List[str], chunk_size: int = 500
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata for many models with batch requests.
+
+        Parameters
+        ----------
+        metadata_ids : list of str
+            Unique identifiers of the model metadata. Duplicates are fetched once.
+        chunk_size : int, optional
+            Maximum number of IDs sent per request. Default is 500.
+
+        Returns
+        -------
+        dict
+            ``{"results": {...}, "errors": {...}}`` with the metadata of every
+            found model and an error message for every unresolved ID, both
+            keyed by metadata ID.
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not positive.
+        MetadataDownloadError
+            If a batch request fails.
+
+        Examples
+        --------
+        >>> batch = client.get_metadata_many(["model123", "model456"])
+        >>> for metadata_id, error in batch["errors"].items():
+        ...     print(f"{metadata_id}: {error}")
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        metadata_ids = list(dict.fromkeys(metadata_ids))
+        batch = {"results": {}, "errors": {}}
+        try:
+            for start in range(0, len(metadata_ids), chunk_size):
+                chunk = metadata_ids[start : start + chunk_size]
+                logger.info(f"Retrieving metadata batch of {len(chunk)} IDs")
+                response = self.session.post(
+                    f"{self.base_url}/model/metadata:batch",
+                    json={"ids": chunk},
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                result = response.json()
+                batch["results"].update(result["results"])
+                batch["errors"].update(result["errors"])
+            return batch
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to get model metadata batch: {str(e)}")
+            raise MetadataDownloadError(f"Failed to get model metadata batch: {str(e)}")
+
+    def resolve(self, name: str, alias: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Resolve a model name to the metadata of one of its versions.
+
+        Results are cached for ``resolve_ttl`` seconds, so serving code can call
+        this on every request without a round-trip each time.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model.
+        alias : str, optional
+            Alias such as ``production``. The latest registered version is
+            resolved if not given.
+
+        Returns
+        -------
+        dict
+            Metadata of the resolved version, including its ``metadata_id``
+            and ``storage_path``.
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model has no versions or the alias is not set.
+        MetadataDownloadError
+            If the lookup fails.
+
+        Examples
+        --------
+        >>> metadata = client.resolve("churn-model", alias="production")
+        >>> model, _ = client.get_model(metadata["storage_path"], metadata["metadata_id"])
+        """
+        key = (name, alias)
+        if self._resolved is not None:
+            metadata = self._resolved.get(key)
+            if metadata is not None:
+                return metadata
+
+        path = f"alias/{quote(alias, safe='')}" if alias else "latest"
+        try:
+            response = self.session.get(
+                f"{self.base_url}/models/{quote(name, safe='')}/{path}", timeout=self.timeout
+            )
+            if response.status_code == 404:
+                raise ModelNotFoundError(
+                    f"Cannot resolve {name}@{alias or 'latest'}: {response.json().get('detail')}"
+                )
+            response.raise_for_status()
+            metadata = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to resolve model: {str(e)}")
+            raise MetadataDownloadError(f"Failed to resolve model: {str(e)}")
+
+        if self._resolved is not None:
+            self._resolved.set(key, metadata)
+        return metadata
+
+    def set_alias(self, name: str, alias: str, metadata_id: str) -> None:
+        """
+        Point an alias of a model to one of its versions.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model.
+        alias : str
+            Alias such as ``production`` or ``staging``.
+        metadata_id : str
+            Metadata ID of the version.
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the metadata ID is unknown.
+        RegistryClientError
+            If the alias cannot be set.
+
+        Notes
+        -----
+        Other clients may keep resolving the previous version for up to their
+        ``resolve_ttl``.
+        """
+        try:
+            response = self.session.put(
+                f"{self.base_url}/models/{quote(name, safe='')}/alias/{quote(alias, safe='')}",
+                json={"metadata_id": metadata_id},
+                timeout=self.timeout,
+            )
+            if response.status_code == 404:
+                raise ModelNotFoundError(f"Model version not found: {metadata_id}")
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to set alias: {str(e)}")
+            raise RegistryClientError(f"Failed to set alias: {str(e)}")
+
+        if self._resolved is not None:
+            self._resolved.invalidate((name, alias))
+        logger.info(f"Alias {name}@{alias} now points to {metadata_id}")
+
+    def list_models(
+        self,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        framework: Optional[str] = None,
+        storage_group: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        registered_after: Optional[datetime] = None,
+        registered_before: Optional[datetime] = None,
+        sort: str = "registration_time",
+        order: str = "desc",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List registered models matching filters, one page at a time.
+
+        Parameters
+        ----------
+        name, version, framework, storage_group : str, optional
+            Exact match filters.
+        tags : dict, optional
+            Tags every listed model must have.
+        registered_after : datetime, optional
+            Only models registered at or after this time.
+        registered_before : datetime, optional
+            Only models registered before this time.
+        sort : str, optional
+            ``registration_time``, ``name`` or ``version``. Default is ``registration_time``.
+        order : str, optional
+            ``asc`` or ``desc``. Default is ``desc``.
+        limit : int, optional
+            Page size. Default is 50.
+        cursor : str, optional
+            ``next_cursor`` of the previous page.
+
+        Returns
+        -------
+        dict
+            ``items`` with the metadata of the page and ``next_cursor``, which
+            is None on the last page.
+
+        Raises
+        ------
+        MetadataDownloadError
+            If the listing fails.
+
+        Examples
+        --------
+        >>> page = client.list_models(name="churn-model", limit=10)
+        >>> while page["next_cursor"]:
+        ...     page = client.list_models(name="churn-model", limit=10, cursor=page["next_cursor"])
+        """
+        params = {
+            "name": name,
+            "version": version,
+            "framework": framework,
+            "storage_group": storage_group,
+            "tag": [f"{key}:{value}" for key, value in (tags or {}).items()],
+            "registered_after": registered_after.isoformat() if registered_after else None,
+            "registered_before": registered_before.isoformat() if registered_before else None,
+            "sort": sort,
+            "order": order,
+            "limit": limit,
+            "cursor": cursor,
+        }
+        try:
+            response = self.session.get(
+                f"{self.base_url}/models",
+                params={key: value for key, value in params.items() if value is not None},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to list models: {str(e)}")
+            raise MetadataDownloadError(f"Failed to list models: {str(e)}")
+
+    def iter_models(self, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all models matching filters, following page cursors.
+
+        Parameters
+        ----------
+        **filters
+            Keyword arguments of ``list_models`` except ``cursor``.
+
+        Yields
+        ------
+        dict
+            Metadata of each matching model.
+        """
+        cursor = None
+        while True:
+            page = self.list_models(**filters, cursor=cursor)
+            yield from page["items"]
+            cursor = page["next_cursor"]
+            if not cursor:
+                return
+
+    def watch(
+        self,
+        name: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+        read_timeout: float = 60.0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Follow registrations, deletions and alias changes as they happen.
+
+        Parameters
+        ----------
+        name : str, optional
+            Only follow this model. All models are followed if not given.
+        last_event_id : str, optional
+            ``id`` of the last event already handled, e.g. by a previous
+            process, to receive the events published since. Without it only
+            new events are received.
+        read_timeout : float, optional
+            Seconds without any data, not even a heartbeat, after which the
+            stream is reconnected. Default is 60.
+
+        Yields
+        ------
+        dict
+            Events with ``id``, ``type``, ``time`` and ``data``. ``type`` is
+            ``register`` (``data`` as returned by ``upload_model``), ``delete``
+            (``metadata_id``, ``name`` and ``version``), ``alias`` (``name``,
+            ``alias`` and ``metadata_id``, None if removed) or ``reset``, sent
+            when missed events are no longer available and the followed
+            models should be re-read.
+
+        Raises
+        ------
+        RegistryClientError
+            If the registry rejects the stream, or cannot be reached
+            ``max_retries`` times in a row.
+
+        Notes
+        -----
+        The stream is resumed after connection losses without losing or
+        repeating events. Each event also drops the affected ``resolve``
+        results from the client's cache, so ``resolve`` returns the new
+        version right away.
+
+        Examples
+        --------
+        >>> for event in client.watch(name="churn-model"):
+        ...     if event["type"] == "alias" and event["data"]["alias"] == "production":
+        ...         model, _ = client.get_model(...)
+        """
+        params = {"name": name} if name else {}
+        delay = 1.0
+        failures = 0
+        while True:
+            headers = {"Accept": "text/event-stream"}
+            if last_event_id:
+                headers["Last-Event-ID"] = last_event_id
+            try:
+                with self.session.get(
+                    f"{self.base_url}/events",
+                    params=params,
+                    headers=headers,
+                    stream=True,
+                    timeout=(self.timeout, read_timeout),
+                ) as response:
+                    response.raise_for_status()
+                    failures = 0
+                    for fields in self._server_sent_events(response):
+                        if "retry" in fields and fields["retry"].isdigit():
+                            delay = int(fields["retry"]) / 1000
+                        if "data" not in fields:
+                            continue
+                        event = json.loads(fields["data"])
+                        last_event_id = event["id"]
+                        self._forget_resolved(event)
+                        yield event
+
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+            ) as e:
+                failures += 1
+                if failures > self.max_retries:
+                    raise RegistryClientError(f"Lost the event stream: {str(e)}")
+                logger.warning(
+                    f"Event stream interrupted, reconnecting ({failures}/{self.max_retries}): {e}"
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to watch events: {str(e)}")
+                raise RegistryClientError(f"Failed to watch events: {str(e)}")
+            time.sleep(delay)
+
+    @staticmethod
+    def _server_sent_events(response: requests.Response) -> Iterator[Dict[str, str]]:
+        """Yield the fields of each server-sent event of a streamed response, skipping comments."""
+        fields: Dict[str, str] = {}
+        # chunk_size=None hands over every chunk as soon as it arrives
+        for line in response.iter_lines(chunk_size=None):
+            line = line.decode("utf-8")
+            if not line:
+                if fields:
+                    yield fields
+                fields = {}
+            elif not line.startswith(":"):
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                fields[field] = (
+                    f"{fields[field]}\n{value}" if field == "data" and field in fields else value
+                )
+
+    def _forget_resolved(self, event: Dict[str, Any]) -> None:
+        """Drop cached ``resolve`` results an event made stale."""
+        if self._resolved is None:
+            return
+        if event["type"] == "alias":
+            self._resolved.invalidate((event["data"]["name"], event["data"]["alias"]))
+        elif event["type"] in ("register", "delete"):
+            self._resolved.invalidate((event["data"]["name"], None))
+        else:
+            self._resolved.clear()
+
+    def get_model_file(
+        self,
+        file_path: str,
+        bucket_name: str,
+        dest: Optional[Union[str, os.PathLike]] = None,
+        mmap_mode: bool = False,
+    ) -> Union[io.BytesIO, Path, mmap.mmap]:
         """
         Download a model file from storage.
 
@@ -285,11 +906,19 @@ class ModelRegistryClient:
             Path to the model file in storage.
         bucket_name : str
             Name of the storage bucket containing the model.
+        dest : str or os.PathLike, optional
+            Local path to stream the file to instead of an in-memory buffer.
+        mmap_mode : bool, optional
+            If True, return a read-only memory map of the downloaded file. The file
+            is written to ``dest`` or, if not given, to an anonymous temporary file.
+            Default is False.
 
         Returns
         -------
-        io.BytesIO
-            Buffer containing the downloaded model file.
+        io.BytesIO or pathlib.Path or mmap.mmap
+            - io.BytesIO: Buffer containing the file, without ``dest`` and ``mmap_mode``.
+            - pathlib.Path: Path of the written file, if ``dest`` is given without ``mmap_mode``.
+            - mmap.mmap: Read-only memory map of the file, if ``mmap_mode`` is True.
 
         Raises
         ------
@@ -299,34 +928,381 @@ class ModelRegistryClient:
         Notes
         -----
         The downloaded file is streamed in chunks to handle large files efficiently.
+        Interrupted transfers are resumed from the last received byte using HTTP
+        range requests, up to ``max_retries`` times. With ``dest`` or ``mmap_mode``
+        the content never has to be held in memory as a whole, so loaders such as
+        ``joblib.load(path, mmap_mode="r")`` or ``numpy.load`` can map the weights
+        without an extra copy. Empty files cannot be memory-mapped and are
+        returned as an empty ``io.BytesIO`` in ``mmap_mode``. Registries serving
+        presigned URLs redirect downloads to their object storage, the redirect
+        is followed transparently.
+
+        If the client has a ``cache_dir``, files are served from the local cache
+        and revalidated with ``If-None-Match``, so unchanged files are not
+        downloaded again; ``mmap_mode`` then maps the cached file directly.
 
         Examples
         --------
         >>> buffer = client.get_model_file("models/mymodel.pkl", "models-bucket")
-        >>> with open('downloaded_model.pkl', 'wb') as f:
-        ...     f.write(buffer.getvalue())
+        >>> path = client.get_model_file(
+        ...     "models/mymodel.pkl", "models-bucket", dest="/tmp/mymodel.pkl"
+        ... )
+        >>> weights = client.get_model_file("models/mymodel.pkl", "models-bucket", mmap_mode=True)
+        >>> model = pickle.loads(weights)
         """
+        return self._get_model_file(file_path, bucket_name, dest=dest, mmap_mode=mmap_mode)
+
+    def _get_model_file(
+        self,
+        file_path: str,
+        bucket_name: str,
+        dest: Optional[Union[str, os.PathLike]] = None,
+        mmap_mode: bool = False,
+        etag: Optional[str] = None,
+    ) -> Union[io.BytesIO, Path, mmap.mmap]:
+        """Download a model file, going through the local cache if enabled."""
         try:
             logger.info(f"Retrieving model file: {file_path}")
-            params = {"bucket_name": bucket_name}
-            response = self.session.get(
-                f"{self.base_url}/model/file/{file_path}", params=params, stream=True, timeout=self.timeout
+            return self._fetch_file(
+                f"{self.base_url}/model/file/{file_path}",
+                {"bucket_name": bucket_name},
+                f"{bucket_name}/{file_path}",
+                dest=dest,
+                mmap_mode=mmap_mode,
+                etag=etag,
             )
-            response.raise_for_status()
 
+        except (requests.exceptions.RequestException, OSError) as e:
+            logger.error(f"Failed to retrieve model file: {str(e)}", exc_info=True)
+            raise ModelFileDownloadError(f"Failed to retrieve model file: {str(e)}")
+
+    def _fetch_file(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        file_key: str,
+        dest: Optional[Union[str, os.PathLike]] = None,
+        mmap_mode: bool = False,
+        etag: Optional[str] = None,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Union[io.BytesIO, Path, mmap.mmap]:
+        """Download a file served like ``/model/file`` into the form ``get_model_file`` returns."""
+        if self.cache is not None:
+            cached = self._download_cached(
+                url, params, file_key, etag=etag, response_headers=response_headers
+            )
+            return self._open_local_file(cached, dest, mmap_mode)
+
+        if dest is None and not mmap_mode:
             buffer = io.BytesIO()
-            for chunk in response.iter_content(chunk_size=8192):
-                buffer.write(chunk)
+            self._download(url, params, buffer, response_headers=response_headers)
             buffer.seek(0)
-
             return buffer
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to retrieve model file: {str(e)}", exc_info=True)
-            raise ModelFileDownloadError(f"Failed to retrieve model file: {str(e)}")
+
+        with open(dest, "w+b") if dest is not None else tempfile.TemporaryFile() as f:
+            self._download(url, params, f, response_headers=response_headers)
+            f.flush()
+            if not mmap_mode:
+                return Path(dest)
+            return self._mmap_file(f)
+
+    @staticmethod
+    def _mmap_file(f: BinaryIO) -> Union[io.BytesIO, mmap.mmap]:
+        """Map an open file read-only; empty files cannot be mapped and become an empty buffer."""
+        if f.seek(0, os.SEEK_END) == 0:
+            return io.BytesIO()
+        # The mapping stays valid after the file object is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _open_local_file(
+        self, path: Path, dest: Optional[Union[str, os.PathLike]], mmap_mode: bool
+    ) -> Union[io.BytesIO, Path, mmap.mmap]:
+        """Return a local (cached) file in the form requested from ``get_model_file``."""
+        if dest is not None:
+            shutil.copyfile(path, dest)
+            path = Path(dest)
+            if not mmap_mode:
+                return path
+        if mmap_mode:
+            with open(path, "rb") as f:
+                return self._mmap_file(f)
+        return io.BytesIO(path.read_bytes())
+
+    def download_model_file(
+        self, file_path: str, bucket_name: str, dest: str, expected_sha256: Optional[str] = None
+    ) -> TransferStats:
+        """
+        Download a model file to disk using parallel range requests.
+
+        The file is split into ``transfer_part_size`` byte ranges that are fetched
+        by up to ``transfer_concurrency`` threads over the session's connection
+        pool and written directly into a preallocated file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage.
+        bucket_name : str
+            Name of the storage bucket containing the model.
+        dest : str
+            Local path to write the file to.
+        expected_sha256 : str, optional
+            SHA-256 hex digest the downloaded file must match.
+
+        Returns
+        -------
+        TransferStats
+            Size, duration, throughput and SHA-256 digest of the download.
+
+        Raises
+        ------
+        ModelFileDownloadError
+            If the download fails or the checksum does not match.
+
+        Examples
+        --------
+        >>> stats = client.download_model_file("mymodel.pkl", "models-bucket", "/tmp/mymodel.pkl")
+        >>> print(f"{stats.throughput / 2**20:.1f} MiB/s, sha256={stats.sha256}")
+        """
+        try:
+            logger.info(f"Downloading model file: {file_path} -> {dest}")
+            return self.transfer_manager.download(
+                f"{self.base_url}/model/file/{file_path}",
+                dest,
+                params={"bucket_name": bucket_name},
+                expected_sha256=expected_sha256,
+            )
+        except (requests.exceptions.RequestException, TransferError, OSError) as e:
+            logger.error(f"Failed to download model file: {str(e)}")
+            raise ModelFileDownloadError(f"Failed to download model file: {str(e)}")
+
+    def _download(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        out: BinaryIO,
+        if_none_match: Optional[str] = None,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[int, Optional[str]]]:
+        """
+        Stream a file into ``out``, resuming from the last received byte on failure.
+
+        When the connection drops mid-transfer the download is re-requested with
+        a ``Range`` header starting at the number of bytes already written, and
+        an ``If-Range`` validator so a changed file is restarted from scratch.
+
+        Files the registry stores compressed are requested zstd encoded and
+        decompressed while they are written. Resumed ranges are always sent
+        uncompressed.
+
+        Parameters
+        ----------
+        url : str
+            URL of the file to download.
+        params : dict
+            Query parameters for the request.
+        out : BinaryIO
+            Writable, truncatable stream the content is written to.
+        if_none_match : str, optional
+            ETag of a locally cached copy, sent as ``If-None-Match``.
+        response_headers : dict, optional
+            Updated with the headers of the first response, also on 304 Not Modified.
+
+        Returns
+        -------
+        tuple or None
+            Number of bytes written and the ETag of the file, or None if the
+            server answered 304 Not Modified to ``if_none_match``.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If the download fails or cannot be resumed within ``max_retries`` attempts.
+        """
+        received = 0
+        etag = None
+        resumes = 0
+        while True:
+            headers = {}
+            if received:
+                headers["Range"] = f"bytes={received}-"
+                if etag:
+                    headers["If-Range"] = etag
+            else:
+                headers["Accept-Encoding"] = ZSTD
+                if if_none_match:
+                    headers["If-None-Match"] = if_none_match
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, stream=True, timeout=self.timeout
+                )
+                response.raise_for_status()
+                if response_headers is not None and not received:
+                    # Headers of a redirect to storage, e.g. the metadata of a bundle, come first
+                    for hop in (*response.history, response):
+                        response_headers.update(hop.headers)
+                if response.status_code == 304:
+                    response.close()
+                    return None
+                if received and response.status_code != 206:
+                    # Server ignored the range (e.g. file changed), start over
+                    out.seek(0)
+                    out.truncate()
+                    received = 0
+                etag = response.headers.get("ETag", etag)
+
+                for chunk in self._decoded_chunks(response):
+                    out.write(chunk)
+                    received += len(chunk)
+                return received, etag
+
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+            ) as e:
+                resumes += 1
+                if resumes > self.max_retries:
+                    raise
+                logger.warning(
+                    f"Download interrupted at byte {received}, "
+                    f"resuming ({resumes}/{self.max_retries}): {e}"
+                )
+
+    @staticmethod
+    def _decoded_chunks(response: requests.Response) -> Iterator[bytes]:
+        """Yield the body of a download response, decompressing zstd encoded content."""
+        if response.headers.get("Content-Encoding") != ZSTD:
+            return response.iter_content(chunk_size=8192)
+        return decompress_chunks(ModelRegistryClient._raw_chunks(response))
+
+    @staticmethod
+    def _raw_chunks(response: requests.Response) -> Iterator[bytes]:
+        """Yield the undecoded body of a response, raising the errors ``iter_content`` would."""
+        try:
+            yield from response.raw.stream(1024 * 1024, decode_content=False)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+    def _download_cached(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        file_key: str,
+        etag: Optional[str] = None,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Path:
+        """
+        Return the cached copy of a model file, downloading it on a miss.
+
+        A known ``etag`` (e.g. from the model metadata) that is already cached
+        is served without any request. Otherwise the last version known under
+        ``file_key`` is revalidated with ``If-None-Match`` and only re-downloaded
+        if changed.
+        """
+        if etag:
+            cached = self.cache.get(etag)
+            if cached is not None:
+                self.cache.hits += 1
+                self.cache.remember(file_key, etag)
+                return cached
+
+        known_etag = self.cache.etag_for(file_key)
+        cached = self.cache.get(known_etag) if known_etag else None
+        validator = f'"{known_etag}"' if cached is not None else None
+
+        with self.cache.temp_file() as f:
+            try:
+                result = self._download(
+                    url, params, f, if_none_match=validator, response_headers=response_headers
+                )
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+
+        if result is None:
+            os.unlink(f.name)
+            self.cache.hits += 1
+            logger.info(f"Model file not modified, served from cache: {file_key}")
+            return cached
+
+        _, new_etag = result
+        self.cache.misses += 1
+        if not new_etag:
+            new_etag = file_sha256(f.name)
+        return self.cache.put(file_key, new_etag.strip('"'), f.name)
+
+    def _get_bundle(
+        self,
+        file_path: str,
+        metadata_id: str,
+        bucket_name: Optional[str],
+        dest: Optional[Union[str, os.PathLike]],
+        mmap_mode: bool,
+    ) -> Optional[Tuple[Union[io.BytesIO, Path, mmap.mmap], Dict[str, Any]]]:
+        """
+        Download a model file and its metadata with one ``/bundle`` request.
+
+        Returns None on 404, so servers predating the endpoint and missing
+        models are handled (and reported) by the separate requests of ``get_model``.
+        Metadata too large for the response header is fetched separately.
+        The bundle always holds the model's own file, None is also returned if
+        that is not the requested one.
+        """
+        headers = CaseInsensitiveDict()
+        try:
+            logger.info(f"Retrieving model bundle: {metadata_id}")
+            model_file = self._fetch_file(
+                f"{self.base_url}/model/{metadata_id}/bundle",
+                {},
+                f"{metadata_id}:bundle",
+                dest=dest,
+                mmap_mode=mmap_mode,
+                response_headers=headers,
+            )
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            logger.error(f"Failed to retrieve model bundle: {str(e)}")
+            raise ModelFileDownloadError(f"Failed to retrieve model bundle: {str(e)}")
+        except (requests.exceptions.RequestException, OSError) as e:
+            logger.error(f"Failed to retrieve model bundle: {str(e)}", exc_info=True)
+            raise ModelFileDownloadError(f"Failed to retrieve model bundle: {str(e)}")
+
+        encoded = headers.get(METADATA_HEADER)
+        metadata = (
+            decode_metadata_header(encoded)
+            if encoded
+            else self.get_metadata(metadata_id=metadata_id)
+        )
+        if file_path != metadata.get("storage_path") or bucket_name not in (
+            None,
+            metadata.get("storage_group"),
+        ):
+            logger.warning(
+                f"Model {metadata_id} is not stored at {file_path}, fetching the file separately"
+            )
+            if not isinstance(model_file, Path):
+                model_file.close()
+            return None
+        if self.cache is not None and headers.get("ETag"):
+            # Let get_model_file revalidate the copy cached under the bundle's key
+            self.cache.remember(
+                f"{metadata['storage_group']}/{file_path}", headers["ETag"].strip('"')
+            )
+        return model_file, metadata
 
     def get_model(
-        self, file_path: str, metadata_id: str, bucket_name: Optional[str] = None
-    ) -> Tuple[io.BytesIO, Dict[str, Any]]:
+        self,
+        file_path: str,
+        metadata_id: str,
+        bucket_name: Optional[str] = None,
+        dest: Optional[Union[str, os.PathLike]] = None,
+        mmap_mode: bool = False,
+        bundle: bool = True,
+    ) -> Tuple[Union[io.BytesIO, Path, mmap.mmap], Dict[str, Any]]:
         """
         Retrieve a model and its metadata from the registry.
 
@@ -338,12 +1314,21 @@ class ModelRegistryClient:
             Unique identifier for the model metadata.
         bucket_name : str, optional
             Storage bucket name. If not provided, extracted from metadata.
+        dest : str or os.PathLike, optional
+            Local path to stream the model file to. See ``get_model_file``.
+        mmap_mode : bool, optional
+            Return a read-only memory map of the model file. See ``get_model_file``.
+        bundle : bool, optional
+            Fetch the file and its metadata with a single request to
+            ``/model/{metadata_id}/bundle``. Servers without the endpoint are
+            queried for metadata and file separately. Default is True.
 
         Returns
         -------
         tuple
             A tuple containing:
-            - io.BytesIO: Buffer containing the model file
+            - io.BytesIO, pathlib.Path or mmap.mmap: The model file, depending on
+              ``dest`` and ``mmap_mode``
             - dict: Model metadata dictionary
 
         Raises
@@ -369,6 +1354,12 @@ class ModelRegistryClient:
         ...     print("Model not found")
         """
         try:
+            if bundle:
+                result = self._get_bundle(file_path, metadata_id, bucket_name, dest, mmap_mode)
+                if result is not None:
+                    logger.info(f"Successfully retrieved model: {file_path}")
+                    return result
+
             # Get metadata first
             metadata = self.get_metadata(metadata_id=metadata_id)
 
@@ -378,7 +1369,18 @@ class ModelRegistryClient:
                 raise RegistryClientError("No bucket name provided and no storage group in metadata")
 
             # Get model file
-            buffer = self.get_model_file(file_path=file_path, bucket_name=bucket_name)
+            # The storage etag identifies the content, letting the cache skip revalidation
+            etag = None
+            if file_path == metadata.get("storage_path"):
+                etag = (metadata.get("storage_info") or {}).get("etag")
+
+            buffer = self._get_model_file(
+                file_path=file_path,
+                bucket_name=bucket_name,
+                dest=dest,
+                mmap_mode=mmap_mode,
+                etag=etag,
+            )
 
             logger.info(f"Successfully retrieved model: {file_path}")
             return buffer, metadata
@@ -0,0 +1,147 @@
+"""
+Compression codecs for stored model files.
+
+Model files of storage groups configured in ``settings.ZSTD_STORAGE_GROUPS``
+are zstd compressed while they are streamed to storage. The codec is recorded
+in the object metadata and in ``storage_info``, so readers know whether the
+stored bytes have to be decompressed.
+"""
+
+from typing import BinaryIO, Iterator, Optional
+
+import zstandard
+
+ZSTD = "zstd"
+
+
+class ChunkReader:
+    """
+    Minimal file-like reader over an iterator of byte chunks.
+
+    Parameters
+    ----------
+    chunks : Iterator[bytes]
+        Chunks to read from, closed together with the reader
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes, or everything left if ``size`` is negative."""
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        """Close the underlying chunk iterator, releasing its connection."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def compress_reader(stream: BinaryIO, level: int, size: int = -1) -> BinaryIO:
+    """
+    Wrap ``stream`` in a reader producing its zstd compressed content.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Readable binary stream with the uncompressed content
+    level : int
+        zstd compression level
+    size : int, optional
+        Number of bytes ``stream`` will produce, recorded in the frame header. -1 if unknown.
+
+    Returns
+    -------
+    BinaryIO
+        Reader whose ``tell()`` returns the number of compressed bytes produced so far
+    """
+    return zstandard.ZstdCompressor(level=level).stream_reader(stream, size=size)
+
+
+def decompress_chunks(
+    chunks: Iterator[bytes], chunk_size: int = 1024 * 1024, offset: int = 0, length: int = 0
+) -> Iterator[bytes]:
+    """
+    Decompress a zstd stream and yield a byte range of its content.
+
+    Compressed content cannot be read from the middle, so everything before
+    ``offset`` is decompressed and skipped.
+
+    Parameters
+    ----------
+    chunks : Iterator[bytes]
+        Compressed content, closed once the returned iterator is exhausted or closed
+    chunk_size : int, optional
+        Maximum size of each yielded chunk in bytes, by default 1 MiB
+    offset : int, optional
+        Start position within the decompressed content, by default 0
+    length : int, optional
+        Number of decompressed bytes to yield, by default 0 (to the end)
+
+    Returns
+    -------
+    Iterator[bytes]
+        Iterator over the requested decompressed content
+    """
+    source = ChunkReader(chunks)
+    try:
+        reader = zstandard.ZstdDecompressor().stream_reader(source, read_size=chunk_size)
+        while offset > 0:
+            skipped = len(reader.read(min(chunk_size, offset)))
+            if not skipped:
+                return
+            offset -= skipped
+
+        remaining: Optional[int] = length or None
+        while remaining is None or remaining > 0:
+            chunk = reader.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        source.close()
+
+
+def accepts_encoding(accept_encoding: Optional[str], coding: str) -> bool:
+    """
+    Check whether an ``Accept-Encoding`` header allows ``coding``.
+
+    Parameters
+    ----------
+    accept_encoding : str or None
+        Value of the Accept-Encoding request header
+    coding : str
+        Content coding to check, e.g. ``"zstd"``
+
+    Returns
+    -------
+    bool
+        True if ``coding`` (or ``*``) is listed with a non-zero quality
+    """
+    if not accept_encoding:
+        return False
+    allowed = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        allowed[name.strip().lower()] = quality
+    return allowed.get(coding, allowed.get("*", 0.0)) > 0
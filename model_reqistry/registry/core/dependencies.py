@@ -1,7 +1,7 @@
-from registry.services import ModelRegistry
+from registry.services import AsyncModelRegistry
 from registry.core.registry import registry_container
 
 
-async def get_registry() -> ModelRegistry:
+async def get_registry() -> AsyncModelRegistry:
     """FastAPI dependency for getting registry instance"""
     return await registry_container.get_registry()
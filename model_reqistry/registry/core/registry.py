@@ -1,32 +1,61 @@
 from typing import Optional
+import asyncio
 from fastapi import HTTPException,status
 
-from registry.services import ModelRegistry
+from registry.services import ModelRegistry, AsyncModelRegistry
+from registry.core.config import settings
 from registry.logger import logger
 
 class RegistryContainer:
     def __init__(self):
-        self._registry: Optional[ModelRegistry] = None
+        self._registry: Optional[AsyncModelRegistry] = None
         self._initialized = False
+        self._lock = asyncio.Lock()
 
     async def initialize(self) -> None:
-        """Initialize registry if not already initialized"""
-        if not self._initialized:
+        """
+        Initialize registry if not already initialized.
+
+        Runs from the application lifespan at startup: the storage clients are
+        built off the event loop, then connected and the known buckets created,
+        so the first request does not pay for it. Requests arriving before a
+        successful startup retry the initialization.
+        """
+        async with self._lock:
+            if self._initialized:
+                return
             try:
-                self._registry = ModelRegistry()
+                registry = await asyncio.to_thread(ModelRegistry)
+                self._registry = AsyncModelRegistry(
+                    registry,
+                    transfer_workers=settings.TRANSFER_WORKERS,
+                    lookup_workers=settings.LOOKUP_WORKERS,
+                )
+                await self._registry.prepare()
                 self._initialized = True
             except Exception as e:
                 logger.error(f"Failed to initialize registry: {e}")
+                if self._registry is not None:
+                    self._registry.close()
+                    self._registry = None
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to initialize model registry",
                 )
 
-    async def get_registry(self) -> ModelRegistry:
+    async def get_registry(self) -> AsyncModelRegistry:
         """Get or initialize registry instance"""
         if not self._initialized:
             await self.initialize()
         return self._registry
 
+    async def close(self) -> None:
+        """Shut down the registry's thread pools at application shutdown."""
+        async with self._lock:
+            if self._registry is not None:
+                self._registry.close()
+            self._registry = None
+            self._initialized = False
+
 
 registry_container = RegistryContainer()
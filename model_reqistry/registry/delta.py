@@ -0,0 +1,263 @@
+"""
+Binary deltas between model file versions.
+
+A model version registered with a ``parent_version`` can be stored as a
+delta against the parent's content. The new content is split into aligned
+blocks; blocks found anywhere in the parent at a block boundary become copy
+instructions, all other bytes are kept as literals, and the instruction
+stream is zstd compressed. Fine-tuned checkpoints keep the tensor layout of
+their parent, so unchanged tensors turn into a few copy instructions.
+
+Deltas are encoded and applied between streams, typically temporary files,
+so memory use does not grow with the size of the model files.
+
+Reconstructed contents are kept in a byte-bounded LRU cache, because every
+download of a delta version needs the full content of its whole chain.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, BinaryIO, Dict, Hashable, Optional
+import hashlib
+import io
+import itertools
+import struct
+
+import zstandard
+
+DELTA = "delta"
+
+BLOCK_SIZE = 16 * 1024
+
+# Unmatched bytes are emitted as literal instructions of at most this size
+LITERAL_CHUNK_SIZE = 1024 * 1024
+
+# A delta must save at least half of the file to be worth its reconstruction cost
+MAX_DELTA_RATIO = 0.5
+
+_MAGIC = b"RDLT1"
+_COPY = struct.Struct(">cQQ")
+_LITERAL = struct.Struct(">cQ")
+
+
+def _block_key(block: bytes) -> bytes:
+    return hashlib.blake2b(block, digest_size=16).digest()
+
+
+def encode_delta(
+    base: BinaryIO,
+    data: BinaryIO,
+    out: BinaryIO,
+    level: int = 3,
+    block_size: int = BLOCK_SIZE,
+    max_size: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Encode ``data`` as a delta against ``base`` and write it to ``out``.
+
+    Both contents are read block by block, only the block hashes of ``base``
+    are kept in memory, so files of any size are encoded in bounded memory.
+
+    Parameters
+    ----------
+    base : BinaryIO
+        Seekable stream with the content of the parent version
+    data : BinaryIO
+        Seekable stream with the content of the new version
+    out : BinaryIO
+        Writable stream the compressed delta is written to, see ``apply_delta``
+    level : int, optional
+        zstd level of the instruction stream, by default 3
+    block_size : int, optional
+        Size of the blocks matched against the parent, by default 16 KiB
+    max_size : int, optional
+        Give up once the delta grows beyond this many bytes
+
+    Returns
+    -------
+    Optional[int]
+        Size of the written delta, or None if it exceeded ``max_size``, in
+        which case ``out`` holds an incomplete delta
+    """
+    index: Dict[bytes, int] = {}
+    base.seek(0)
+    for offset in itertools.count(0, block_size):
+        block = base.read(block_size)
+        if len(block) < block_size:
+            break
+        index.setdefault(_block_key(block), offset)
+
+    start = out.tell()
+    writer = zstandard.ZstdCompressor(level=level).stream_writer(out, closefd=False)
+    writer.write(_MAGIC)
+    copy_start, copy_length = 0, 0
+    literal = bytearray()
+
+    def flush() -> None:
+        nonlocal copy_length
+        if copy_length:
+            writer.write(_COPY.pack(b"C", copy_start, copy_length))
+            copy_length = 0
+        elif literal:
+            writer.write(_LITERAL.pack(b"L", len(literal)))
+            writer.write(literal)
+            literal.clear()
+
+    data.seek(0)
+    while True:
+        block = data.read(block_size)
+        if not block:
+            break
+        source = index.get(_block_key(block)) if len(block) == block_size else None
+        if source is not None:
+            base.seek(source)
+            if base.read(block_size) != block:
+                source = None
+        if source is not None:
+            if not (copy_length and copy_start + copy_length == source):
+                flush()
+                copy_start = source
+            copy_length += block_size
+        else:
+            if copy_length or len(literal) >= LITERAL_CHUNK_SIZE:
+                flush()
+            literal += block
+        if max_size is not None and out.tell() - start > max_size:
+            return None
+    flush()
+    writer.flush(zstandard.FLUSH_FRAME)
+
+    size = out.tell() - start
+    return None if max_size is not None and size > max_size else size
+
+
+def _read_exactly(reader: BinaryIO, size: int) -> bytes:
+    """Read ``size`` bytes from a stream that may return short reads."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = reader.read(size - len(data))
+        if not chunk:
+            raise ValueError("Delta is truncated")
+        data += chunk
+    return bytes(data)
+
+
+def apply_delta(
+    base: BinaryIO, delta: BinaryIO, size: int, out: BinaryIO, chunk_size: int = 1024 * 1024
+) -> None:
+    """
+    Reconstruct content from the content of its parent and a delta.
+
+    The delta is decompressed and applied as it is read, the reconstructed
+    content is written to ``out`` in chunks of at most ``chunk_size`` bytes.
+
+    Parameters
+    ----------
+    base : BinaryIO
+        Seekable stream with the content of the parent version
+    delta : BinaryIO
+        Stream with a delta produced by ``encode_delta``
+    size : int
+        Size of the reconstructed content
+    out : BinaryIO
+        Writable stream the reconstructed content is written to
+    chunk_size : int, optional
+        Maximum number of bytes copied at once, by default 1 MiB
+
+    Raises
+    ------
+    ValueError
+        If the delta is malformed or does not fit ``base`` and ``size``
+    """
+    base_size = base.seek(0, io.SEEK_END)
+    reader = zstandard.ZstdDecompressor().stream_reader(delta, closefd=False)
+    if _read_exactly(reader, len(_MAGIC)) != _MAGIC:
+        raise ValueError("Not a registry delta")
+
+    written = 0
+    while True:
+        kind = reader.read(1)
+        if not kind:
+            break
+        if kind == b"C":
+            _, start, length = _COPY.unpack(kind + _read_exactly(reader, _COPY.size - 1))
+            if start + length > base_size:
+                raise ValueError("Delta copies beyond the end of its base")
+            base.seek(start)
+            source = base
+        elif kind == b"L":
+            _, length = _LITERAL.unpack(kind + _read_exactly(reader, _LITERAL.size - 1))
+            source = reader
+        else:
+            raise ValueError(f"Unknown delta instruction {kind!r}")
+        if written + length > size:
+            raise ValueError("Delta produces more data than expected")
+        for offset in range(0, length, chunk_size):
+            out.write(_read_exactly(source, min(chunk_size, length - offset)))
+        written += length
+
+    if written != size:
+        raise ValueError(f"Delta produced {written} bytes, expected {size}")
+
+
+class ReconstructionCache:
+    """
+    Thread-safe LRU cache of reconstructed contents bounded by total bytes.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the cached contents, larger contents are not cached
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups answered from the cache
+    misses : int
+        Number of lookups not found in the cache
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached content of ``key`` and mark it recently used, or None."""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def set(self, key: Hashable, content: bytes) -> None:
+        """Cache ``content`` under ``key``, evicting least recently used entries."""
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = content
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of entries, cached bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
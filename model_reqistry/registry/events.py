@@ -0,0 +1,145 @@
+"""
+Change events of the model registry.
+
+Registrations, deletions and alias changes are appended to an in-memory ring
+buffer and pushed to subscribers, which the API streams to clients as
+server-sent events. Event IDs combine a random epoch chosen at startup with a
+sequence number, so a client reconnecting with ``Last-Event-ID`` receives
+exactly the events it missed, or a ``reset`` event if they are no longer
+buffered (evicted, or the registry restarted) and it has to re-read the state
+it cares about.
+
+Notes
+-----
+The buffer lives in the registry process, events of other processes or
+replicas are not seen.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+import datetime
+import json
+import threading
+import uuid
+
+# Event types
+REGISTER = "register"
+DELETE = "delete"
+ALIAS = "alias"
+RESET = "reset"
+
+
+class EventLog:
+    """
+    Thread-safe ring buffer of the latest registry change events.
+
+    Parameters
+    ----------
+    max_events : int
+        Number of events kept for clients resuming a stream
+
+    Attributes
+    ----------
+    epoch : str
+        Random prefix of the event IDs of this process
+    """
+
+    def __init__(self, max_events: int):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=max_events)
+        self._position = 0
+        self._listeners: Set[Callable[[], None]] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def position(self) -> int:
+        """Sequence number of the latest event, 0 before the first."""
+        return self._position
+
+    def event_id(self, sequence: int) -> str:
+        """Return the ID of the event with sequence number ``sequence``."""
+        return f"{self.epoch}-{sequence}"
+
+    def parse_id(self, event_id: str) -> Optional[int]:
+        """Return the sequence number of an event ID, None if it was not issued by this log."""
+        epoch, _, sequence = event_id.partition("-")
+        if epoch != self.epoch or not sequence.isdigit() or int(sequence) > self._position:
+            return None
+        return int(sequence)
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append an event and wake all subscribers.
+
+        Parameters
+        ----------
+        event_type : str
+            ``register``, ``delete`` or ``alias``
+        data : Dict[str, Any]
+            JSON serializable payload, including the ``name`` of the model
+
+        Returns
+        -------
+        Dict[str, Any]
+            The event with its ``id``, ``type``, ``time`` and ``data``
+        """
+        with self._lock:
+            self._position += 1
+            event = {
+                "id": self.event_id(self._position),
+                "type": event_type,
+                "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "data": data,
+            }
+            self._events.append((self._position, event))
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+        return event
+
+    def read(self, after: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the events following sequence number ``after``.
+
+        Returns
+        -------
+        Optional[List[Dict[str, Any]]]
+            Events in order, None if some of them were already evicted
+        """
+        with self._lock:
+            oldest = self._events[0][0] if self._events else self._position + 1
+            if after + 1 < oldest:
+                return None
+            return [event for sequence, event in self._events if sequence > after]
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` from the publishing thread after every new event."""
+        with self._lock:
+            self._listeners.add(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        """Stop calling ``listener``."""
+        with self._lock:
+            self._listeners.discard(listener)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the latest event ID, the buffered events and the subscribers."""
+        with self._lock:
+            return {
+                "last_event_id": self.event_id(self._position),
+                "buffered": len(self._events),
+                "max_events": self._events.maxlen,
+                "subscribers": len(self._listeners),
+            }
+
+
+def format_event(event: Optional[Dict[str, Any]]) -> bytes:
+    """
+    Encode an event as a server-sent event, or a heartbeat comment for None.
+
+    The ``data`` field holds the whole event as JSON, the SSE ``id`` lets
+    clients resume with ``Last-Event-ID``.
+    """
+    if event is None:
+        return b": heartbeat\n\n"
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
@@ -82,6 +82,18 @@ class DuplicateModelError(RegistryError):
         super().__init__(f"Duplicate model: {model_info}")
 
 
+class ResourceBusyError(RegistryError):
+    """
+    Exception raised when an operation conflicts with one in progress and can be retried.
+
+    Examples:
+        - Registering content while its stored file is being deleted
+    """
+
+    def __init__(self, message: str = "Resource is busy"):
+        super().__init__(f"Resource busy: {message}")
+
+
 class RegistryConnectionError(RegistryError):
     """
     Exception raised for connection-related errors.
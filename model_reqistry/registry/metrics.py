@@ -0,0 +1,200 @@
+"""
+Prometheus instrumentation of the registry service.
+
+This module defines the registry metrics, an ASGI middleware timing every
+request and counting transferred bytes, and a class decorator timing every
+public call of a storage backend. Metrics are exposed by ``GET /metrics``.
+
+Notes
+-----
+Requests are labelled with their route template (e.g. ``/model/file/{file_path}``),
+never with raw paths, to keep the number of time series bounded.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Dict, Tuple, Type
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Uploads and downloads of large models take minutes, not milliseconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+REQUEST_LATENCY = Histogram(
+    "registry_request_duration_seconds",
+    "Time from receiving a request until its response is sent",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+UPLOADED_BYTES = Counter("registry_uploaded_bytes_total", "Request body bytes received", ["route"])
+DOWNLOADED_BYTES = Counter("registry_downloaded_bytes_total", "Response body bytes sent", ["route"])
+TRANSFERS_IN_PROGRESS = Gauge(
+    "registry_transfers_in_progress",
+    "Model file uploads and downloads being transferred",
+    ["direction"],
+)
+STORAGE_LATENCY = Histogram(
+    "registry_storage_call_duration_seconds",
+    "Duration of storage backend calls",
+    ["backend", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DISK_CACHE_REQUESTS = Counter(
+    "registry_disk_cache_requests_total",
+    "Model file reads by disk cache outcome: "
+    "hit, miss (started a fill), join (waited on a fill) or bypass",
+    ["result"],
+)
+DISK_CACHE_BYTES = Gauge("registry_disk_cache_bytes", "Bytes of model files held in the disk cache")
+UPLOAD_ADMISSIONS = Counter(
+    "registry_upload_admissions_total",
+    "Upload admission decisions: admitted, queue_full or timeout (both answered with 429)",
+    ["result"],
+)
+UPLOAD_QUEUE_DEPTH = Gauge("registry_upload_queue_depth", "Uploads waiting for admission")
+UPLOAD_QUEUE_WAIT = Histogram(
+    "registry_upload_queue_wait_seconds",
+    "Time queued uploads waited for admission",
+    buckets=LATENCY_BUCKETS,
+)
+UPLOADS_IN_PROGRESS = Gauge(
+    "registry_upload_admitted_requests", "Uploads admitted and not yet answered"
+)
+UPLOAD_INFLIGHT_BYTES = Gauge("registry_upload_admitted_bytes", "Bytes charged to admitted uploads")
+
+# Routes moving model files, by method and route template
+TRANSFER_ROUTES: Dict[Tuple[str, str], str] = {
+    ("POST", "/model/upload"): "upload",
+    ("PUT", "/model/upload-sessions/{session_id}/parts/{part_number}"): "upload",
+    ("GET", "/model/file/{file_path}"): "download",
+    ("GET", "/model/{metadata_id}/bundle"): "download",
+}
+
+
+def _route(scope: Dict[str, Any]) -> str:
+    """Return the route template a request was routed to."""
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency, transferred bytes and in-flight transfers.
+
+    The request is timed until its last response message is sent, so
+    streamed downloads are measured completely.
+
+    Parameters
+    ----------
+    app : ASGI application
+        Application to instrument
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        transfer = None
+
+        def track_transfer() -> None:
+            # Routing happens before the body is read or the response started
+            nonlocal transfer
+            if transfer is None:
+                transfer = TRANSFER_ROUTES.get((scope["method"], _route(scope)), "")
+                if transfer:
+                    TRANSFERS_IN_PROGRESS.labels(transfer).inc()
+
+        async def receive_counted() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "http.request":
+                track_transfer()
+                if message.get("body"):
+                    UPLOADED_BYTES.labels(_route(scope)).inc(len(message["body"]))
+            return message
+
+        async def send_counted(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                track_transfer()
+            elif message["type"] == "http.response.body" and message.get("body"):
+                DOWNLOADED_BYTES.labels(_route(scope)).inc(len(message["body"]))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            if transfer:
+                TRANSFERS_IN_PROGRESS.labels(transfer).dec()
+            REQUEST_LATENCY.labels(scope["method"], _route(scope), str(status)).observe(
+                time.perf_counter() - started
+            )
+
+
+def _timed(backend: str, operation: str, func: Callable) -> Callable:
+    histogram = STORAGE_LATENCY.labels(backend, operation)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+def instrument_storage(backend: str) -> Callable[[Type], Type]:
+    """
+    Class decorator timing every public method of a storage backend.
+
+    Parameters
+    ----------
+    backend : str
+        Value of the ``backend`` label, e.g. ``"minio"``
+
+    Returns
+    -------
+    Callable
+        Decorator replacing the public methods with timed wrappers
+
+    Notes
+    -----
+    Methods returning iterators are timed until the iterator is returned,
+    which covers opening the object but not reading it.
+    """
+
+    def decorate(cls: Type) -> Type:
+        for name, member in list(vars(cls).items()):
+            if (
+                not name.startswith("_")
+                and callable(member)
+                and not isinstance(member, (staticmethod, classmethod))
+            ):
+                setattr(cls, name, _timed(backend, name, member))
+        return cls
+
+    return decorate
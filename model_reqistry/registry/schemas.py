@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -29,6 +29,8 @@ class ModelMetadata(BaseModel):
         Dictionary of model parameters and hyperparameters
     tags : dict, optional
         Dictionary of tags for the model
+    parent_version : str, optional
+        Registered version of the same model to store the file as a delta against
     """
 
     id: str
@@ -41,6 +43,131 @@ class ModelMetadata(BaseModel):
     metrics: Optional[Dict[str, Any]] = None
     parameters: Optional[Dict[str, Any]] = None
     tags: Optional[Dict[str, Any]] = Field(default=None , description="Tags for the model")
+    parent_version: Optional[str] = Field(
+        default=None, description="Version to store the file as a delta against"
+    )
+
+
+class RegisterByHashRequest(BaseModel):
+    """
+    Pydantic model for registering a model whose file content is already stored.
+
+    Parameters
+    ----------
+    metadata : ModelMetadata
+        Metadata of the model
+    sha256 : str
+        SHA-256 hex digest of the model file
+    """
+
+    metadata: ModelMetadata
+    sha256: str = Field(
+        ..., pattern=r"^[0-9a-f]{64}$", description="SHA-256 hex digest of the model file"
+    )
+
+
+class UploadSessionRequest(BaseModel):
+    """
+    Pydantic model for starting a chunked upload session.
+
+    Parameters
+    ----------
+    metadata : ModelMetadata
+        Metadata of the model, registered when the session is completed
+    sha256 : str, optional
+        Expected SHA-256 hex digest of the complete model file
+    """
+
+    metadata: ModelMetadata
+    sha256: Optional[str] = Field(
+        default=None, pattern=r"^[0-9a-f]{64}$", description="Expected SHA-256 hex digest"
+    )
+
+
+class UploadSessionResponse(BaseModel):
+    """
+    Pydantic model for a started chunked upload session.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session
+    max_part_size : int
+        Largest accepted part in bytes, all parts but the last must be at least 5 MiB
+    direct_upload : bool
+        Whether parts may be uploaded directly to storage through presigned URLs
+    """
+
+    session_id: str
+    max_part_size: int
+    direct_upload: bool = False
+
+
+class UploadPartResponse(BaseModel):
+    """
+    Pydantic model for a stored part of a chunked upload session.
+
+    Parameters
+    ----------
+    part_number : int
+        Position of the part, starting at 1
+    etag : str
+        ETag of the stored part
+    size : int
+        Size of the part in bytes
+    """
+
+    part_number: int
+    etag: str
+    size: int
+
+
+class UploadPartUrlResponse(BaseModel):
+    """
+    Pydantic model for a presigned URL uploading one part directly to storage.
+
+    Parameters
+    ----------
+    part_number : int
+        Position of the part, starting at 1
+    url : str
+        URL to ``PUT`` the part to, storage answers with the part's ``ETag``
+    expires_in : int
+        Seconds the URL stays valid
+    """
+
+    part_number: int
+    url: str
+    expires_in: int
+
+
+class UploadCompleteRequest(BaseModel):
+    """
+    Pydantic model for completing a chunked upload session.
+
+    Parameters
+    ----------
+    parts : List[UploadPartResponse]
+        Parts uploaded directly to storage, parts sent through the registry are already known
+    """
+
+    parts: List[UploadPartResponse] = Field(default_factory=list, max_length=10000)
+
+
+class UploadSessionStatus(BaseModel):
+    """
+    Pydantic model for the progress of a chunked upload session.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session
+    parts : List[UploadPartResponse]
+        Stored parts sorted by part number
+    """
+
+    session_id: str
+    parts: List[UploadPartResponse]
 
 
 class ModelResponse(BaseModel):
@@ -112,6 +239,8 @@ class GetMetadataModelResponse(BaseModel):
         Dictionary of model parameters
     storage_info : dict
         Dictionary containing storage information
+    parent_version : str, optional
+        Version the model file was stored as a delta against
     """
 
     id: str
@@ -127,6 +256,84 @@ class GetMetadataModelResponse(BaseModel):
     framework: str = None
     metrics: Optional[Dict[str, Any]] = None
     parameters: Optional[Dict[str, Any]] = None
+    parent_version: Optional[str] = None
+
+
+class MetadataBatchRequest(BaseModel):
+    """
+    Pydantic model for a batch metadata lookup request.
+
+    Parameters
+    ----------
+    ids : list of str
+        Metadata IDs to look up
+    """
+
+    ids: List[str] = Field(..., min_length=1, description="Metadata IDs to look up")
+
+
+class MetadataBatchResponse(BaseModel):
+    """
+    Pydantic model for a batch metadata lookup response.
+
+    Parameters
+    ----------
+    results : dict
+        Metadata of every found model, keyed by metadata ID
+    errors : dict
+        Error message of every ID that could not be resolved, keyed by metadata ID
+    """
+
+    results: Dict[str, GetMetadataModelResponse]
+    errors: Dict[str, str]
+
+
+class ModelListResponse(BaseModel):
+    """
+    Pydantic model for one page of a model listing.
+
+    Parameters
+    ----------
+    items : list
+        Metadata of the models on this page
+    next_cursor : str, optional
+        Cursor to request the next page with, None on the last page
+    """
+
+    items: List[GetMetadataModelResponse]
+    next_cursor: Optional[str] = None
+
+
+class AliasRequest(BaseModel):
+    """
+    Pydantic model for pointing a model alias to a version.
+
+    Parameters
+    ----------
+    metadata_id : str
+        Metadata ID of the model version
+    """
+
+    metadata_id: str
+
+
+class AliasResponse(BaseModel):
+    """
+    Pydantic model of a model alias.
+
+    Parameters
+    ----------
+    name : str
+        Name of the model
+    alias : str
+        Alias such as ``production`` or ``staging``
+    metadata_id : str
+        Metadata ID of the version the alias points to
+    """
+
+    name: str
+    alias: str
+    metadata_id: str
 
 
 class ModelInfo(BaseModel):
@@ -138,3 +345,31 @@ class ModelInfo(BaseModel):
     file_path: str
     storage_group: str
     registration_time: datetime
+
+
+class TransferStats(BaseModel):
+    """
+    Statistics of a completed file transfer.
+
+    Parameters
+    ----------
+    path : str
+        Local path of the transferred file
+    size : int
+        Number of bytes transferred
+    parts : int
+        Number of ranged parts the file was split into
+    seconds : float
+        Wall-clock duration of the transfer
+    throughput : float
+        Average throughput in bytes per second
+    sha256 : str
+        SHA-256 hex digest of the transferred file
+    """
+
+    path: str
+    size: int
+    parts: int
+    seconds: float
+    throughput: float
+    sha256: str
@@ -2,17 +2,87 @@
 Model Registry implementation for managing ML models and metadata.
 
 This module provides a centralized registry for managing machine learning models
-and their metadata using MinIO for model storage and MongoDB for metadata storage.
+and their metadata using MinIO for model storage and MongoDB for metadata storage,
+plus an asyncio facade used by the API that keeps blocking storage calls off the
+event loop.
 """
 
-from typing import BinaryIO, Dict, Any, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, BinaryIO, Callable, Dict, Any, Iterator, List, Tuple, Optional
+import asyncio
+import base64
+import binascii
+import contextlib
 import datetime
+import functools
+import hashlib
+import io
+import json
+import tempfile
+import threading
+import time
+import uuid
 
 from .storage.minio import MinioStorage
+from .storage.filesystem import FilesystemStorage
 from .storage.mongo import MongoStorage
+from .storage.sqlite import SQLiteMetadataStorage
+from .storage.cached import CachedMetadataStorage
+from .storage.disk_cache import CachedModelStorage
+from .storage.base import BLOB_FIELDS, BaseMetadataStorage, BaseStorage
+from .core.config import settings
 from .schemas import ModelResponse
-from .exceptions import RegistryError
+from .exceptions import (
+    RegistryError,
+    ValidationError,
+    DuplicateModelError,
+    ModelNotFoundError,
+    ResourceBusyError,
+)
 from .logger import logger
+from .codec import ChunkReader, decompress_chunks
+from .events import ALIAS, DELETE, REGISTER, RESET, EventLog
+from .delta import DELTA, MAX_DELTA_RATIO, ReconstructionCache, apply_delta, encode_delta
+
+
+# Model file storage backends selectable with ``settings.STORAGE_BACKEND``
+STORAGE_BACKENDS: Dict[str, Callable[[], BaseStorage]] = {
+    "minio": MinioStorage,
+    "filesystem": FilesystemStorage,
+}
+
+# Model metadata storage backends selectable with ``settings.METADATA_BACKEND``
+METADATA_BACKENDS: Dict[str, Callable[[], BaseMetadataStorage]] = {
+    "mongo": MongoStorage,
+    "sqlite": SQLiteMetadataStorage,
+}
+
+# Seconds a blob deletion may take before another process takes it over
+BLOB_DELETE_LEASE = 60.0
+
+
+def _encode_cursor(sort: str, descending: bool, metadata: Dict[str, Any]) -> str:
+    """Encode the keyset position after ``metadata`` as an opaque page cursor."""
+    value = metadata.get(sort)
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    state = [sort, descending, value, metadata["_id"]]
+    return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[Any, str]:
+    """Decode a page cursor into the ``(sort value, ID)`` to resume after."""
+    try:
+        cursor_sort, cursor_descending, value, last_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        if sort == "registration_time" and value is not None:
+            value = datetime.datetime.fromisoformat(value)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValidationError(f"Invalid cursor: {str(e)}")
+    if cursor_sort != sort or cursor_descending != descending:
+        raise ValidationError("Cursor was created with a different sort order")
+    return value, last_id
 
 
 class ModelRegistry:
@@ -25,34 +95,86 @@ class ModelRegistry:
 
     Attributes
     ----------
-    model_storage : MinioStorage
-        Storage handler for model binary files
-    metadata_storage : MongoStorage
-        Storage handler for model metadata
+    model_storage : BaseStorage
+        Storage handler for model binary files, selected by ``STORAGE_BACKEND`` and
+        wrapped in a disk cache if ``DISK_CACHE_BYTES`` is set
+    metadata_storage : BaseMetadataStorage
+        Storage handler for model metadata, selected by ``METADATA_BACKEND`` and
+        wrapped in a read cache unless ``METADATA_CACHE_SIZE`` is 0
+    delta_cache : ReconstructionCache or None
+        Contents of reconstructed delta versions, None if ``DELTA_CACHE_BYTES`` is 0
     """
 
     def __init__(self):
         """Initialize registry with storage backends."""
         try:
-            self.model_storage = MinioStorage()
-            self.metadata_storage = MongoStorage()
+            self.model_storage = STORAGE_BACKENDS[settings.STORAGE_BACKEND]()
+            if settings.DISK_CACHE_BYTES > 0:
+                self.model_storage = CachedModelStorage(
+                    self.model_storage,
+                    cache_dir=settings.DISK_CACHE_DIR,
+                    max_bytes=settings.DISK_CACHE_BYTES,
+                )
+            self.metadata_storage = METADATA_BACKENDS[settings.METADATA_BACKEND]()
+            if settings.METADATA_CACHE_SIZE > 0:
+                self.metadata_storage = CachedMetadataStorage(
+                    self.metadata_storage,
+                    max_size=settings.METADATA_CACHE_SIZE,
+                    ttl=settings.METADATA_CACHE_TTL,
+                )
+            self.delta_cache = (
+                ReconstructionCache(settings.DELTA_CACHE_BYTES)
+                if settings.DELTA_CACHE_BYTES
+                else None
+            )
+            self._rebuild_locks: Dict[Tuple[str, str], threading.Lock] = {}
+            self._rebuild_locks_guard = threading.Lock()
+            self.events = EventLog(settings.EVENTS_BUFFER_SIZE)
             logger.info("Successfully initialized ModelRegistry")
         except Exception as e:
             logger.error(f"Failed to initialize ModelRegistry: {str(e)}")
             raise RegistryError(f"Registry initialization failed: {str(e)}")
 
-    def _generate_storage_path(self, metadata: Dict[str, Any]) -> str:
-        """Generate storage path for model file."""
-        return f"{metadata['id']}_{metadata['name']}_" f"{metadata['version']}.{metadata['file_extension']}"
+    def _generate_storage_path(self, digest: str) -> str:
+        """Generate the content-addressed storage path of a model file."""
+        return f"sha256-{digest}"
+
+    def _blob_storage_info(
+        self, file_path: str, bucket: str, stored: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the storage information of a content-addressed file from its blob or stat."""
+        return {
+            "path": file_path,
+            "bucket": bucket,
+            **{key: stored[key] for key in BLOB_FIELDS if key in stored},
+        }
+
+    def _check_new_version(self, metadata: Dict[str, Any]) -> None:
+        """Raise DuplicateModelError if the model version is already registered."""
+        versions = {"name": metadata["name"], "version": metadata["version"]}
+        if self.metadata_storage.list_metadata(versions, limit=1):
+            raise DuplicateModelError(f"{metadata['name']} v{metadata['version']}")
 
     def register_model(self, model_file: BinaryIO, metadata: Dict[str, Any]) -> ModelResponse:
         """
         Register a new model with its metadata.
 
+        Model files are stored once per storage group under the SHA-256 of
+        their content. The file is read once: it is hashed while it is stored
+        under a staging path, then copied to its content-addressed path inside
+        the storage backend. Registering bytes that are already stored adds a
+        reference to the existing blob and drops the staged copy.
+
+        Versions declaring a ``parent_version`` of the same model are stored
+        as a binary delta against the parent's content when that saves at
+        least half of the file and the delta chain stays within
+        ``DELTA_MAX_CHAIN``. Otherwise a full copy is stored.
+
         Parameters
         ----------
         model_file : BinaryIO
-            Binary file object containing the model data
+            Readable binary stream containing the model data. Seekable streams
+            are read again to encode a delta, others are read back from storage.
         metadata : Dict[str, Any]
             Dictionary containing model metadata including:
             - id : str
@@ -69,7 +191,8 @@ class ModelRegistry:
                 Model description
             - framework : str, optional
                 ML framework used
-            
+            - parent_version : str, optional
+                Registered version of the same model to store a delta against
 
         Returns
         -------
@@ -78,49 +201,775 @@ class ModelRegistry:
 
         Raises
         ------
+        DuplicateModelError
+            If a model with the same name and version is already registered
+        ValidationError
+            If the parent version is not registered
+        ResourceBusyError
+            If the same content is being deleted, the caller retries
         RegistryError
             If registration process fails
         """
+        bucket = metadata["storage_group"]
+        staged = f"upload-{uuid.uuid4().hex}"
+        staged_info = None
+        blob = None
         try:
-            # Generate storage path
-            file_path = self._generate_storage_path(metadata)
+            self._check_new_version(metadata)
 
-            # Store model file
-            storage_info = self.model_storage.store_model(model_file, file_path, metadata["storage_group"],metadata["tags"])
+            # Object tags are set by the first registration of the content
+            staged_info = self.model_storage.store_model(
+                model_file,
+                staged,
+                bucket,
+                metadata["tags"],
+                settings.ZSTD_STORAGE_GROUPS.get(bucket),
+            )
+            digest = staged_info["sha256"]
+            file_path = self._generate_storage_path(digest)
+            blob = self._acquire_blob(bucket, digest, file_path)
 
-            # Prepare complete metadata
-            full_metadata = {**metadata, "storage_path": file_path, "storage_info": storage_info, "registration_time": datetime.datetime.now(datetime.timezone.utc)}
+            if blob["ready"]:
+                logger.info(f"Reusing stored model file {bucket}/{file_path}")
+                storage_info = self._blob_storage_info(file_path, bucket, blob)
+            else:
+                storage_info = self._store_delta(
+                    model_file, staged, staged_info["size"], file_path, digest, metadata
+                )
+                if storage_info is None:
+                    copied = self.model_storage.copy_model(staged, bucket, file_path, bucket)
+                    storage_info = self._blob_storage_info(file_path, bucket, copied)
+                self.metadata_storage.mark_blob_ready(bucket, digest, storage_info)
+            storage_info["sha256"] = digest
 
-            # Store metadata
-            metadata_id = self.metadata_storage.store_metadata(full_metadata)
+            return self._store_registration(metadata, storage_info)
 
-            logger.info(f"Successfully registered model: {metadata['id']} v{metadata['version']}")
+        except Exception as e:
+            logger.error(f"Model registration failed: {str(e)}")
+            if blob is not None:
+                self._release_blob(bucket, digest, file_path)
+            if isinstance(e, (DuplicateModelError, ValidationError, ResourceBusyError)):
+                raise
+            raise RegistryError(f"Failed to register model: {str(e)}")
 
-            return ModelResponse(
-                id=metadata["id"],
-                name=metadata["name"],
-                version=metadata["version"],
-                metadata_id=metadata_id,
-                storage_group=metadata["storage_group"],
-                storage_path=file_path,
-                created_at=datetime.datetime.now(datetime.timezone.utc),
-                description=metadata.get("description"),
-                framework=metadata.get("framework"),
-            )
+        finally:
+            # The staged file is only a copy, it is either moved or dropped
+            if staged_info is not None:
+                try:
+                    self.model_storage.delete_model(staged, bucket)
+                except Exception as e:
+                    logger.warning(f"Failed to delete staged upload {bucket}/{staged}: {str(e)}")
+
+    def register_model_by_hash(self, metadata: Dict[str, Any], digest: str) -> ModelResponse:
+        """
+        Register a model whose content is already stored, without uploading it.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            Dictionary containing model metadata, see ``register_model``
+        digest : str
+            SHA-256 hex digest of the model file
+
+        Returns
+        -------
+        ModelResponse
+            Object containing the stored model information
+
+        Raises
+        ------
+        ModelNotFoundError
+            If no model file with this digest is stored, the caller then uploads it
+        DuplicateModelError
+            If a model with the same name and version is already registered
+        ResourceBusyError
+            If the same content is being deleted, the caller retries
+        RegistryError
+            If registration process fails
+        """
+        bucket = metadata["storage_group"]
+        file_path = self._generate_storage_path(digest)
+        blob = None
+        try:
+            self._check_new_version(metadata)
+
+            # Content stored in another storage group is copied inside the object store
+            find_blob = self.metadata_storage.find_blob
+            source = find_blob(digest, bucket) or find_blob(digest)
+            if source is None:
+                raise ModelNotFoundError(digest)
+
+            blob = self._acquire_blob(bucket, digest, file_path)
+            if blob["ready"]:
+                storage_info = self._blob_storage_info(file_path, bucket, blob)
+            elif source["bucket"] != bucket and source.get("codec") != DELTA:
+                copied = self.model_storage.copy_model(
+                    source["path"], source["bucket"], file_path, bucket
+                )
+                storage_info = self._blob_storage_info(file_path, bucket, copied)
+                self.metadata_storage.mark_blob_ready(bucket, digest, storage_info)
+            else:
+                # The blob was deleted since it was looked up, or is a delta whose
+                # base only exists in its own storage group
+                raise ModelNotFoundError(digest)
+            storage_info["sha256"] = digest
+
+            return self._store_registration(metadata, storage_info)
 
         except Exception as e:
+            if blob is not None:
+                self._release_blob(bucket, digest, file_path)
+            if isinstance(e, (DuplicateModelError, ModelNotFoundError, ResourceBusyError)):
+                raise
             logger.error(f"Model registration failed: {str(e)}")
-            self._cleanup_failed_registration(file_path, metadata["storage_group"])
             raise RegistryError(f"Failed to register model: {str(e)}")
 
-   
+    def _store_delta(
+        self,
+        model_file: BinaryIO,
+        staged: str,
+        size: int,
+        file_path: str,
+        digest: str,
+        metadata: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Store a model file as a delta against its declared parent version.
+
+        Returns the storage information of the stored delta, or None if the
+        file has to be stored as a full copy: no parent declared, the parent
+        is stored elsewhere, the chain is too long or the delta is too large.
+        The delta holds a reference to its base blob. The content is read
+        again from ``model_file`` if it can seek, otherwise from its staged
+        copy ``staged``.
+        """
+        if not metadata.get("parent_version"):
+            return None
+        parents = self.metadata_storage.list_metadata(
+            {"name": metadata["name"], "version": metadata["parent_version"]}, limit=1
+        )
+        if not parents:
+            raise ValidationError(
+                f"Parent version {metadata['parent_version']} of {metadata['name']} "
+                "is not registered"
+            )
+
+        bucket = metadata["storage_group"]
+        parent = parents[0]["storage_info"]
+        depth = parent.get("delta_depth", 0) + 1
+        if parent["bucket"] != bucket or "sha256" not in parent or parent["sha256"] == digest:
+            return None
+        if depth > settings.DELTA_MAX_CHAIN:
+            logger.info(
+                f"Delta chain of {metadata['name']} reached {settings.DELTA_MAX_CHAIN}, "
+                "storing a full copy"
+            )
+            return None
+        if max(size, parent["size"]) > settings.DELTA_MAX_SIZE:
+            return None
+
+        base_digest = parent["sha256"]
+        base_path = self._generate_storage_path(base_digest)
+        with contextlib.ExitStack() as stack:
+            if getattr(model_file, "seekable", lambda: False)():
+                model_file.seek(0)
+            else:
+                model_file = stack.enter_context(self._open_file(staged, bucket))
+            base = stack.enter_context(self._open_file(base_path, bucket))
+            delta = stack.enter_context(self._spool())
+            delta_size = encode_delta(base, model_file, delta, max_size=int(size * MAX_DELTA_RATIO))
+            if delta_size is None:
+                logger.info(
+                    f"Delta against {metadata['parent_version']} saves too little, "
+                    "storing a full copy"
+                )
+                return None
+            delta.seek(0)
 
-    def _cleanup_failed_registration(self, file_path: str, bucket: str) -> None:
-        """Clean up resources after failed registration."""
+            # The base must outlive the delta, it is released with the delta
+            base_blob = self.metadata_storage.acquire_blob(bucket, base_digest, base_path)
+            if base_blob is None or not base_blob["ready"]:
+                if base_blob is not None:
+                    self._release_blob(bucket, base_digest, base_path)
+                return None
+            try:
+                object_metadata = {
+                    "codec": DELTA,
+                    "content-size": str(size),
+                    "delta-base": base_digest,
+                    "delta-depth": str(depth),
+                }
+                stored = self.model_storage.store_model(
+                    delta, file_path, bucket, metadata["tags"], object_metadata=object_metadata
+                )
+            except Exception:
+                self._release_blob(bucket, base_digest, base_path)
+                raise
+
+        logger.info(
+            f"Stored {file_path} as a {delta_size} byte delta of {size} bytes against {base_path}"
+        )
+        return {
+            **stored,
+            "size": size,
+            "sha256": digest,
+            "codec": DELTA,
+            "stored_size": delta_size,
+            "delta_base": base_digest,
+            "delta_depth": depth,
+        }
+
+    @staticmethod
+    def _spool() -> BinaryIO:
+        """Return a temporary file for model content that stays in memory only while small."""
+        return tempfile.SpooledTemporaryFile(max_size=settings.DOWNLOAD_CHUNK_SIZE)
+
+    def _open_file(self, file_path: str, bucket: str) -> BinaryIO:
+        """
+        Return a temporary file with the full content of a stored model file.
+
+        Compressed files are decompressed and delta chains reconstructed while
+        they are streamed, so only reconstructions small enough for the
+        reconstruction cache are ever held in memory as a whole. Those are
+        rebuilt once however many readers ask for them at the same time.
+        """
+        cached = self.delta_cache.get((bucket, file_path)) if self.delta_cache is not None else None
+        if cached is not None:
+            return io.BytesIO(cached)
+
+        info = self.model_storage.stat_model(file_path, bucket)
+        if info.get("codec") != DELTA or not self._caches_reconstruction(info):
+            return self._read_file(file_path, bucket, info)
+
+        # Concurrent readers of a version, like the parts of a parallel download, rebuild it once
+        key = (bucket, file_path)
+        with self._rebuild_locks_guard:
+            lock = self._rebuild_locks.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                cached = self.delta_cache.get(key)
+                if cached is not None:
+                    return io.BytesIO(cached)
+                content = self._read_file(file_path, bucket, info)
+                self.delta_cache.set(key, content.read())
+                content.seek(0)
+                return content
+        finally:
+            with self._rebuild_locks_guard:
+                if self._rebuild_locks.get(key) is lock:
+                    del self._rebuild_locks[key]
+
+    def _read_file(self, file_path: str, bucket: str, info: Dict[str, Any]) -> BinaryIO:
+        """Decompress or reconstruct a stored model file into a temporary file."""
+        stored = ChunkReader(
+            self.model_storage.stream_model(file_path, bucket, settings.DOWNLOAD_CHUNK_SIZE)
+        )
+        content = self._spool()
+        try:
+            if info.get("codec") == DELTA:
+                with self._open_file(
+                    self._generate_storage_path(info["delta_base"]), bucket
+                ) as base:
+                    apply_delta(base, stored, info["size"], content, settings.DOWNLOAD_CHUNK_SIZE)
+            else:
+                chunks = iter(lambda: stored.read(settings.DOWNLOAD_CHUNK_SIZE), b"")
+                if info.get("codec"):
+                    chunks = decompress_chunks(chunks, settings.DOWNLOAD_CHUNK_SIZE)
+                for chunk in chunks:
+                    content.write(chunk)
+            content.seek(0)
+        except BaseException:
+            content.close()
+            raise
+        finally:
+            stored.close()
+        return content
+
+    def _caches_reconstruction(self, info: Dict[str, Any]) -> bool:
+        """Return whether the reconstruction of a delta version fits in the reconstruction cache."""
+        return self.delta_cache is not None and info["size"] <= self.delta_cache.max_bytes
+
+    def _store_registration(
+        self, metadata: Dict[str, Any], storage_info: Dict[str, Any]
+    ) -> ModelResponse:
+        """Store the metadata of a model whose file is stored and build the response."""
+        full_metadata = {
+            **metadata,
+            "storage_path": storage_info["path"],
+            "storage_info": storage_info,
+            "registration_time": datetime.datetime.now(datetime.timezone.utc),
+        }
+        metadata_id = self.metadata_storage.store_metadata(full_metadata)
+
+        logger.info(f"Successfully registered model: {metadata['id']} v{metadata['version']}")
+
+        response = ModelResponse(
+            id=metadata["id"],
+            name=metadata["name"],
+            version=metadata["version"],
+            metadata_id=metadata_id,
+            storage_group=metadata["storage_group"],
+            storage_path=storage_info["path"],
+            created_at=full_metadata["registration_time"],
+            description=metadata.get("description"),
+            framework=metadata.get("framework"),
+        )
+        self.events.publish(REGISTER, response.model_dump(mode="json"))
+        return response
+
+    def _acquire_blob(self, bucket: str, digest: str, file_path: str) -> Dict[str, Any]:
+        """
+        Add a reference to a stored model file.
+
+        Content that is being deleted cannot be referenced until the deletion
+        finished, ResourceBusyError tells the caller to retry. Deletions whose
+        lease expired because their process died or failed are taken over and
+        finished first.
+        """
+        blob = self.metadata_storage.acquire_blob(bucket, digest, file_path)
+        if blob is None:
+            owner = uuid.uuid4().hex
+            expired = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+                seconds=BLOB_DELETE_LEASE
+            )
+            tombstone = self.metadata_storage.reclaim_blob(bucket, digest, owner, expired)
+            if tombstone is not None:
+                logger.warning(f"Taking over the unfinished deletion of {bucket}/{file_path}")
+                self._delete_blob(bucket, digest, file_path, tombstone, owner)
+                blob = self.metadata_storage.acquire_blob(bucket, digest, file_path)
+        if blob is None:
+            raise ResourceBusyError(f"Model file {bucket}/{file_path} is being deleted")
+        return blob
+
+    def _release_blob(self, bucket: str, digest: str, file_path: str) -> None:
+        """Drop a reference to a stored model file and delete the file once unreferenced."""
+        try:
+            owner = uuid.uuid4().hex
+            blob = self.metadata_storage.release_blob(bucket, digest, owner)
+            if blob is not None:
+                self._delete_blob(bucket, digest, file_path, blob, owner)
+        except Exception as e:
+            logger.error(f"Releasing model file {bucket}/{file_path} failed: {str(e)}")
+
+    def _delete_blob(
+        self, bucket: str, digest: str, file_path: str, blob: Dict[str, Any], owner: str
+    ) -> None:
+        """
+        Delete the file of a blob marked as being deleted by ``owner``, then its record.
+
+        The record stays a tombstone until the file is gone, so the content
+        cannot be stored again under the same path and then deleted. If the
+        delete fails the tombstone is kept, along with the reference of a
+        delta to its base, until its lease expires and it is taken over.
+        """
         try:
             self.model_storage.delete_model(file_path, bucket)
+        except ModelNotFoundError:
+            # Never stored, or deleted by an earlier attempt
+            pass
+        if not self.metadata_storage.remove_blob(bucket, digest, owner):
+            # The lease expired and another process took the deletion over
+            return
+        logger.info(f"Deleted unreferenced model file {bucket}/{file_path}")
+        if blob.get("delta_base"):
+            self._release_blob(
+                bucket, blob["delta_base"], self._generate_storage_path(blob["delta_base"])
+            )
+
+    def delete_model(self, metadata_id: str) -> None:
+        """
+        Delete a registered model version.
+
+        The model file is deleted once no other registered version refers to
+        the same content.
+
+        Parameters
+        ----------
+        metadata_id : str
+            Metadata ID of the model
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the metadata ID is unknown
+        RegistryError
+            If deleting the metadata fails
+        """
+        try:
+            metadata = self.metadata_storage.get_metadata_many([metadata_id]).get(metadata_id)
+            if metadata is None:
+                raise ModelNotFoundError(metadata_id)
+            self.metadata_storage.delete_metadata(metadata_id)
+
+        except ModelNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to delete model: {str(e)}")
+            raise RegistryError(f"Failed to delete model: {str(e)}")
+
+        storage_info = metadata["storage_info"]
+        if "sha256" in storage_info:
+            self._release_blob(storage_info["bucket"], storage_info["sha256"], storage_info["path"])
+        else:
+            # Registered before content addressing, the file is not shared
+            try:
+                self.model_storage.delete_model(storage_info["path"], storage_info["bucket"])
+            except Exception as e:
+                logger.error(f"Failed to delete model file: {str(e)}")
+        self.events.publish(
+            DELETE,
+            {"metadata_id": metadata_id, "name": metadata["name"], "version": metadata["version"]},
+        )
+        logger.info(f"Deleted model: {metadata_id}")
+
+    def create_upload_session(
+        self, metadata: Dict[str, Any], digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Start a chunked upload session for a large model file.
+
+        Parts are uploaded independently (and in any order) into a MinIO
+        multipart upload staged next to the content-addressed files. The
+        model is only registered when the session is completed.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            Dictionary containing model metadata, see ``register_model``
+        digest : str, optional
+            Expected SHA-256 hex digest of the complete file, verified on completion
+
+        Returns
+        -------
+        Dict[str, Any]
+            Session ID, the largest accepted part size and whether parts may be
+            uploaded directly to storage through ``presigned_part_url``
+
+        Raises
+        ------
+        DuplicateModelError
+            If a model with the same name and version is already registered
+        RegistryError
+            If the session cannot be started
+        """
+        try:
+            self._check_new_version(metadata)
+
+            session_id = uuid.uuid4().hex
+            bucket = metadata["storage_group"]
+            path = f"upload-{session_id}"
+            upload_id = self.model_storage.create_multipart_upload(path, bucket)
+            self.metadata_storage.create_upload_session(
+                {
+                    "_id": session_id,
+                    "bucket": bucket,
+                    "path": path,
+                    "upload_id": upload_id,
+                    "metadata": metadata,
+                    "sha256": digest,
+                    "created_at": datetime.datetime.now(datetime.timezone.utc),
+                }
+            )
+            direct_upload = settings.PRESIGNED_URLS and (
+                self.model_storage.presigned_upload_part_url(
+                    path, bucket, upload_id, 1, settings.PRESIGNED_URL_TTL
+                )
+                is not None
+            )
+            logger.info(
+                f"Started upload session {session_id} for {metadata['name']} v{metadata['version']}"
+            )
+            return {
+                "session_id": session_id,
+                "max_part_size": settings.UPLOAD_PART_MAX_SIZE,
+                "direct_upload": direct_upload,
+            }
+
+        except DuplicateModelError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to start upload session: {str(e)}")
+            raise RegistryError(f"Failed to start upload session: {str(e)}")
+
+    def _get_upload_session(self, session_id: str) -> Dict[str, Any]:
+        """Return the state of an upload session or raise ModelNotFoundError."""
+        session = self.metadata_storage.get_upload_session(session_id)
+        if session is None:
+            raise ModelNotFoundError(f"upload session {session_id}")
+        return session
+
+    def get_upload_session(self, session_id: str) -> Dict[str, Any]:
+        """
+        Retrieve the progress of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        Dict[str, Any]
+            Session ID and the stored parts sorted by part number
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the session is unknown
+        """
+        session = self._get_upload_session(session_id)
+        parts = [
+            {"part_number": int(number), **part}
+            for number, part in sorted(session["parts"].items(), key=lambda item: int(item[0]))
+        ]
+        return {"session_id": session_id, "parts": parts}
+
+    def upload_session_part(self, session_id: str, part_number: int, data: bytes) -> Dict[str, Any]:
+        """
+        Store one part of an upload session.
+
+        Uploading the same part number again replaces the earlier attempt, so
+        clients can simply retry failed parts.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        part_number : int
+            Position of the part between 1 and 10000
+        data : bytes
+            Content of the part. All parts except the last must be at least 5 MiB.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Part number, ETag and size of the stored part
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the session is unknown
+        ValidationError
+            If the part number or size is out of range
+        RegistryError
+            If storing the part fails
+        """
+        if not 1 <= part_number <= 10000:
+            raise ValidationError("Part number must be between 1 and 10000")
+        if len(data) > settings.UPLOAD_PART_MAX_SIZE:
+            raise ValidationError(
+                f"Part exceeds the maximum size of {settings.UPLOAD_PART_MAX_SIZE} bytes"
+            )
+
+        session = self._get_upload_session(session_id)
+        try:
+            etag = self.model_storage.upload_part(
+                session["path"], session["bucket"], session["upload_id"], part_number, data
+            )
+            recorded = self.metadata_storage.record_upload_part(
+                session_id, part_number, etag, len(data)
+            )
+
         except Exception as e:
-            logger.error(f"Cleanup after failed registration failed: {str(e)}")
+            logger.error(f"Failed to upload part {part_number} of session {session_id}: {str(e)}")
+            raise RegistryError(f"Failed to upload part: {str(e)}")
+
+        if not recorded:
+            raise ModelNotFoundError(f"upload session {session_id}")
+        return {"part_number": part_number, "etag": etag, "size": len(data)}
+
+    def presigned_part_url(self, session_id: str, part_number: int) -> Dict[str, Any]:
+        """
+        Sign a URL uploading one part of an upload session directly to storage.
+
+        The part's bytes never pass through the registry. The client reports
+        the ``ETag`` storage answers with when completing the session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        part_number : int
+            Position of the part between 1 and 10000
+
+        Returns
+        -------
+        Dict[str, Any]
+            Part number, the URL to ``PUT`` the part to and its lifetime in seconds
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the session is unknown
+        ValidationError
+            If the part number is out of range or direct uploads are disabled
+        RegistryError
+            If the URL cannot be signed
+        """
+        if not 1 <= part_number <= 10000:
+            raise ValidationError("Part number must be between 1 and 10000")
+        if not settings.PRESIGNED_URLS:
+            raise ValidationError("Direct part uploads are disabled")
+
+        session = self._get_upload_session(session_id)
+        try:
+            url = self.model_storage.presigned_upload_part_url(
+                session["path"],
+                session["bucket"],
+                session["upload_id"],
+                part_number,
+                settings.PRESIGNED_URL_TTL,
+            )
+        except Exception as e:
+            logger.error(f"Failed to sign part {part_number} of session {session_id}: {str(e)}")
+            raise RegistryError(f"Failed to sign part upload: {str(e)}")
+
+        if url is None:
+            raise ValidationError("Storage backend does not support direct part uploads")
+        return {"part_number": part_number, "url": url, "expires_in": settings.PRESIGNED_URL_TTL}
+
+    def complete_upload_session(
+        self, session_id: str, parts: Optional[List[Dict[str, Any]]] = None
+    ) -> ModelResponse:
+        """
+        Assemble the parts of an upload session and register the model.
+
+        The assembled file is hashed, checked against the expected digest and
+        moved to its content-addressed path, or dropped when the same content
+        is already stored in the storage group.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        parts : List[Dict[str, Any]], optional
+            Part number, ETag and size of parts uploaded directly to storage,
+            replacing parts of the same number sent through the registry
+
+        Returns
+        -------
+        ModelResponse
+            Object containing the stored model information
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the session is unknown
+        ValidationError
+            If parts are missing or too small, or the content does not match the expected digest
+        DuplicateModelError
+            If a model with the same name and version was registered meanwhile
+        ResourceBusyError
+            If the same content is being deleted, the caller retries
+        RegistryError
+            If assembling or registering the model fails
+        """
+        session = self._get_upload_session(session_id)
+        for part in parts or []:
+            session["parts"][str(part["part_number"])] = {
+                "etag": part["etag"].strip('"'),
+                "size": part["size"],
+            }
+        numbers = sorted(int(number) for number in session["parts"])
+        if not numbers or numbers != list(range(1, len(numbers) + 1)):
+            raise ValidationError(f"Upload session {session_id} is missing parts")
+        small = [n for n in numbers[:-1] if session["parts"][str(n)]["size"] < 5 * 1024 * 1024]
+        if small:
+            raise ValidationError(
+                f"Parts {small} are smaller than 5 MiB, only the last part may be"
+            )
+
+        bucket, staged, metadata = session["bucket"], session["path"], session["metadata"]
+        parts = [(n, session["parts"][str(n)]["etag"]) for n in numbers]
+        blob = None
+        try:
+            assembled = self.model_storage.complete_multipart_upload(
+                staged, bucket, session["upload_id"], parts
+            )
+            self.metadata_storage.delete_upload_session(session_id)
+
+            hasher = hashlib.sha256()
+            for chunk in self.model_storage.stream_model(
+                staged, bucket, settings.DOWNLOAD_CHUNK_SIZE
+            ):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+            if session["sha256"] and digest != session["sha256"]:
+                raise ValidationError(
+                    f"Uploaded content has SHA-256 {digest}, expected {session['sha256']}"
+                )
+
+            file_path = self._generate_storage_path(digest)
+            blob = self._acquire_blob(bucket, digest, file_path)
+            if blob["ready"]:
+                logger.info(f"Reusing stored model file {bucket}/{file_path}")
+                storage_info = self._blob_storage_info(file_path, bucket, blob)
+            elif bucket in settings.ZSTD_STORAGE_GROUPS:
+                # Parts are stored as sent, compressing needs another pass through the registry
+                chunks = self.model_storage.stream_model(
+                    staged, bucket, settings.DOWNLOAD_CHUNK_SIZE
+                )
+                storage_info = self.model_storage.store_model(
+                    ChunkReader(chunks),
+                    file_path,
+                    bucket,
+                    metadata["tags"],
+                    settings.ZSTD_STORAGE_GROUPS[bucket],
+                    content_size=assembled["size"],
+                )
+                if storage_info["sha256"] != digest:
+                    raise ValidationError("Staged upload changed while it was compressed")
+                self.metadata_storage.mark_blob_ready(bucket, digest, storage_info)
+            else:
+                copied = self.model_storage.copy_model(staged, bucket, file_path, bucket)
+                storage_info = self._blob_storage_info(file_path, bucket, copied)
+                self.metadata_storage.mark_blob_ready(bucket, digest, storage_info)
+            storage_info["sha256"] = digest
+
+            return self._store_registration(metadata, storage_info)
+
+        except Exception as e:
+            logger.error(f"Completing upload session {session_id} failed: {str(e)}")
+            if blob is not None:
+                self._release_blob(bucket, digest, file_path)
+            if isinstance(e, (DuplicateModelError, ValidationError, ResourceBusyError)):
+                raise
+            raise RegistryError(f"Failed to complete upload session: {str(e)}")
+
+        finally:
+            # The assembled object is only a staging copy, it is either moved or rejected
+            try:
+                self.model_storage.delete_model(staged, bucket)
+            except Exception as e:
+                logger.warning(f"Failed to delete staged upload {bucket}/{staged}: {str(e)}")
+
+    def abort_upload_session(self, session_id: str) -> None:
+        """
+        Abort an upload session and discard its uploaded parts.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the session is unknown
+        RegistryError
+            If aborting fails
+        """
+        session = self._get_upload_session(session_id)
+        try:
+            self.model_storage.abort_multipart_upload(
+                session["path"], session["bucket"], session["upload_id"]
+            )
+            self.metadata_storage.delete_upload_session(session_id)
+            logger.info(f"Aborted upload session {session_id}")
+
+        except Exception as e:
+            logger.error(f"Failed to abort upload session {session_id}: {str(e)}")
+            raise RegistryError(f"Failed to abort upload session: {str(e)}")
 
     
     def get_model_file(self, file_path: str, bucket_name: Optional[str] = None) -> BinaryIO:
@@ -145,9 +994,7 @@ class ModelRegistry:
             If model retrieval fails
         """
         try:
-            model_file = self.model_storage.get_model(file_path, bucket_name)
-
-            return model_file
+            return self._open_file(file_path, bucket_name)
 
         except Exception as e:
             logger.error(f"Failed to retrieve model: {str(e)}")
@@ -156,6 +1003,175 @@ class ModelRegistry:
 
 
 
+    def presigned_download_url(
+        self, file_path: str, bucket_name: str, response_headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """
+        Sign a URL downloading a model file directly from storage.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage
+        bucket_name : str
+            Name of the storage bucket/group
+        response_headers : Dict[str, str], optional
+            Headers storage sets on the response, e.g. ``Content-Disposition``
+
+        Returns
+        -------
+        Optional[str]
+            URL valid for ``settings.PRESIGNED_URL_TTL`` seconds, or None if
+            presigned URLs are disabled or unsupported by the storage backend
+
+        Raises
+        ------
+        RegistryError
+            If the URL cannot be signed
+        """
+        if not settings.PRESIGNED_URLS:
+            return None
+        try:
+            return self.model_storage.presigned_download_url(
+                file_path, bucket_name, settings.PRESIGNED_URL_TTL, response_headers
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to sign download: {str(e)}")
+            raise RegistryError(f"Failed to sign download: {str(e)}")
+
+    def get_model_file_info(self, file_path: str, bucket_name: str) -> Dict[str, Any]:
+        """
+        Retrieve storage information (size, etag) of a model file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage
+        bucket_name : str
+            Name of the storage bucket/group
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information of the model file. ``size`` is the uncompressed
+            size, compressed files also report their ``codec`` and ``stored_size``.
+
+        Raises
+        ------
+        RegistryError
+            If the model file cannot be found or inspected
+        """
+        try:
+            return self.model_storage.stat_model(file_path, bucket_name)
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve model info: {str(e)}")
+            raise RegistryError(f"Failed to retrieve model info: {str(e)}")
+
+    def serves_ranges(self, file_info: Dict[str, Any]) -> bool:
+        """
+        Return whether ranges of a model file can be read without rebuilding it per request.
+
+        Compressed files are decompressed from their start on every read. Delta
+        versions are reconstructed on every read unless their content fits in
+        the reconstruction cache, so a parallel download of a larger version
+        would rebuild it once per part.
+
+        Parameters
+        ----------
+        file_info : Dict[str, Any]
+            Storage information of the file, see ``get_model_file_info``
+
+        Returns
+        -------
+        bool
+            True if ranges of the file should be served
+        """
+        codec = file_info.get("codec")
+        if codec == DELTA:
+            return self._caches_reconstruction(file_info)
+        return codec is None
+
+    def stream_model_file(
+        self,
+        file_path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+        codec: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream a model file from storage without loading it into memory.
+
+        Compressed files are streamed as stored unless their ``codec`` is
+        given, in which case the content is decompressed and ``offset`` and
+        ``length`` refer to the uncompressed content. Everything before
+        ``offset`` is decompressed and dropped, so the API does not serve
+        ranges of compressed files. Delta versions are
+        reconstructed into a temporary file, or read from the reconstruction
+        cache if possible.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the model file in storage
+        bucket_name : str
+            Name of the storage bucket/group
+        chunk_size : int, optional
+            Maximum size of each yielded chunk in bytes, by default 1 MiB
+        offset : int, optional
+            Start position of the content to read, by default 0
+        length : int, optional
+            Number of bytes to read, by default 0 (read to the end)
+        codec : str, optional
+            Codec of the stored file to decompress, see ``get_model_file_info``
+
+        Returns
+        -------
+        Iterator[bytes]
+            Iterator over the requested model file content
+
+        Raises
+        ------
+        RegistryError
+            If model retrieval fails
+        """
+        try:
+            if codec == DELTA:
+                return self._stream_file(
+                    self._open_file(file_path, bucket_name), chunk_size, offset, length
+                )
+            if codec:
+                chunks = self.model_storage.stream_model(file_path, bucket_name, chunk_size)
+                return decompress_chunks(chunks, chunk_size, offset, length)
+            return self.model_storage.stream_model(
+                file_path, bucket_name, chunk_size, offset, length
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to stream model: {str(e)}")
+            raise RegistryError(f"Failed to stream model: {str(e)}")
+
+    @staticmethod
+    def _stream_file(
+        content: BinaryIO, chunk_size: int, offset: int, length: int
+    ) -> Iterator[bytes]:
+        """Yield ``length`` bytes (0 for all) of ``content`` from ``offset`` and close it."""
+        try:
+            content.seek(offset)
+            remaining = length or -1
+            while remaining:
+                chunk = content.read(chunk_size if remaining < 0 else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining > 0:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            content.close()
+
     def get_metadata(self, metadata_id: str) -> Dict[str, Any]:
         """
         Retrieve metadata for a given metadata ID.
@@ -172,13 +1188,644 @@ class ModelRegistry:
 
         Raises
         ------
+        ModelNotFoundError
+            If the metadata ID is unknown
         RegistryError
             If metadata retrieval fails
         """
         try:
             return self.metadata_storage.get_metadata(metadata_id)
-        
+
+        except ModelNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to retrieve metadata: {str(e)}")
             raise RegistryError(f"Failed to retrieve metadata: {str(e)}")
 
+    def get_metadata_many(
+        self, metadata_ids: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Retrieve metadata for several metadata IDs in one storage lookup.
+
+        Parameters
+        ----------
+        metadata_ids : List[str]
+            Metadata IDs of the models, duplicates are looked up once
+
+        Returns
+        -------
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]
+            Found metadata keyed by ID, and an error message for every ID that
+            could not be resolved
+
+        Raises
+        ------
+        RegistryError
+            If the storage lookup fails
+        """
+        metadata_ids = list(dict.fromkeys(metadata_ids))
+        try:
+            results = self.metadata_storage.get_metadata_many(metadata_ids)
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve metadata batch: {str(e)}")
+            raise RegistryError(f"Failed to retrieve metadata batch: {str(e)}")
+
+        errors = {
+            metadata_id: f"Metadata not found: {metadata_id}"
+            for metadata_id in metadata_ids
+            if metadata_id not in results
+        }
+        return results, errors
+
+    def list_models(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List model metadata matching filters, one page at a time.
+
+        Parameters
+        ----------
+        filters : Dict[str, Any]
+            Filters as described in ``BaseMetadataStorage.list_metadata``
+        sort : str, optional
+            Field to order by, by default registration time
+        descending : bool, optional
+            Sort direction, by default newest first
+        limit : int, optional
+            Page size, by default 50
+        cursor : str, optional
+            Cursor returned with the previous page
+
+        Returns
+        -------
+        Tuple[List[Dict[str, Any]], Optional[str]]
+            Metadata of the page and the cursor of the next page, None on the last page
+
+        Raises
+        ------
+        ValidationError
+            If the cursor is malformed or belongs to a different sort order
+        RegistryError
+            If listing fails
+        """
+        after = _decode_cursor(cursor, sort, descending) if cursor else None
+        try:
+            # Fetch one extra document to learn whether another page follows
+            results = self.metadata_storage.list_metadata(
+                filters, sort=sort, descending=descending, limit=limit + 1, after=after
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to list models: {str(e)}")
+            raise RegistryError(f"Failed to list models: {str(e)}")
+
+        if len(results) <= limit:
+            return results, None
+        results = results[:limit]
+        return results, _encode_cursor(sort, descending, results[-1])
+
+    def get_latest_metadata(self, name: str) -> Dict[str, Any]:
+        """
+        Retrieve metadata of the most recently registered version of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+
+        Returns
+        -------
+        Dict[str, Any]
+            Metadata of the newest version
+
+        Raises
+        ------
+        ModelNotFoundError
+            If no version of the model is registered
+        RegistryError
+            If the lookup fails
+        """
+        try:
+            metadata = self.metadata_storage.get_latest_metadata(name)
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve latest metadata: {str(e)}")
+            raise RegistryError(f"Failed to retrieve latest metadata: {str(e)}")
+
+        if metadata is None:
+            raise ModelNotFoundError(name)
+        return metadata
+
+    def resolve_alias(self, name: str, alias: str) -> Dict[str, Any]:
+        """
+        Retrieve metadata of the model version an alias points to.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias such as ``production`` or ``staging``
+
+        Returns
+        -------
+        Dict[str, Any]
+            Metadata of the aliased version
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the alias is not set
+        RegistryError
+            If the lookup fails
+        """
+        try:
+            metadata_id = self.metadata_storage.get_alias(name, alias)
+            metadata = (
+                self.metadata_storage.get_metadata_many([metadata_id]).get(metadata_id)
+                if metadata_id
+                else None
+            )
+            if metadata is None:
+                raise ModelNotFoundError(f"{name}@{alias}")
+            return metadata
+
+        except ModelNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to resolve alias: {str(e)}")
+            raise RegistryError(f"Failed to resolve alias: {str(e)}")
+
+    def set_alias(self, name: str, alias: str, metadata_id: str) -> None:
+        """
+        Point an alias of a model to one of its registered versions.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias such as ``production`` or ``staging``
+        metadata_id : str
+            Metadata ID of the version
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the metadata ID is unknown
+        ValidationError
+            If the metadata ID belongs to a different model
+        RegistryError
+            If storing the alias fails
+        """
+        try:
+            metadata = self.metadata_storage.get_metadata_many([metadata_id]).get(metadata_id)
+            if metadata is None:
+                raise ModelNotFoundError(metadata_id)
+            if metadata["name"] != name:
+                raise ValidationError(
+                    f"Metadata {metadata_id} belongs to model {metadata['name']}, not {name}"
+                )
+            self.metadata_storage.set_alias(name, alias, metadata_id)
+
+        except RegistryError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to set alias: {str(e)}")
+            raise RegistryError(f"Failed to set alias: {str(e)}")
+
+        self.events.publish(ALIAS, {"name": name, "alias": alias, "metadata_id": metadata_id})
+
+    def delete_alias(self, name: str, alias: str) -> None:
+        """
+        Remove an alias of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias to remove
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the alias is not set
+        RegistryError
+            If removing the alias fails
+        """
+        try:
+            deleted = self.metadata_storage.delete_alias(name, alias)
+
+        except Exception as e:
+            logger.error(f"Failed to delete alias: {str(e)}")
+            raise RegistryError(f"Failed to delete alias: {str(e)}")
+
+        if not deleted:
+            raise ModelNotFoundError(f"{name}@{alias}")
+        self.events.publish(ALIAS, {"name": name, "alias": alias, "metadata_id": None})
+
+    def invalidate_metadata(self, metadata_id: str) -> None:
+        """
+        Drop cached metadata after it was updated or deleted.
+
+        Parameters
+        ----------
+        metadata_id : str
+            Metadata ID of the model
+        """
+        if isinstance(self.metadata_storage, CachedMetadataStorage):
+            self.metadata_storage.invalidate(metadata_id)
+
+    def metadata_cache_stats(self) -> Dict[str, Any]:
+        """
+        Return statistics of the metadata read cache.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Cache size, hits, misses, evictions and hit ratio, or an empty
+            dictionary if the cache is disabled
+        """
+        if isinstance(self.metadata_storage, CachedMetadataStorage):
+            return self.metadata_storage.stats()
+        return {}
+
+    def file_cache_stats(self) -> Dict[str, Any]:
+        """
+        Return statistics of the model file disk cache.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Number and total size of cached files and running fills, or an
+            empty dictionary if the cache is disabled
+        """
+        if isinstance(self.model_storage, CachedModelStorage):
+            return self.model_storage.stats()
+        return {}
+
+    def prepare(self) -> None:
+        """
+        Connect to the storage backends and create the known buckets.
+
+        Meant to run once at startup, so the first requests do not pay for
+        connection setup or bucket existence checks. The known buckets are
+        ``MINIO_BUCKET``, ``STARTUP_BUCKETS`` and the ``ZSTD_STORAGE_GROUPS``.
+
+        Raises
+        ------
+        RegistryError
+            If a backend cannot be reached or a bucket cannot be created
+        """
+        buckets = {settings.MINIO_BUCKET, *settings.STARTUP_BUCKETS, *settings.ZSTD_STORAGE_GROUPS}
+        try:
+            self.model_storage.prepare_buckets(sorted(buckets))
+            self.metadata_storage.ping()
+            logger.info(f"Prepared storage backends and buckets: {', '.join(sorted(buckets))}")
+        except Exception as e:
+            logger.error(f"Failed to prepare storage backends: {str(e)}")
+            raise RegistryError(f"Failed to prepare storage backends: {str(e)}")
+
+    def check_backends(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Ping the model file and metadata backends.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            ``status`` (``"ok"`` or ``"error"``), ``latency_ms`` and, on failure,
+            ``error`` of the ``model_storage`` and ``metadata_storage`` backends
+        """
+        checks = {}
+        for name, storage in (
+            ("model_storage", self.model_storage),
+            ("metadata_storage", self.metadata_storage),
+        ):
+            start = time.perf_counter()
+            try:
+                storage.ping()
+                checks[name] = {"status": "ok"}
+            except Exception as e:
+                logger.error(f"Backend check of {name} failed: {str(e)}")
+                checks[name] = {"status": "error", "error": str(e)}
+            checks[name]["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return checks
+
+
+class AsyncModelRegistry:
+    """
+    Asyncio facade over ModelRegistry for use inside async API routes.
+
+    The storage clients (pymongo, minio) are blocking, so every call is run on
+    a bounded thread pool instead of the event loop. Model file transfers and
+    short lookups (metadata reads, stats) use separate pools, so a burst of
+    large uploads cannot delay metadata reads or health checks.
+
+    Parameters
+    ----------
+    registry : ModelRegistry
+        Synchronous registry doing the actual work
+    transfer_workers : int
+        Maximum number of concurrent model file transfers
+    lookup_workers : int
+        Maximum number of concurrent metadata and stat lookups
+
+    Attributes
+    ----------
+    registry : ModelRegistry
+        Wrapped synchronous registry
+    """
+
+    def __init__(self, registry: ModelRegistry, transfer_workers: int, lookup_workers: int):
+        self.registry = registry
+        self._transfer_executor = ThreadPoolExecutor(
+            max_workers=transfer_workers, thread_name_prefix="registry-transfer"
+        )
+        self._lookup_executor = ThreadPoolExecutor(
+            max_workers=lookup_workers, thread_name_prefix="registry-lookup"
+        )
+
+    async def _run(self, executor: ThreadPoolExecutor, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on ``executor`` and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+    async def register_model(self, model_file: BinaryIO, metadata: Dict[str, Any]) -> ModelResponse:
+        """Register a model, see ``ModelRegistry.register_model``."""
+        return await self._run(
+            self._transfer_executor, self.registry.register_model, model_file, metadata
+        )
+
+    async def register_model_by_hash(self, metadata: Dict[str, Any], digest: str) -> ModelResponse:
+        """Register a model by content digest, see ``ModelRegistry.register_model_by_hash``."""
+        return await self._run(
+            self._transfer_executor, self.registry.register_model_by_hash, metadata, digest
+        )
+
+    async def create_upload_session(
+        self, metadata: Dict[str, Any], digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Start a chunked upload session, see ``ModelRegistry.create_upload_session``."""
+        return await self._run(
+            self._lookup_executor, self.registry.create_upload_session, metadata, digest
+        )
+
+    async def get_upload_session(self, session_id: str) -> Dict[str, Any]:
+        """Retrieve upload session progress, see ``ModelRegistry.get_upload_session``."""
+        return await self._run(self._lookup_executor, self.registry.get_upload_session, session_id)
+
+    async def upload_session_part(
+        self, session_id: str, part_number: int, data: bytes
+    ) -> Dict[str, Any]:
+        """Store a part of an upload session, see ``ModelRegistry.upload_session_part``."""
+        return await self._run(
+            self._transfer_executor,
+            self.registry.upload_session_part,
+            session_id,
+            part_number,
+            data,
+        )
+
+    async def presigned_part_url(self, session_id: str, part_number: int) -> Dict[str, Any]:
+        """Sign a direct part upload, see ``ModelRegistry.presigned_part_url``."""
+        return await self._run(
+            self._lookup_executor, self.registry.presigned_part_url, session_id, part_number
+        )
+
+    async def complete_upload_session(
+        self, session_id: str, parts: Optional[List[Dict[str, Any]]] = None
+    ) -> ModelResponse:
+        """Complete an upload session, see ``ModelRegistry.complete_upload_session``."""
+        return await self._run(
+            self._transfer_executor, self.registry.complete_upload_session, session_id, parts
+        )
+
+    async def abort_upload_session(self, session_id: str) -> None:
+        """Abort an upload session, see ``ModelRegistry.abort_upload_session``."""
+        await self._run(self._lookup_executor, self.registry.abort_upload_session, session_id)
+
+    async def delete_model(self, metadata_id: str) -> None:
+        """Delete a model version, see ``ModelRegistry.delete_model``."""
+        await self._run(self._lookup_executor, self.registry.delete_model, metadata_id)
+
+    async def get_metadata(self, metadata_id: str) -> Dict[str, Any]:
+        """Retrieve model metadata, see ``ModelRegistry.get_metadata``."""
+        return await self._run(self._lookup_executor, self.registry.get_metadata, metadata_id)
+
+    async def presigned_download_url(
+        self, file_path: str, bucket_name: str, response_headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """Sign a direct download, see ``ModelRegistry.presigned_download_url``."""
+        return await self._run(
+            self._lookup_executor,
+            self.registry.presigned_download_url,
+            file_path,
+            bucket_name,
+            response_headers,
+        )
+
+    async def get_model_file_info(self, file_path: str, bucket_name: str) -> Dict[str, Any]:
+        """Retrieve storage information of a file, see ``ModelRegistry.get_model_file_info``."""
+        return await self._run(
+            self._lookup_executor, self.registry.get_model_file_info, file_path, bucket_name
+        )
+
+    async def stream_model_file(
+        self,
+        file_path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+        codec: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Open a model file stream, see ``ModelRegistry.stream_model_file``.
+
+        Opening the stream is awaited, so missing files raise here. Each chunk
+        is then read on the transfer pool.
+
+        Returns
+        -------
+        AsyncIterator[bytes]
+            Asynchronous iterator over the requested model file content
+        """
+        iterator = await self._run(
+            self._lookup_executor,
+            self.registry.stream_model_file,
+            file_path,
+            bucket_name,
+            chunk_size,
+            offset,
+            length,
+            codec,
+        )
+        return self._iterate(iterator)
+
+    async def _iterate(self, iterator: Iterator[bytes]) -> AsyncIterator[bytes]:
+        """Pull chunks of a blocking iterator on the transfer pool and close it there."""
+        done = object()
+        pending = None
+        try:
+            while True:
+                pending = self._transfer_executor.submit(next, iterator, done)
+                chunk = await asyncio.wrap_future(pending)
+                if chunk is done:
+                    break
+                yield chunk
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                self._close_after(pending, close)
+
+    def _close_after(self, pending: Optional[Future], close: Callable[[], None]) -> None:
+        """
+        Run ``close`` on the transfer pool once the ``pending`` call finished.
+
+        A consumer cancelled while waiting for a chunk leaves its ``next()``
+        running on the pool, and a generator cannot be closed while it is
+        executing, so the close is queued behind it instead of awaited.
+        """
+        def submit(_: Optional[Future] = None) -> None:
+            try:
+                self._transfer_executor.submit(close)
+            except RuntimeError:
+                # The pool is shut down, nothing else runs the iterator anymore
+                close()
+
+        if pending is None:
+            submit()
+        else:
+            pending.add_done_callback(submit)
+
+    async def get_metadata_many(
+        self, metadata_ids: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Retrieve metadata of several models, see ``ModelRegistry.get_metadata_many``."""
+        return await self._run(self._lookup_executor, self.registry.get_metadata_many, metadata_ids)
+
+    async def list_models(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List model metadata, see ``ModelRegistry.list_models``."""
+        return await self._run(
+            self._lookup_executor,
+            self.registry.list_models,
+            filters,
+            sort,
+            descending,
+            limit,
+            cursor,
+        )
+
+    async def get_latest_metadata(self, name: str) -> Dict[str, Any]:
+        """Retrieve the newest version of a model, see ``ModelRegistry.get_latest_metadata``."""
+        return await self._run(self._lookup_executor, self.registry.get_latest_metadata, name)
+
+    async def resolve_alias(self, name: str, alias: str) -> Dict[str, Any]:
+        """Retrieve the version an alias points to, see ``ModelRegistry.resolve_alias``."""
+        return await self._run(self._lookup_executor, self.registry.resolve_alias, name, alias)
+
+    async def set_alias(self, name: str, alias: str, metadata_id: str) -> None:
+        """Point an alias to a version, see ``ModelRegistry.set_alias``."""
+        await self._run(self._lookup_executor, self.registry.set_alias, name, alias, metadata_id)
+
+    async def delete_alias(self, name: str, alias: str) -> None:
+        """Remove an alias, see ``ModelRegistry.delete_alias``."""
+        await self._run(self._lookup_executor, self.registry.delete_alias, name, alias)
+
+    def invalidate_metadata(self, metadata_id: str) -> None:
+        """Drop cached metadata, see ``ModelRegistry.invalidate_metadata``."""
+        self.registry.invalidate_metadata(metadata_id)
+
+    def metadata_cache_stats(self) -> Dict[str, Any]:
+        """Return metadata cache statistics, see ``ModelRegistry.metadata_cache_stats``."""
+        return self.registry.metadata_cache_stats()
+
+    def file_cache_stats(self) -> Dict[str, Any]:
+        """Return disk cache statistics, see ``ModelRegistry.file_cache_stats``."""
+        return self.registry.file_cache_stats()
+
+    def serves_ranges(self, file_info: Dict[str, Any]) -> bool:
+        """Return whether ranges of a file are served, see ``ModelRegistry.serves_ranges``."""
+        return self.registry.serves_ranges(file_info)
+
+    def event_stats(self) -> Dict[str, Any]:
+        """Return statistics of the change event buffer, see ``EventLog.stats``."""
+        return self.registry.events.stats()
+
+    async def watch_events(
+        self, last_event_id: Optional[str] = None, heartbeat: float = 15.0
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield registry change events as they are published.
+
+        Parameters
+        ----------
+        last_event_id : str, optional
+            ID of the last event the client received, the stream resumes after
+            it. Without it only events published from now on are yielded.
+        heartbeat : float, optional
+            Seconds without events after which None is yielded, by default 15
+
+        Yields
+        ------
+        Optional[Dict[str, Any]]
+            Events in order, a ``reset`` event if events after ``last_event_id``
+            are no longer buffered, and None as heartbeat
+        """
+        events = self.registry.events
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(wake.set)
+
+        position = events.position if last_event_id is None else events.parse_id(last_event_id)
+        events.subscribe(notify)
+        try:
+            while True:
+                # Cleared before reading, so an event published meanwhile wakes the wait below
+                wake.clear()
+                pending = None if position is None else events.read(position)
+                if pending is None:
+                    position = events.position
+                    yield {"id": events.event_id(position), "type": RESET, "time": None, "data": {}}
+                    continue
+                for event in pending:
+                    yield event
+                if pending:
+                    position = events.parse_id(pending[-1]["id"])
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            events.unsubscribe(notify)
+
+    async def prepare(self) -> None:
+        """Connect to the backends and create the known buckets, see ``ModelRegistry.prepare``."""
+        await self._run(self._lookup_executor, self.registry.prepare)
+
+    async def check_backends(self) -> Dict[str, Dict[str, Any]]:
+        """Ping the storage backends, see ``ModelRegistry.check_backends``."""
+        return await self._run(self._lookup_executor, self.registry.check_backends)
+
+    def close(self) -> None:
+        """Shut down the thread pools."""
+        self._transfer_executor.shutdown(wait=False, cancel_futures=True)
+        self._lookup_executor.shutdown(wait=False, cancel_futures=True)
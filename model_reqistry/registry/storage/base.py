@@ -6,7 +6,11 @@ providing standard interfaces that must be implemented by concrete storage class
 """
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Dict, Any
+import datetime
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+# Storage information of a stored model file that blob records keep and reuse
+BLOB_FIELDS = ("size", "etag", "codec", "stored_size", "delta_base", "delta_depth")
 
 
 class BaseStorage(ABC):
@@ -20,6 +24,7 @@ class BaseStorage(ABC):
     See Also
     --------
     MinioStorage : Implementation using MinIO object storage
+    FilesystemStorage : Implementation using a local directory tree
     """
 
     @abstractmethod
@@ -46,6 +51,145 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def copy_model(
+        self, source_path: str, source_bucket: str, path: str, bucket_name: str
+    ) -> Dict[str, Any]:
+        """
+        Copy a model file within the storage backend.
+
+        Parameters
+        ----------
+        source_path : str
+            Path of the file to copy
+        source_bucket : str
+            Storage group containing the file to copy
+        path : str
+            Destination path
+        bucket_name : str
+            Destination storage group
+
+        Returns
+        -------
+        dict
+            Storage information of the copy including at least size and etag
+
+        Raises
+        ------
+        StorageError
+            If copying fails
+        ModelNotFoundError
+            If the source file does not exist
+        """
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, path: str, bucket_name: str) -> str:
+        """
+        Start a multipart upload whose parts can be stored independently.
+
+        Parameters
+        ----------
+        path : str
+            Storage path of the assembled file
+        bucket_name : str
+            Storage group to store in
+
+        Returns
+        -------
+        str
+            Identifier of the multipart upload
+
+        Raises
+        ------
+        StorageError
+            If the upload cannot be started
+        """
+        pass
+
+    @abstractmethod
+    def upload_part(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        """
+        Store one part of a multipart upload.
+
+        Parameters
+        ----------
+        path : str
+            Storage path of the assembled file
+        bucket_name : str
+            Storage group to store in
+        upload_id : str
+            Identifier returned by ``create_multipart_upload``
+        part_number : int
+            Position of the part, starting at 1
+        data : bytes
+            Content of the part
+
+        Returns
+        -------
+        str
+            ETag of the stored part
+
+        Raises
+        ------
+        StorageError
+            If storing the part fails
+        """
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self, path: str, bucket_name: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """
+        Assemble the stored parts of a multipart upload into one file.
+
+        Parameters
+        ----------
+        path : str
+            Storage path of the assembled file
+        bucket_name : str
+            Storage group to store in
+        upload_id : str
+            Identifier returned by ``create_multipart_upload``
+        parts : list of (int, str)
+            Part numbers and ETags in ascending order
+
+        Returns
+        -------
+        dict
+            Storage information of the assembled file including size and etag
+
+        Raises
+        ------
+        StorageError
+            If assembling the file fails
+        """
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, path: str, bucket_name: str, upload_id: str) -> None:
+        """
+        Abort a multipart upload and discard its stored parts.
+
+        Parameters
+        ----------
+        path : str
+            Storage path of the assembled file
+        bucket_name : str
+            Storage group to store in
+        upload_id : str
+            Identifier returned by ``create_multipart_upload``
+
+        Raises
+        ------
+        StorageError
+            If aborting fails
+        """
+        pass
+
     @abstractmethod
     def get_model(self, path: str) -> BinaryIO:
         """
@@ -70,6 +214,72 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def stat_model(self, path: str, bucket_name: str) -> Dict[str, Any]:
+        """
+        Retrieve storage information of a model file without reading it.
+
+        Parameters
+        ----------
+        path : str
+            Path where the model is stored
+        bucket_name : str
+            Name of the storage group containing the model
+
+        Returns
+        -------
+        dict
+            Storage information including at least size and etag
+
+        Raises
+        ------
+        StorageError
+            If the lookup fails
+        ModelNotFoundError
+            If the model file does not exist
+        """
+        pass
+
+    @abstractmethod
+    def stream_model(
+        self,
+        path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Stream a model file in chunks.
+
+        Parameters
+        ----------
+        path : str
+            Path where the model is stored
+        bucket_name : str
+            Name of the storage group containing the model
+        chunk_size : int, optional
+            Maximum size of each yielded chunk in bytes
+        offset : int, optional
+            Start position of the content to read, by default 0
+        length : int, optional
+            Number of bytes to read, by default 0 (read to the end)
+
+        Returns
+        -------
+        Iterator[bytes]
+            Iterator over the file content. Resources are released when the
+            iterator is exhausted or closed.
+
+        Raises
+        ------
+        StorageError
+            If retrieving the model fails
+        ModelNotFoundError
+            If the model file does not exist
+        """
+        pass
+
     @abstractmethod
     def delete_model(self, path: str) -> None:
         """
@@ -89,6 +299,106 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def prepare_buckets(self, bucket_names: Iterable[str]) -> None:
+        """
+        Create buckets ahead of their first use.
+
+        Called once at startup, so the connection to the backend is opened and
+        uploads to these buckets do not have to check that they exist.
+
+        Parameters
+        ----------
+        bucket_names : Iterable[str]
+            Names of the buckets (storage groups) to create if missing
+
+        Raises
+        ------
+        StorageError
+            If a bucket cannot be created
+        """
+        pass
+
+    @abstractmethod
+    def presigned_download_url(
+        self,
+        path: str,
+        bucket_name: str,
+        expires: int,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Create a short-lived URL downloading a model file directly from the backend.
+
+        Parameters
+        ----------
+        path : str
+            Path of the model file within the bucket
+        bucket_name : str
+            Name of the bucket
+        expires : int
+            Seconds the URL stays valid
+        response_headers : Dict[str, str], optional
+            Headers the backend sets on the response, e.g. ``Content-Encoding``
+
+        Returns
+        -------
+        Optional[str]
+            Signed URL, or None if the backend cannot serve clients directly
+
+        Raises
+        ------
+        StorageError
+            If the URL cannot be signed
+        """
+        pass
+
+    @abstractmethod
+    def presigned_upload_part_url(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, expires: int
+    ) -> Optional[str]:
+        """
+        Create a short-lived URL uploading one part of a multipart upload with ``PUT``.
+
+        The ``ETag`` header of the backend's response identifies the stored part.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket
+        upload_id : str
+            Identifier returned by ``create_multipart_upload``
+        part_number : int
+            Part number between 1 and 10000
+        expires : int
+            Seconds the URL stays valid
+
+        Returns
+        -------
+        Optional[str]
+            Signed URL, or None if the backend cannot accept parts from clients directly
+
+        Raises
+        ------
+        StorageError
+            If the URL cannot be signed
+        """
+        pass
+
+    @abstractmethod
+    def ping(self) -> None:
+        """
+        Check that the storage backend is reachable.
+
+        Raises
+        ------
+        StorageError
+            If the backend does not answer
+        """
+        pass
+
 
 class BaseMetadataStorage(ABC):
     """
@@ -101,6 +411,7 @@ class BaseMetadataStorage(ABC):
     See Also
     --------
     MongoStorage : Implementation using MongoDB
+    SQLiteMetadataStorage : Implementation using an embedded SQLite database
     """
 
     @abstractmethod
@@ -142,12 +453,463 @@ class BaseMetadataStorage(ABC):
         dict
             Dictionary containing the model metadata
 
+        Raises
+        ------
+        ModelNotFoundError
+            If no metadata exists for the given ID
+        RegistryError
+            If retrieving the metadata fails
+        """
+        pass
+
+    @abstractmethod
+    def get_metadata_many(self, model_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata of several models in one lookup.
+
+        Parameters
+        ----------
+        model_ids : list of str
+            Unique identifiers of the models
+
+        Returns
+        -------
+        dict
+            Metadata dictionaries keyed by model ID. IDs that do not exist or
+            are not valid identifiers are left out.
+
         Raises
         ------
         StorageError
             If retrieving the metadata fails
-        ValueError
-            If no metadata exists for the given ID
+        """
+        pass
+
+    @abstractmethod
+    def list_metadata(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        after: Optional[Tuple[Any, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List model metadata matching filters, one keyset page at a time.
+
+        Parameters
+        ----------
+        filters : dict
+            Exact matches on ``name``, ``version``, ``framework`` and
+            ``storage_group``, a ``tags`` dictionary whose items must all match,
+            and ``registered_after`` (inclusive) / ``registered_before``
+            (exclusive) datetimes. Missing or None entries are ignored.
+        sort : str, optional
+            Field to order by: ``registration_time``, ``name`` or ``version``
+        descending : bool, optional
+            Sort direction, by default newest/largest first
+        limit : int, optional
+            Maximum number of documents to return
+        after : tuple, optional
+            ``(sort value, model ID)`` of the last document of the previous
+            page. Only documents ordered strictly after it are returned.
+
+        Returns
+        -------
+        list of dict
+            Matching metadata ordered by the sort field, ties broken by ID
+
+        Raises
+        ------
+        StorageError
+            If the query fails
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_metadata(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the most recently registered version of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+
+        Returns
+        -------
+        dict or None
+            Metadata of the newest version, or None if no version exists
+
+        Raises
+        ------
+        StorageError
+            If the lookup fails
+        """
+        pass
+
+    @abstractmethod
+    def get_alias(self, name: str, alias: str) -> Optional[str]:
+        """
+        Look up the model ID an alias of a model points to.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias such as ``production`` or ``staging``
+
+        Returns
+        -------
+        str or None
+            Model ID the alias points to, or None if the alias is not set
+
+        Raises
+        ------
+        StorageError
+            If the lookup fails
+        """
+        pass
+
+    @abstractmethod
+    def set_alias(self, name: str, alias: str, model_id: str) -> None:
+        """
+        Point an alias of a model to a model ID, creating or moving it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias such as ``production`` or ``staging``
+        model_id : str
+            Unique identifier of the model version
+
+        Raises
+        ------
+        StorageError
+            If storing the alias fails
+        """
+        pass
+
+    @abstractmethod
+    def delete_alias(self, name: str, alias: str) -> bool:
+        """
+        Remove an alias of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias to remove
+
+        Returns
+        -------
+        bool
+            True if the alias existed
+
+        Raises
+        ------
+        StorageError
+            If removing the alias fails
+        """
+        pass
+
+    @abstractmethod
+    def delete_metadata(self, model_id: str) -> bool:
+        """
+        Delete model metadata by ID.
+
+        Parameters
+        ----------
+        model_id : str
+            Unique identifier of the model
+
+        Returns
+        -------
+        bool
+            True if the metadata existed
+
+        Raises
+        ------
+        StorageError
+            If deleting the metadata fails
+        """
+        pass
+
+    @abstractmethod
+    def acquire_blob(self, bucket_name: str, digest: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Add a reference to a content-addressed blob, registering it if new.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Storage group holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        path : str
+            Storage path of the blob
+
+        Returns
+        -------
+        dict or None
+            Blob record after the increment, with ``refcount`` and ``ready``.
+            A blob that is not ready has no stored content yet and must be
+            uploaded by the caller. None if the blob is being deleted, no
+            reference is added and the caller retries once ``remove_blob``
+            dropped the record, or takes over with ``reclaim_blob``.
+
+        Raises
+        ------
+        StorageError
+            If updating the record fails
+        """
+        pass
+
+    @abstractmethod
+    def mark_blob_ready(self, bucket_name: str, digest: str, storage_info: Dict[str, Any]) -> None:
+        """
+        Record that a blob's content is stored.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Storage group holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        storage_info : dict
+            Storage information returned when the blob was stored
+
+        Raises
+        ------
+        StorageError
+            If updating the record fails
+        """
+        pass
+
+    @abstractmethod
+    def release_blob(self, bucket_name: str, digest: str, owner: str) -> Optional[Dict[str, Any]]:
+        """
+        Drop a reference to a blob.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Storage group holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller, recorded as the owner of the
+            deletion lease if this was the last reference
+
+        Returns
+        -------
+        dict or None
+            Blob record if this was the last reference, otherwise None. The
+            record is then marked as being deleted, and the caller deletes the
+            stored content (and releases the ``delta_base`` of a delta) before
+            calling ``remove_blob``
+
+        Raises
+        ------
+        StorageError
+            If updating the record fails
+        """
+        pass
+
+    @abstractmethod
+    def reclaim_blob(
+        self, bucket_name: str, digest: str, owner: str, expired_before: datetime.datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Take over the deletion of a blob whose deletion lease expired.
+
+        The deleting process may have died between deleting the content and
+        removing the record, or failed to delete the content.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Storage group holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller as the new owner of the lease
+        expired_before : datetime.datetime
+            Leases started before this time are expired
+
+        Returns
+        -------
+        dict or None
+            Blob record if the lease was taken over and restarted, the caller
+            then finishes the deletion like after ``release_blob``. None if
+            the blob is not being deleted or its lease has not expired.
+
+        Raises
+        ------
+        StorageError
+            If updating the record fails
+        """
+        pass
+
+    @abstractmethod
+    def remove_blob(self, bucket_name: str, digest: str, owner: str) -> bool:
+        """
+        Remove the record of a blob marked as being deleted by ``release_blob``.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Storage group holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token the deletion lease was taken with
+
+        Returns
+        -------
+        bool
+            True if a record marked as being deleted was removed, False if
+            there is none or another owner took the deletion over
+
+        Raises
+        ------
+        StorageError
+            If removing the record fails
+        """
+        pass
+
+    @abstractmethod
+    def find_blob(self, digest: str, bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored blob by content digest.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 hex digest of the blob content
+        bucket_name : str, optional
+            Storage group to look in, any storage group if not given
+
+        Returns
+        -------
+        dict or None
+            Record of a ready blob, or None if the content is not stored
+
+        Raises
+        ------
+        StorageError
+            If the lookup fails
+        """
+        pass
+
+    @abstractmethod
+    def create_upload_session(self, session: Dict[str, Any]) -> str:
+        """
+        Store the state of a new chunked upload session.
+
+        Parameters
+        ----------
+        session : dict
+            Session state including ``_id``, bucket, path, upload ID and metadata
+
+        Returns
+        -------
+        str
+            Identifier of the session
+
+        Raises
+        ------
+        StorageError
+            If storing the session fails
+        """
+        pass
+
+    @abstractmethod
+    def get_upload_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        dict or None
+            Session state with a ``parts`` dictionary mapping part numbers (as
+            strings) to their ETag and size, or None if the session is unknown
+
+        Raises
+        ------
+        StorageError
+            If the lookup fails
+        """
+        pass
+
+    @abstractmethod
+    def record_upload_part(self, session_id: str, part_number: int, etag: str, size: int) -> bool:
+        """
+        Record a stored part of an upload session, replacing earlier attempts.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        part_number : int
+            Position of the part, starting at 1
+        etag : str
+            ETag of the stored part
+        size : int
+            Size of the part in bytes
+
+        Returns
+        -------
+        bool
+            False if the session no longer exists
+
+        Raises
+        ------
+        StorageError
+            If updating the session fails
+        """
+        pass
+
+    @abstractmethod
+    def delete_upload_session(self, session_id: str) -> bool:
+        """
+        Delete the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        bool
+            True if the session existed
+
+        Raises
+        ------
+        StorageError
+            If deleting the session fails
+        """
+        pass
+
+    @abstractmethod
+    def ping(self) -> None:
+        """
+        Check that the metadata backend is reachable.
+
+        Raises
+        ------
+        RegistryError
+            If the backend does not answer
         """
         pass
 
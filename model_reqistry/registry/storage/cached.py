@@ -0,0 +1,205 @@
+"""
+Read-through cache for model metadata storage.
+
+This module provides a BaseMetadataStorage wrapper that keeps recently read
+metadata documents in an in-process LRU cache with expiry, so repeated reads
+of the same (effectively immutable) model metadata skip the database.
+"""
+
+import copy
+import datetime
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from .base import BaseMetadataStorage
+from ..util import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedMetadataStorage(BaseMetadataStorage):
+    """
+    Metadata storage wrapper with an LRU + TTL read cache.
+
+    Writes go straight to the wrapped storage. Reads are answered from the
+    cache when possible; paths that modify or delete metadata must call
+    ``invalidate`` so stale documents are not served.
+
+    Parameters
+    ----------
+    storage : BaseMetadataStorage
+        Underlying metadata storage
+    max_size : int
+        Maximum number of cached metadata documents
+    ttl : float
+        Time in seconds a cached document stays valid
+
+    Attributes
+    ----------
+    storage : BaseMetadataStorage
+        Underlying metadata storage
+    cache : TTLCache
+        Cache of metadata documents keyed by metadata ID
+    """
+
+    def __init__(self, storage: BaseMetadataStorage, max_size: int, ttl: float):
+        self.storage = storage
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+        logger.info(f"Metadata cache enabled: max_size={max_size}, ttl={ttl}s")
+
+    def store_metadata(self, metadata: Dict[str, Any]) -> str:
+        """Store metadata in the underlying storage."""
+        return self.storage.store_metadata(metadata)
+
+    def get_metadata(self, model_id: str) -> Dict[str, Any]:
+        """
+        Retrieve model metadata, reading through the cache.
+
+        Parameters
+        ----------
+        model_id : str
+            Unique identifier of the model metadata
+
+        Returns
+        -------
+        Dict[str, Any]
+            Copy of the cached or freshly loaded metadata
+
+        Raises
+        ------
+        ModelNotFoundError
+            If no metadata exists for the given ID, misses are not cached
+        """
+        metadata = self.cache.get(model_id)
+        if metadata is None:
+            metadata = self.storage.get_metadata(model_id)
+            self.cache.set(model_id, metadata)
+        # Deep copies keep callers from mutating nested fields of the cached document
+        return copy.deepcopy(metadata)
+
+    def get_metadata_many(self, model_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata of several models, loading only cache misses.
+
+        Parameters
+        ----------
+        model_ids : List[str]
+            Unique identifiers of the model metadata
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Copies of the found metadata keyed by model ID
+        """
+        results = {}
+        missing = []
+        for model_id in model_ids:
+            metadata = self.cache.get(model_id)
+            if metadata is None:
+                missing.append(model_id)
+            else:
+                results[model_id] = metadata
+
+        if missing:
+            for model_id, metadata in self.storage.get_metadata_many(missing).items():
+                self.cache.set(model_id, metadata)
+                results[model_id] = metadata
+
+        return {model_id: copy.deepcopy(metadata) for model_id, metadata in results.items()}
+
+    def list_metadata(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        after: Optional[Tuple[Any, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List metadata from the underlying storage, listings are not cached."""
+        return self.storage.list_metadata(
+            filters, sort=sort, descending=descending, limit=limit, after=after
+        )
+
+    def get_latest_metadata(self, name: str) -> Optional[Dict[str, Any]]:
+        """Retrieve the newest version of a model from the underlying storage."""
+        return self.storage.get_latest_metadata(name)
+
+    def get_alias(self, name: str, alias: str) -> Optional[str]:
+        """Look up an alias in the underlying storage, aliases are mutable and not cached."""
+        return self.storage.get_alias(name, alias)
+
+    def set_alias(self, name: str, alias: str, model_id: str) -> None:
+        """Point an alias to a model ID in the underlying storage."""
+        self.storage.set_alias(name, alias, model_id)
+
+    def delete_alias(self, name: str, alias: str) -> bool:
+        """Remove an alias from the underlying storage."""
+        return self.storage.delete_alias(name, alias)
+
+    def delete_metadata(self, model_id: str) -> bool:
+        """Delete metadata from the underlying storage and drop it from the cache."""
+        deleted = self.storage.delete_metadata(model_id)
+        self.cache.invalidate(model_id)
+        return deleted
+
+    def acquire_blob(self, bucket_name: str, digest: str, path: str) -> Optional[Dict[str, Any]]:
+        """Add a blob reference in the underlying storage."""
+        return self.storage.acquire_blob(bucket_name, digest, path)
+
+    def mark_blob_ready(self, bucket_name: str, digest: str, storage_info: Dict[str, Any]) -> None:
+        """Mark a blob as stored in the underlying storage."""
+        self.storage.mark_blob_ready(bucket_name, digest, storage_info)
+
+    def release_blob(self, bucket_name: str, digest: str, owner: str) -> Optional[Dict[str, Any]]:
+        """Drop a blob reference in the underlying storage."""
+        return self.storage.release_blob(bucket_name, digest, owner)
+
+    def reclaim_blob(
+        self, bucket_name: str, digest: str, owner: str, expired_before: datetime.datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Take over an expired blob deletion in the underlying storage."""
+        return self.storage.reclaim_blob(bucket_name, digest, owner, expired_before)
+
+    def remove_blob(self, bucket_name: str, digest: str, owner: str) -> bool:
+        """Remove a blob marked as being deleted from the underlying storage."""
+        return self.storage.remove_blob(bucket_name, digest, owner)
+
+    def find_blob(self, digest: str, bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find a stored blob in the underlying storage."""
+        return self.storage.find_blob(digest, bucket_name)
+
+    def create_upload_session(self, session: Dict[str, Any]) -> str:
+        """Store a new upload session in the underlying storage."""
+        return self.storage.create_upload_session(session)
+
+    def get_upload_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve an upload session from the underlying storage."""
+        return self.storage.get_upload_session(session_id)
+
+    def record_upload_part(self, session_id: str, part_number: int, etag: str, size: int) -> bool:
+        """Record an uploaded part in the underlying storage."""
+        return self.storage.record_upload_part(session_id, part_number, etag, size)
+
+    def delete_upload_session(self, session_id: str) -> bool:
+        """Delete an upload session from the underlying storage."""
+        return self.storage.delete_upload_session(session_id)
+
+    def ping(self) -> None:
+        """Check that the underlying storage is reachable."""
+        self.storage.ping()
+
+    def invalidate(self, model_id: str) -> None:
+        """Drop the cached metadata of ``model_id``, to be called after updates or deletes."""
+        self.cache.invalidate(model_id)
+
+    def clear(self) -> None:
+        """Drop all cached metadata."""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size, hit/miss counters and hit ratio."""
+        return self.cache.stats()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose backend specific helpers of the wrapped storage
+        return getattr(self.storage, name)
@@ -0,0 +1,464 @@
+"""
+Read-through disk cache for model file storage.
+
+This module provides a BaseStorage wrapper that keeps recently read model
+files on the local disk of the registry node, so a rollout in which many
+clients download the same file at once costs a single backend read.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from .base import BaseStorage
+from ..exceptions import StorageError
+from ..codec import ZSTD, decompress_chunks
+from ..metrics import DISK_CACHE_BYTES, DISK_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+TMP_DIR = ".tmp"
+
+# Chunk size of the backend reads filling the cache
+FILL_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class _Fill:
+    """
+    Backend read of one file into the cache that any number of readers follow.
+
+    Parameters
+    ----------
+    fd : int
+        Descriptor of the temporary file being written
+    temp_path : str
+        Path of the temporary file
+    size : int
+        Expected number of stored bytes
+    """
+
+    def __init__(self, fd: int, temp_path: str, size: int):
+        self.fd = fd
+        self.temp_path = temp_path
+        self.size = size
+        self.written = 0
+        self.finished = False
+        self.error: Optional[Exception] = None
+        self._condition = threading.Condition()
+
+    def advance(self, count: int) -> None:
+        """Record ``count`` more bytes written and wake waiting readers."""
+        with self._condition:
+            self.written += count
+            self._condition.notify_all()
+
+    def finish(self, error: Optional[Exception] = None) -> None:
+        """Mark the fill as done, failed if ``error`` is given."""
+        with self._condition:
+            self.finished = True
+            self.error = error
+            self._condition.notify_all()
+
+    def wait_finished(self) -> None:
+        """Block until the fill is published or abandoned."""
+        with self._condition:
+            while not self.finished:
+                self._condition.wait()
+
+    def wait_for(self, position: int) -> int:
+        """
+        Block until ``position`` bytes are written or the fill ends.
+
+        Returns
+        -------
+        int
+            Number of bytes written so far
+
+        Raises
+        ------
+        StorageError
+            If the fill failed
+        """
+        with self._condition:
+            while self.written < position and not self.finished:
+                self._condition.wait()
+            if self.error is not None:
+                raise StorageError(f"Filling the disk cache failed: {str(self.error)}")
+            return self.written
+
+
+class _CachedChunks:
+    """
+    Iterator over a byte range of a cached file, following a running fill if given.
+
+    Owns ``fd`` and closes it when exhausted, closed or garbage collected.
+    """
+
+    def __init__(
+        self, fd: int, offset: int, end: int, chunk_size: int, fill: Optional[_Fill] = None
+    ):
+        self._fd: Optional[int] = fd
+        self._position = offset
+        self._end = end
+        self._chunk_size = chunk_size
+        self._fill = fill
+
+    def __iter__(self) -> "_CachedChunks":
+        return self
+
+    def __next__(self) -> bytes:
+        if self._fd is None or self._position >= self._end:
+            if self._fill is not None and self._end == self._fill.size:
+                # Readers of the whole file return once it is published, so the next read is a hit
+                self._fill.wait_finished()
+                self._fill = None
+            self.close()
+            raise StopIteration
+        target = min(self._position + self._chunk_size, self._end)
+        available = self._fill.wait_for(target) if self._fill is not None else target
+        chunk = os.pread(self._fd, min(target, available) - self._position, self._position)
+        if not chunk:
+            self.close()
+            raise StorageError("Cached model file ended early")
+        self._position += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    __del__ = close
+
+
+class CachedModelStorage(BaseStorage):
+    """
+    Model file storage wrapper with a size-bounded LRU cache on local disk.
+
+    Every read stats the file in the wrapped storage and serves it from disk
+    if a cached copy with the same etag exists. Otherwise a single background
+    fill copies the file to disk while all readers of it, including later
+    ones, stream from the growing copy. Writes and deletes go straight to the
+    wrapped storage.
+
+    Cached files are named after their path and etag, so overwritten files
+    are never served stale; outdated copies age out of the LRU order. Files
+    larger than the cache are read from the wrapped storage directly.
+
+    Parameters
+    ----------
+    storage : BaseStorage
+        Underlying model file storage
+    cache_dir : str
+        Directory of the cached files, entries found there are reused on start
+    max_bytes : int
+        Maximum total size of the cached files
+    fill_workers : int, optional
+        Number of files filled concurrently, by default 4
+
+    Attributes
+    ----------
+    storage : BaseStorage
+        Underlying model file storage
+    cache_dir : str
+        Absolute path of the cache directory
+    max_bytes : int
+        Maximum total size of the cached files
+    """
+
+    def __init__(self, storage: BaseStorage, cache_dir: str, max_bytes: int, fill_workers: int = 4):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.storage = storage
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._fills: Dict[str, _Fill] = {}
+        self._lock = threading.Lock()
+        self._fill_executor = ThreadPoolExecutor(
+            max_workers=fill_workers, thread_name_prefix="registry-cache-fill"
+        )
+
+        shutil.rmtree(os.path.join(self.cache_dir, TMP_DIR), ignore_errors=True)
+        os.makedirs(os.path.join(self.cache_dir, TMP_DIR))
+        with os.scandir(self.cache_dir) as entries:
+            found = sorted((e for e in entries if e.is_file()), key=lambda e: e.stat().st_mtime)
+        for entry in found:
+            self._add(entry.name, entry.stat().st_size)
+        logger.info(
+            f"Disk cache enabled in {self.cache_dir}: "
+            f"{len(self._entries)} files, max_bytes={max_bytes}"
+        )
+
+    @staticmethod
+    def _key_prefix(path: str, bucket_name: str) -> str:
+        return hashlib.sha1(f"{bucket_name}/{path}".encode()).hexdigest()
+
+    def _entry_name(self, path: str, bucket_name: str, etag: str) -> str:
+        """Return the cache file name of a file version."""
+        tag = re.sub(r"[^A-Za-z0-9-]", "", etag)[:80] or hashlib.sha1(etag.encode()).hexdigest()
+        return f"{self._key_prefix(path, bucket_name)}-{tag}"
+
+    def _add(self, name: str, size: int) -> None:
+        """Record a cached file, evicting old files beyond ``max_bytes``. Needs ``_lock``."""
+        self._entries[name] = size
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            evicted, evicted_size = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            # Readers that already opened the file keep reading it
+            try:
+                os.unlink(os.path.join(self.cache_dir, evicted))
+            except FileNotFoundError:
+                pass
+        DISK_CACHE_BYTES.set(self._bytes)
+
+    def _open(
+        self,
+        path: str,
+        bucket_name: str,
+        info: Dict[str, Any],
+        offset: int,
+        length: int,
+        chunk_size: int,
+    ):
+        """Return the stored bytes of a file version from the cache, filling it if it is missing."""
+        size = info.get("stored_size", info["size"])
+        end = min(offset + length, size) if length else size
+        if size > self.max_bytes:
+            DISK_CACHE_REQUESTS.labels("bypass").inc()
+            return self.storage.stream_model(path, bucket_name, chunk_size, offset, length)
+
+        name = self._entry_name(path, bucket_name, info["etag"])
+        with self._lock:
+            if name in self._entries:
+                try:
+                    fd = os.open(os.path.join(self.cache_dir, name), os.O_RDONLY)
+                    self._entries.move_to_end(name)
+                    DISK_CACHE_REQUESTS.labels("hit").inc()
+                    return _CachedChunks(fd, offset, end, chunk_size)
+                except FileNotFoundError:
+                    self._bytes -= self._entries.pop(name)
+
+            fill = self._fills.get(name)
+            if fill is None:
+                fd, temp_path = self._temp_file()
+                fill = _Fill(fd, temp_path, size)
+                self._fills[name] = fill
+                self._fill_executor.submit(
+                    self._run_fill, name, path, bucket_name, info["etag"], fill
+                )
+                DISK_CACHE_REQUESTS.labels("miss").inc()
+            else:
+                DISK_CACHE_REQUESTS.labels("join").inc()
+            # The fill closes its descriptor when done, readers keep their own
+            return _CachedChunks(os.dup(fill.fd), offset, end, chunk_size, fill)
+
+    def _temp_file(self) -> Tuple[int, str]:
+        path = os.path.join(self.cache_dir, TMP_DIR, os.urandom(8).hex())
+        return os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600), path
+
+    def _run_fill(self, name: str, path: str, bucket_name: str, etag: str, fill: _Fill) -> None:
+        """
+        Copy a file from the wrapped storage to the cache, publishing it if complete and unchanged.
+
+        The fill is only reported finished after it was published or dropped,
+        readers waiting for the end of the file are released then.
+        """
+        published = False
+        error = None
+        try:
+            for chunk in self.storage.stream_model(path, bucket_name, FILL_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fill.fd, view):]
+                fill.advance(len(chunk))
+            if fill.written != fill.size:
+                raise StorageError(
+                    f"Read {fill.written} bytes of {bucket_name}/{path}, expected {fill.size}"
+                )
+
+            # Content read after an overwrite must not be published under the old etag
+            if self.storage.stat_model(path, bucket_name)["etag"] == etag:
+                with self._lock:
+                    os.rename(fill.temp_path, os.path.join(self.cache_dir, name))
+                    self._add(name, fill.size)
+                published = True
+        except Exception as e:
+            logger.error(f"Failed to cache {bucket_name}/{path}: {str(e)}")
+            error = e
+        finally:
+            with self._lock:
+                self._fills.pop(name, None)
+            os.close(fill.fd)
+            if not published:
+                try:
+                    os.unlink(fill.temp_path)
+                except FileNotFoundError:
+                    pass
+            fill.finish(error)
+
+    def _evict_file(self, path: str, bucket_name: str) -> None:
+        """Drop all cached versions of a file."""
+        prefix = f"{self._key_prefix(path, bucket_name)}-"
+        with self._lock:
+            for name in [name for name in self._entries if name.startswith(prefix)]:
+                self._bytes -= self._entries.pop(name)
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+            DISK_CACHE_BYTES.set(self._bytes)
+
+    def store_model(
+        self,
+        model_file: BinaryIO,
+        path: str,
+        bucket_name: str,
+        tags: Dict[str, Any] = None,
+        compression_level: Optional[int] = None,
+        content_size: Optional[int] = None,
+        object_metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Store a model file in the underlying storage."""
+        return self.storage.store_model(
+            model_file, path, bucket_name, tags, compression_level, content_size, object_metadata
+        )
+
+    def copy_model(
+        self, source_path: str, source_bucket: str, path: str, bucket_name: str
+    ) -> Dict[str, Any]:
+        """Copy a model file within the underlying storage."""
+        return self.storage.copy_model(source_path, source_bucket, path, bucket_name)
+
+    def create_multipart_upload(self, path: str, bucket_name: str) -> str:
+        """Start a multipart upload in the underlying storage."""
+        return self.storage.create_multipart_upload(path, bucket_name)
+
+    def upload_part(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        """Upload a part to the underlying storage."""
+        return self.storage.upload_part(path, bucket_name, upload_id, part_number, data)
+
+    def complete_multipart_upload(
+        self, path: str, bucket_name: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """Complete a multipart upload in the underlying storage."""
+        return self.storage.complete_multipart_upload(path, bucket_name, upload_id, parts)
+
+    def abort_multipart_upload(self, path: str, bucket_name: str, upload_id: str) -> None:
+        """Abort a multipart upload in the underlying storage."""
+        self.storage.abort_multipart_upload(path, bucket_name, upload_id)
+
+    def get_model(self, path: str, bucket_name: str) -> BinaryIO:
+        """
+        Read a model file into memory through the cache.
+
+        Returns
+        -------
+        BinaryIO
+            Model data, compressed files are decompressed and deltas returned
+            as stored, like ``MinioStorage.get_model``
+        """
+        info = self.storage.stat_model(path, bucket_name)
+        chunks = self._open(path, bucket_name, info, 0, 0, FILL_CHUNK_SIZE)
+        if info.get("codec") == ZSTD:
+            return io.BytesIO(b"".join(decompress_chunks(chunks, FILL_CHUNK_SIZE)))
+        return io.BytesIO(b"".join(chunks))
+
+    def stat_model(self, path: str, bucket_name: str) -> Dict[str, Any]:
+        """Retrieve storage information from the underlying storage, it validates cached copies."""
+        return self.storage.stat_model(path, bucket_name)
+
+    def stream_model(
+        self,
+        path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Stream a model file as stored, from the cache if its copy is current.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the bucket
+        bucket_name : str
+            Name of the bucket to retrieve from
+        chunk_size : int, optional
+            Maximum size of each yielded chunk in bytes, by default 1 MiB
+        offset : int, optional
+            Start position of the content to read, by default 0
+        length : int, optional
+            Number of bytes to read, by default 0 (read to the end)
+
+        Returns
+        -------
+        Iterator[bytes]
+            Iterator over the requested file content as stored
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If the file cannot be read
+        """
+        info = self.storage.stat_model(path, bucket_name)
+        return self._open(path, bucket_name, info, offset, length, chunk_size)
+
+    def delete_model(self, path: str, bucket_name: str) -> None:
+        """Delete a model file from the underlying storage and drop its cached copies."""
+        self._evict_file(path, bucket_name)
+        self.storage.delete_model(path, bucket_name)
+
+    def prepare_buckets(self, bucket_names: Iterable[str]) -> None:
+        """Create buckets in the underlying storage."""
+        self.storage.prepare_buckets(bucket_names)
+
+    def presigned_download_url(
+        self,
+        path: str,
+        bucket_name: str,
+        expires: int,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """Sign a direct download from the underlying storage, bypassing the cache."""
+        return self.storage.presigned_download_url(path, bucket_name, expires, response_headers)
+
+    def presigned_upload_part_url(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, expires: int
+    ) -> Optional[str]:
+        """Sign a direct part upload to the underlying storage."""
+        return self.storage.presigned_upload_part_url(
+            path, bucket_name, upload_id, part_number, expires
+        )
+
+    def ping(self) -> None:
+        """Check that the underlying storage is reachable."""
+        self.storage.ping()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of cached files, their total size and the fills in progress."""
+        with self._lock:
+            return {
+                "files": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "fills": len(self._fills),
+            }
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose backend specific helpers of the wrapped storage
+        return getattr(self.storage, name)
@@ -0,0 +1,767 @@
+"""
+Local filesystem storage implementation for model files.
+
+This module provides a concrete implementation of the BaseStorage interface
+that keeps model files in a directory tree, for single node deployments and
+performance tests that should not need an object store.
+
+Notes
+-----
+Every storage group is a directory below ``settings.FILESYSTEM_ROOT``. Files
+are spread over two levels of 256 shard directories and written to a
+temporary file first, then atomically renamed into place, so readers never
+see partially written files. The object metadata MinIO keeps with an object
+(codec, content size, delta base, etag, tags) is stored in a JSON sidecar
+next to each file.
+"""
+
+import datetime
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import uuid
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from .base import BaseStorage
+from ..core.config import settings
+from ..exceptions import StorageError, ModelNotFoundError
+from ..util import CountingReader
+from ..codec import ZSTD, compress_reader, decompress_chunks
+from ..metrics import instrument_storage
+
+logger = logging.getLogger(__name__)
+
+# Storage groups and paths become directory and file names
+NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,254}$")
+
+TMP_DIR = ".tmp"
+UPLOADS_DIR = ".uploads"
+SIDECAR_SUFFIX = ".json"
+
+
+def _fsync_dir(path: str) -> None:
+    """Persist the directory entries of ``path``, e.g. after a rename."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _copy_fd(source_fd: int, target_fd: int, count: int) -> None:
+    """Copy ``count`` bytes between file descriptors inside the kernel."""
+    while count > 0:
+        if hasattr(os, "copy_file_range"):
+            copied = os.copy_file_range(source_fd, target_fd, count)
+        else:
+            copied = os.sendfile(target_fd, source_fd, None, count)
+        if not copied:
+            raise StorageError("Unexpected end of file while copying")
+        count -= copied
+
+
+@instrument_storage("filesystem")
+class FilesystemStorage(BaseStorage):
+    """
+    Filesystem-based implementation of model file storage.
+
+    Downloads are streamed as slices of a memory map of the stored file, so
+    no user-space copy is made between the page cache and the socket.
+    Copies and multipart assembly happen inside the kernel through hard
+    links and ``copy_file_range``.
+
+    Parameters
+    ----------
+    root : str, optional
+        Directory holding all storage groups, by default ``settings.FILESYSTEM_ROOT``
+
+    Attributes
+    ----------
+    root : str
+        Absolute path of the storage root directory
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize filesystem storage, creating the root directory if necessary.
+
+        Raises
+        ------
+        StorageError
+            If the root directory cannot be created
+        """
+        self.root = os.path.abspath(root or settings.FILESYSTEM_ROOT)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            logger.info(f"Initialized filesystem storage in {self.root}")
+        except OSError as e:
+            logger.error(f"Failed to initialize filesystem storage: {str(e)}")
+            raise StorageError(f"Filesystem storage initialization failed: {str(e)}")
+
+    def _bucket_dir(self, bucket_name: str) -> str:
+        """Return the directory of a storage group, rejecting names that are not plain names."""
+        if not NAME_PATTERN.match(bucket_name) or bucket_name in (".", ".."):
+            raise StorageError(f"Invalid storage group name: {bucket_name}")
+        return os.path.join(self.root, bucket_name)
+
+    def _file_path(self, path: str, bucket_name: str) -> str:
+        """Return the sharded location of a stored file."""
+        if not NAME_PATTERN.match(path) or path in (".", "..") or path.endswith(SIDECAR_SUFFIX):
+            raise StorageError(f"Invalid storage path: {path}")
+        shard = hashlib.sha1(path.encode()).hexdigest()
+        return os.path.join(self._bucket_dir(bucket_name), shard[:2], shard[2:4], path)
+
+    def _temp_file(self, bucket_name: str) -> Tuple[int, str]:
+        """Create a temporary file next to the storage group, so it can be renamed into place."""
+        tmp_dir = os.path.join(self._bucket_dir(bucket_name), TMP_DIR)
+        os.makedirs(tmp_dir, exist_ok=True)
+        return tempfile.mkstemp(dir=tmp_dir)
+
+    def _upload_dir(self, bucket_name: str, upload_id: str) -> str:
+        """Return the directory holding the parts of a multipart upload."""
+        if not NAME_PATTERN.match(upload_id):
+            raise StorageError(f"Invalid upload ID: {upload_id}")
+        return os.path.join(self._bucket_dir(bucket_name), UPLOADS_DIR, upload_id)
+
+    def _publish(
+        self, temp_path: str, path: str, bucket_name: str, sidecar: Dict[str, Any]
+    ) -> None:
+        """
+        Move a written temporary file and its sidecar into place.
+
+        Each is renamed atomically, the sidecar last. Readers treat a file
+        without sidecar as missing, so a new file only appears once it is
+        complete. Replacing an existing file is not atomic, readers may see
+        the new content with the old sidecar for a moment; content-addressed
+        paths are only ever replaced with the same content.
+        """
+        target = self._file_path(path, bucket_name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, sidecar_temp = self._temp_file(bucket_name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(sidecar, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, target)
+            os.replace(sidecar_temp, target + SIDECAR_SUFFIX)
+        except BaseException:
+            if os.path.exists(sidecar_temp):
+                os.unlink(sidecar_temp)
+            raise
+        _fsync_dir(os.path.dirname(target))
+
+    def _read_sidecar(self, target: str) -> Dict[str, Any]:
+        """Load the sidecar of a stored file, raising ModelNotFoundError if the file is missing."""
+        try:
+            with open(target + SIDECAR_SUFFIX) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ModelNotFoundError(os.path.basename(target))
+
+    def store_model(
+        self,
+        model_file: BinaryIO,
+        path: str,
+        bucket_name: str,
+        tags: Dict[str, Any] = None,
+        compression_level: Optional[int] = None,
+        content_size: Optional[int] = None,
+        object_metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store a model file on disk.
+
+        The file is streamed to a temporary file in chunks of
+        ``settings.DOWNLOAD_CHUNK_SIZE``, synced and renamed into place.
+        Compression and ``object_metadata`` behave as in ``MinioStorage.store_model``.
+
+        Parameters
+        ----------
+        model_file : BinaryIO
+            Readable binary stream containing the model data, size may be unknown
+        path : str
+            Desired file name within the storage group
+        bucket_name : str
+            Name of the storage group to store in
+        tags : Dict[str, Any], optional
+            Tags to keep with the stored file
+        compression_level : int, optional
+            zstd level to compress with, None stores the content as is
+        content_size : int, optional
+            Number of bytes ``model_file`` will produce, determined by seeking if not given
+        object_metadata : Dict[str, str], optional
+            Metadata of content that is already encoded (e.g. a delta)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information including path, bucket, (uncompressed) size,
+            etag and the SHA-256 digest of the streamed content. Compressed
+            files also record the ``codec`` and their ``stored_size``.
+
+        Raises
+        ------
+        StorageError
+            If storing the model fails
+        """
+        temp_path = None
+        try:
+            logger.info(f"Storing model on disk: {bucket_name}/{path}")
+            reader = CountingReader(model_file)
+            if compression_level is not None and content_size is None:
+                content_size = self._remaining_size(model_file)
+            if compression_level is not None and content_size is not None:
+                body = compress_reader(reader, compression_level, content_size)
+                object_metadata = {"codec": ZSTD, "content-size": str(content_size)}
+            else:
+                body = reader
+
+            fd, temp_path = self._temp_file(bucket_name)
+            md5 = hashlib.md5(usedforsecurity=False)
+            stored_size = 0
+            with os.fdopen(fd, "wb") as f:
+                while True:
+                    chunk = body.read(settings.DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    md5.update(chunk)
+                    stored_size += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+            sidecar = {
+                "etag": md5.hexdigest(),
+                "metadata": object_metadata or {},
+                "tags": {key: str(value) for key, value in (tags or {}).items()},
+            }
+            self._publish(temp_path, path, bucket_name, sidecar)
+            temp_path = None
+
+            storage_info = {
+                "path": path,
+                "bucket": bucket_name,
+                "size": reader.bytes_read,
+                "etag": sidecar["etag"],
+                "sha256": reader.sha256,
+            }
+            if body is not reader:
+                storage_info["codec"] = ZSTD
+                storage_info["stored_size"] = stored_size
+
+            logger.info(f"Successfully stored model: {storage_info}")
+            return storage_info
+
+        except OSError as e:
+            logger.error(f"Failed to store model: {str(e)}")
+            raise StorageError(f"Model storage failed: {str(e)}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    @staticmethod
+    def _remaining_size(stream: BinaryIO) -> Optional[int]:
+        """Return the number of bytes left in a seekable stream, or None if it cannot seek."""
+        if not getattr(stream, "seekable", lambda: False)():
+            return None
+        position = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return end - position
+
+    def copy_model(
+        self, source_path: str, source_bucket: str, path: str, bucket_name: str
+    ) -> Dict[str, Any]:
+        """
+        Copy a model file without reading it through Python.
+
+        The copy is a hard link to the source when possible, stored files are
+        never modified in place. Otherwise the kernel copies the content.
+
+        Parameters
+        ----------
+        source_path : str
+            Path of the file to copy
+        source_bucket : str
+            Storage group containing the file to copy
+        path : str
+            Destination path within the storage group
+        bucket_name : str
+            Destination storage group
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information of the copy including path, bucket, size and etag
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the source file does not exist
+        StorageError
+            If copying fails
+        """
+        source = self._file_path(source_path, source_bucket)
+        temp_path = None
+        try:
+            sidecar = self._read_sidecar(source)
+            fd, temp_path = self._temp_file(bucket_name)
+            os.close(fd)
+            os.unlink(temp_path)
+            try:
+                os.link(source, temp_path)
+            except OSError:
+                shutil.copyfile(source, temp_path)
+            self._publish(temp_path, path, bucket_name, sidecar)
+            temp_path = None
+            logger.info(f"Copied model {source_bucket}/{source_path} to {bucket_name}/{path}")
+            return self.stat_model(path, bucket_name)
+
+        except FileNotFoundError:
+            logger.error(f"Model not found: {source_bucket}/{source_path}")
+            raise ModelNotFoundError(source_path)
+        except OSError as e:
+            logger.error(f"Failed to copy model: {str(e)}")
+            raise StorageError(f"Failed to copy model: {str(e)}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def create_multipart_upload(self, path: str, bucket_name: str) -> str:
+        """
+        Start a multipart upload in a directory of its own.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled file within the storage group
+        bucket_name : str
+            Name of the storage group to store in
+
+        Returns
+        -------
+        str
+            Upload ID
+
+        Raises
+        ------
+        StorageError
+            If the upload directory cannot be created
+        """
+        self._file_path(path, bucket_name)
+        upload_id = uuid.uuid4().hex
+        try:
+            os.makedirs(self._upload_dir(bucket_name, upload_id))
+            logger.info(f"Started multipart upload {upload_id} for {bucket_name}/{path}")
+            return upload_id
+
+        except OSError as e:
+            logger.error(f"Failed to start multipart upload: {str(e)}")
+            raise StorageError(f"Failed to start multipart upload: {str(e)}")
+
+    def upload_part(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        """
+        Store one part of a multipart upload.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled file within the storage group
+        bucket_name : str
+            Name of the storage group to store in
+        upload_id : str
+            Upload ID
+        part_number : int
+            Part number between 1 and 10000, re-uploading a part replaces it
+        data : bytes
+            Content of the part
+
+        Returns
+        -------
+        str
+            ETag of the part (MD5 of its content)
+
+        Raises
+        ------
+        StorageError
+            If the upload does not exist or the part cannot be stored
+        """
+        upload_dir = self._upload_dir(bucket_name, upload_id)
+        try:
+            etag = hashlib.md5(data, usedforsecurity=False).hexdigest()
+            fd, temp_path = tempfile.mkstemp(dir=upload_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, os.path.join(upload_dir, f"{part_number}.{etag}"))
+            for name in os.listdir(upload_dir):
+                if name.startswith(f"{part_number}.") and name != f"{part_number}.{etag}":
+                    os.unlink(os.path.join(upload_dir, name))
+            return etag
+
+        except OSError as e:
+            logger.error(f"Failed to upload part {part_number}: {str(e)}")
+            raise StorageError(f"Failed to upload part {part_number}: {str(e)}")
+
+    def complete_multipart_upload(
+        self, path: str, bucket_name: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """
+        Concatenate the parts of a multipart upload into the stored file.
+
+        Parts are appended inside the kernel, then the assembled file is
+        renamed into place and the upload directory removed. The ETag is
+        computed like S3 does for multipart objects.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled file within the storage group
+        bucket_name : str
+            Name of the storage group to store in
+        upload_id : str
+            Upload ID
+        parts : List[Tuple[int, str]]
+            Part numbers and ETags in ascending order
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information of the assembled file
+
+        Raises
+        ------
+        StorageError
+            If a part is missing or the upload cannot be completed
+        """
+        upload_dir = self._upload_dir(bucket_name, upload_id)
+        temp_path = None
+        try:
+            fd, temp_path = self._temp_file(bucket_name)
+            digests = hashlib.md5(usedforsecurity=False)
+            with os.fdopen(fd, "wb") as f:
+                for part_number, etag in parts:
+                    part_path = os.path.join(upload_dir, f"{part_number}.{etag}")
+                    if not os.path.exists(part_path):
+                        raise StorageError(f"Part {part_number} with ETag {etag} was not uploaded")
+                    with open(part_path, "rb") as part:
+                        _copy_fd(part.fileno(), f.fileno(), os.fstat(part.fileno()).st_size)
+                    digests.update(bytes.fromhex(etag))
+                os.fsync(f.fileno())
+
+            sidecar = {"etag": f"{digests.hexdigest()}-{len(parts)}", "metadata": {}, "tags": {}}
+            self._publish(temp_path, path, bucket_name, sidecar)
+            temp_path = None
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            logger.info(f"Completed multipart upload {upload_id} for {bucket_name}/{path}")
+            return self.stat_model(path, bucket_name)
+
+        except OSError as e:
+            logger.error(f"Failed to complete multipart upload: {str(e)}")
+            raise StorageError(f"Failed to complete multipart upload: {str(e)}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def abort_multipart_upload(self, path: str, bucket_name: str, upload_id: str) -> None:
+        """
+        Abort a multipart upload and discard its parts.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled file within the storage group
+        bucket_name : str
+            Name of the storage group to store in
+        upload_id : str
+            Upload ID
+
+        Raises
+        ------
+        StorageError
+            If the parts cannot be removed
+        """
+        try:
+            shutil.rmtree(self._upload_dir(bucket_name, upload_id))
+            logger.info(f"Aborted multipart upload {upload_id} for {bucket_name}/{path}")
+
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to abort multipart upload: {str(e)}")
+            raise StorageError(f"Failed to abort multipart upload: {str(e)}")
+
+    def get_model(self, path: str, bucket_name: str) -> BinaryIO:
+        """
+        Read a model file into memory.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the storage group
+        bucket_name : str
+            Name of the storage group to read from
+
+        Returns
+        -------
+        BinaryIO
+            Binary file object containing the model data, compressed files are
+            decompressed. Deltas are returned as stored.
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If reading the model fails
+        """
+        target = self._file_path(path, bucket_name)
+        try:
+            sidecar = self._read_sidecar(target)
+            with open(target, "rb") as f:
+                if sidecar["metadata"].get("codec") == ZSTD:
+                    chunks = iter(lambda: f.read(settings.DOWNLOAD_CHUNK_SIZE), b"")
+                    return io.BytesIO(
+                        b"".join(decompress_chunks(chunks, settings.DOWNLOAD_CHUNK_SIZE))
+                    )
+                return io.BytesIO(f.read())
+
+        except FileNotFoundError:
+            logger.error(f"Model not found: {bucket_name}/{path}")
+            raise ModelNotFoundError(f"Model not found: {path}")
+        except OSError as e:
+            logger.error(f"Failed to retrieve model: {str(e)}")
+            raise StorageError(f"Failed to retrieve model: {str(e)}")
+
+    def stat_model(self, path: str, bucket_name: str) -> Dict[str, Any]:
+        """
+        Retrieve size and version information of a model file without reading it.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the storage group
+        bucket_name : str
+            Name of the storage group containing the file
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information including path, bucket, size, etag and
+            last_modified, with the codec and delta fields of ``MinioStorage.stat_model``
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If the file cannot be inspected
+        """
+        target = self._file_path(path, bucket_name)
+        try:
+            stat = os.stat(target)
+            sidecar = self._read_sidecar(target)
+        except FileNotFoundError:
+            logger.error(f"Model not found: {bucket_name}/{path}")
+            raise ModelNotFoundError(path)
+        except OSError as e:
+            logger.error(f"Failed to stat model: {str(e)}")
+            raise StorageError(f"Failed to stat model: {str(e)}")
+
+        metadata = sidecar["metadata"]
+        info = {
+            "path": path,
+            "bucket": bucket_name,
+            "size": stat.st_size,
+            "etag": sidecar["etag"],
+            "last_modified": datetime.datetime.fromtimestamp(stat.st_mtime, datetime.timezone.utc),
+        }
+        if metadata.get("codec"):
+            info["codec"] = metadata["codec"]
+            info["stored_size"] = stat.st_size
+            info["size"] = int(metadata["content-size"])
+        if metadata.get("delta-base"):
+            info["delta_base"] = metadata["delta-base"]
+            info["delta_depth"] = int(metadata["delta-depth"])
+        return info
+
+    def stream_model(
+        self,
+        path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Stream a model file as slices of a read-only memory map.
+
+        The file is opened and mapped eagerly, so missing files fail here
+        rather than mid-stream. Chunks are memoryviews into the page cache.
+        The mapping is closed when the stream ends or is closed, or once the
+        last chunk is released if a caller still holds one at that point.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the storage group
+        bucket_name : str
+            Name of the storage group to read from
+        chunk_size : int, optional
+            Maximum size of each yielded chunk in bytes, by default 1 MiB
+        offset : int, optional
+            Start position of the content to read, by default 0
+        length : int, optional
+            Number of bytes to read, by default 0 (read to the end)
+
+        Returns
+        -------
+        Iterator[bytes]
+            Iterator over the requested file content as stored, compressed
+            files are not decompressed
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If the file cannot be mapped
+        """
+        target = self._file_path(path, bucket_name)
+        try:
+            # Files are published before their sidecar and are missing until it exists
+            os.stat(target + SIDECAR_SUFFIX)
+            with open(target, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if not size:
+                    return iter(())
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            logger.error(f"Model not found: {bucket_name}/{path}")
+            raise ModelNotFoundError(path)
+        except OSError as e:
+            logger.error(f"Failed to retrieve model: {str(e)}")
+            raise StorageError(f"Failed to retrieve model: {str(e)}")
+
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        end = min(offset + length, size) if length else size
+        return self._iter_mapped(mapped, offset, end, chunk_size)
+
+    @staticmethod
+    def _iter_mapped(
+        mapped: mmap.mmap, start: int, end: int, chunk_size: int
+    ) -> Iterator[memoryview]:
+        """Yield slices of a mapped file and close the mapping once the slices are released."""
+        view = memoryview(mapped)
+        chunk = None
+        try:
+            for position in range(start, end, chunk_size):
+                chunk = view[position:min(position + chunk_size, end)]
+                # Touch one byte per page, so disk reads happen on the calling
+                # worker thread rather than on the event loop sending the chunk
+                bytes(chunk[::mmap.PAGESIZE])
+                yield chunk
+        finally:
+            del chunk
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # A caller still holds a chunk, the mapping is unmapped when it is released
+                pass
+
+    def delete_model(self, path: str, bucket_name: str) -> None:
+        """
+        Delete a model file and its sidecar.
+
+        Readers that already opened the file keep reading it until they finish.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the storage group
+        bucket_name : str
+            Name of the storage group to delete from
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If deleting the model fails
+        """
+        target = self._file_path(path, bucket_name)
+        try:
+            # Without its sidecar the file is missing for readers
+            try:
+                os.unlink(target + SIDECAR_SUFFIX)
+            except FileNotFoundError:
+                pass
+            os.unlink(target)
+            logger.info(f"Successfully deleted model: {bucket_name}/{path}")
+
+        except FileNotFoundError:
+            raise ModelNotFoundError(f"Model not found: {path}")
+        except OSError as e:
+            logger.error(f"Failed to delete model: {str(e)}")
+            raise StorageError(f"Failed to delete model: {str(e)}")
+
+    def prepare_buckets(self, bucket_names: Iterable[str]) -> None:
+        """
+        Create the directories of storage groups ahead of their first use.
+
+        Parameters
+        ----------
+        bucket_names : Iterable[str]
+            Names of the storage groups to create if missing
+
+        Raises
+        ------
+        StorageError
+            If a directory cannot be created
+        """
+        try:
+            for bucket_name in bucket_names:
+                os.makedirs(self._bucket_dir(bucket_name), exist_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to create storage group: {str(e)}")
+            raise StorageError(f"Failed to create storage group: {str(e)}")
+
+    def presigned_download_url(
+        self,
+        path: str,
+        bucket_name: str,
+        expires: int,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """Return None, files on the registry's disk are only served through the registry."""
+        return None
+
+    def presigned_upload_part_url(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, expires: int
+    ) -> Optional[str]:
+        """Return None, parts are only accepted through the registry."""
+        return None
+
+    def ping(self) -> None:
+        """
+        Check that the root directory is accessible.
+
+        Raises
+        ------
+        StorageError
+            If the root directory cannot be listed
+        """
+        try:
+            os.stat(self.root)
+        except OSError as e:
+            raise StorageError(f"Filesystem storage unavailable: {str(e)}")
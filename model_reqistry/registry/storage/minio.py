@@ -7,18 +7,26 @@ using MinIO object storage for storing model files.
 
 import io
 import logging
-from typing import BinaryIO, Dict, Any
+from datetime import timedelta
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from minio import Minio
 from minio.tagging import Tags
+from minio.commonconfig import CopySource
+from minio.datatypes import Part
+from minio.helpers import MAX_PART_SIZE
 from minio.error import MinioException, S3Error
 
 from .base import BaseStorage
 from ..core.config import settings
 from ..exceptions import StorageError, ModelNotFoundError
+from ..util import CountingReader
+from ..codec import ZSTD, compress_reader, decompress_chunks
+from ..metrics import instrument_storage
 import urllib3
 logger = logging.getLogger(__name__)
 
 
+@instrument_storage("minio")
 class MinioStorage(BaseStorage):
     """
     MinIO-based implementation of model file storage.
@@ -29,7 +37,11 @@ class MinioStorage(BaseStorage):
     Attributes
     ----------
     client : Minio
-        MinIO client instance
+        MinIO client instance, its connection pool keeps up to
+        ``settings.MINIO_POOL_SIZE`` connections
+    presign_client : Minio
+        Client signing URLs for ``settings.MINIO_PUBLIC_ENDPOINT``, the address
+        clients reach MinIO at. Signing happens locally and never connects.
     """
 
     def __init__(self):
@@ -48,11 +60,22 @@ class MinioStorage(BaseStorage):
                 access_key=settings.MINIO_ACCESS_KEY,
                 secret_key=settings.MINIO_SECRET_KEY,
                 secure=False,
-                http_client=urllib3.PoolManager(headers={'Host': 'registry_minio:9000'}
-    )
+                http_client=urllib3.PoolManager(
+                    maxsize=settings.MINIO_POOL_SIZE, headers={'Host': 'registry_minio:9000'}
+                )
                     # getattr(settings, 'MINIO_SECURE', False)
             )
 
+            self.presign_client = Minio(
+                settings.MINIO_PUBLIC_ENDPOINT or settings.MINIO_ENDPOINT,
+                access_key=settings.MINIO_ACCESS_KEY,
+                secret_key=settings.MINIO_SECRET_KEY,
+                secure=settings.MINIO_PUBLIC_SECURE,
+                region=settings.MINIO_REGION,
+            )
+
+            # Buckets known to exist, uploads to them skip the existence check
+            self._known_buckets: Set[str] = set()
             logger.info("Successfully initialized MinIO client")
         except MinioException as e:
             logger.error(f"Failed to initialize MinIO client: {str(e)}")
@@ -72,31 +95,64 @@ class MinioStorage(BaseStorage):
         StorageError
             If bucket creation fails
         """
+        if bucket_name in self._known_buckets:
+            return
         try:
             if not self.client.bucket_exists(bucket_name):
                 self.client.make_bucket(bucket_name)
                 logger.info(f"Created new bucket: {bucket_name}")
+            self._known_buckets.add(bucket_name)
         except MinioException as e:
             logger.error(f"Bucket operation failed: {str(e)}")
             raise StorageError(f"Failed to ensure bucket: {str(e)}")
 
-    def store_model(self, model_file: BinaryIO, path: str, bucket_name: str,tags:Dict[str,Any]=None) -> Dict[str, Any]:
+    def store_model(
+        self,
+        model_file: BinaryIO,
+        path: str,
+        bucket_name: str,
+        tags: Dict[str, Any] = None,
+        compression_level: Optional[int] = None,
+        content_size: Optional[int] = None,
+        object_metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         """
         Store a model file in MinIO.
 
+        The file is streamed to MinIO as a multipart upload of
+        ``settings.MINIO_PART_SIZE`` sized parts, so its total size does not
+        need to be known in advance and at most one part is held in memory.
+
+        With a ``compression_level`` the content is zstd compressed on the fly
+        and the codec and uncompressed size are stored as object metadata.
+        Compression needs the uncompressed size, so streams that can neither
+        seek nor have a ``content_size`` are stored uncompressed.
+
         Parameters
         ----------
         model_file : BinaryIO
-            Binary file object containing the model data
+            Readable binary stream containing the model data, size may be unknown
         path : str
             Desired storage path within the bucket
         bucket_name : str
             Name of the bucket to store in
+        tags : Dict[str, Any], optional
+            Object tags to attach to the stored file
+        compression_level : int, optional
+            zstd level to compress with, None stores the content as is
+        content_size : int, optional
+            Number of bytes ``model_file`` will produce, determined by seeking if not given
+        object_metadata : Dict[str, str], optional
+            Metadata of content that is already encoded (e.g. a delta), stored
+            with the object. ``codec`` and ``content-size`` entries are
+            reported by ``stat_model``.
 
         Returns
         -------
         Dict[str, Any]
-            Storage information including path, bucket, size, and etag
+            Storage information including path, bucket, (uncompressed) size,
+            etag and the SHA-256 digest of the streamed content. Compressed
+            files also record the ``codec`` and their ``stored_size``.
 
         Raises
         ------
@@ -104,43 +160,255 @@ class MinioStorage(BaseStorage):
             If storing the model fails
         """
 
-       
         try:
             logger.info(f"Storing model in MinIO: {path}")
             logger.info(f"Bucket: {bucket_name}")
             self._ensure_bucket(bucket_name)
 
-            # Get file size
-            file_size = model_file.seek(0, 2)
-            model_file.seek(0)
-            
-            if tags is None:
-                minio_tags = Tags.new_object_tags()
-            else:
-                minio_tags = Tags.new_object_tags()
+            minio_tags = Tags.new_object_tags()
+            if tags is not None:
                 for key, value in tags.items():
-                    minio_tags[key] = str(value)  #
-            
-            # Store file
+                    minio_tags[key] = str(value)
+
+            # Stream file in parts, counting bytes as they are read
+            reader = CountingReader(model_file)
+            if compression_level is not None and content_size is None:
+                content_size = self._remaining_size(model_file)
+            if compression_level is not None and content_size is not None:
+                body = compress_reader(reader, compression_level, content_size)
+                object_metadata = {"codec": ZSTD, "content-size": str(content_size)}
+            else:
+                body = reader
+
             result = self.client.put_object(
                 bucket_name,
                 path,
-                model_file,
-                file_size,
+                body,
+                length=-1,
+                part_size=settings.MINIO_PART_SIZE,
+                metadata=object_metadata,
                 tags=minio_tags,
-                # metadata={'content-type': 'application/octet-stream'}
             )
 
-            storage_info = {"path": path, "bucket": bucket_name, "size": file_size, "etag": result.etag}
+            storage_info = {
+                "path": path,
+                "bucket": bucket_name,
+                "size": reader.bytes_read,
+                "etag": result.etag,
+                "sha256": reader.sha256,
+            }
+            if body is not reader:
+                storage_info["codec"] = ZSTD
+                storage_info["stored_size"] = body.tell()
 
             logger.info(f"Successfully stored model: {storage_info}")
             return storage_info
 
         except MinioException as e:
-            logger.info("zeynooooooo")
             logger.error(f"Failed to store model: {str(e)}")
             raise StorageError(f"Model storage failed: {str(e)}")
 
+    @staticmethod
+    def _remaining_size(stream: BinaryIO) -> Optional[int]:
+        """Return the number of bytes left in a seekable stream, or None if it cannot seek."""
+        if not getattr(stream, "seekable", lambda: False)():
+            return None
+        position = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return end - position
+
+    def copy_model(
+        self, source_path: str, source_bucket: str, path: str, bucket_name: str
+    ) -> Dict[str, Any]:
+        """
+        Copy a model file inside MinIO without transferring it through the registry.
+
+        Parameters
+        ----------
+        source_path : str
+            Path of the file to copy
+        source_bucket : str
+            Bucket containing the file to copy
+        path : str
+            Destination path within the bucket
+        bucket_name : str
+            Destination bucket
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information of the copy including path, bucket, size and etag
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the source file does not exist
+        StorageError
+            If copying fails
+        """
+        try:
+            self._ensure_bucket(bucket_name)
+            stat = self.client.stat_object(source_bucket, source_path)
+            metadata = None
+            if stat.size > MAX_PART_SIZE:
+                # Objects over 5 GiB are copied part by part by the client library,
+                # which drops the codec and delta metadata unless it is passed on
+                metadata = {
+                    key[len("x-amz-meta-"):]: value
+                    for key, value in stat.metadata.items()
+                    if key.lower().startswith("x-amz-meta-")
+                }
+            self.client.copy_object(
+                bucket_name, path, CopySource(source_bucket, source_path), metadata=metadata
+            )
+            logger.info(f"Copied model {source_bucket}/{source_path} to {bucket_name}/{path}")
+            return self.stat_model(path, bucket_name)
+
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                logger.error(f"Model not found: {source_bucket}/{source_path}")
+                raise ModelNotFoundError(source_path)
+            logger.error(f"Failed to copy model: {str(e)}")
+            raise StorageError(f"Failed to copy model: {str(e)}")
+        except MinioException as e:
+            logger.error(f"Failed to copy model: {str(e)}")
+            raise StorageError(f"Failed to copy model: {str(e)}")
+
+    def create_multipart_upload(self, path: str, bucket_name: str) -> str:
+        """
+        Start a MinIO multipart upload.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket to store in
+
+        Returns
+        -------
+        str
+            MinIO upload ID
+
+        Raises
+        ------
+        StorageError
+            If the upload cannot be started
+        """
+        try:
+            self._ensure_bucket(bucket_name)
+            upload_id = self.client._create_multipart_upload(bucket_name, path, {})
+            logger.info(f"Started multipart upload {upload_id} for {bucket_name}/{path}")
+            return upload_id
+
+        except MinioException as e:
+            logger.error(f"Failed to start multipart upload: {str(e)}")
+            raise StorageError(f"Failed to start multipart upload: {str(e)}")
+
+    def upload_part(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        """
+        Upload one part of a MinIO multipart upload.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket to store in
+        upload_id : str
+            MinIO upload ID
+        part_number : int
+            Part number between 1 and 10000
+        data : bytes
+            Content of the part, at least 5 MiB unless it is the last part
+
+        Returns
+        -------
+        str
+            ETag of the part
+
+        Raises
+        ------
+        StorageError
+            If the part cannot be stored
+        """
+        try:
+            return self.client._upload_part(bucket_name, path, data, None, upload_id, part_number)
+
+        except MinioException as e:
+            logger.error(f"Failed to upload part {part_number}: {str(e)}")
+            raise StorageError(f"Failed to upload part {part_number}: {str(e)}")
+
+    def complete_multipart_upload(
+        self, path: str, bucket_name: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """
+        Complete a MinIO multipart upload.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket to store in
+        upload_id : str
+            MinIO upload ID
+        parts : List[Tuple[int, str]]
+            Part numbers and ETags in ascending order
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information of the assembled object
+
+        Raises
+        ------
+        StorageError
+            If the upload cannot be completed
+        """
+        try:
+            self.client._complete_multipart_upload(
+                bucket_name,
+                path,
+                upload_id,
+                [Part(part_number, etag) for part_number, etag in parts],
+            )
+            logger.info(f"Completed multipart upload {upload_id} for {bucket_name}/{path}")
+            return self.stat_model(path, bucket_name)
+
+        except MinioException as e:
+            logger.error(f"Failed to complete multipart upload: {str(e)}")
+            raise StorageError(f"Failed to complete multipart upload: {str(e)}")
+
+    def abort_multipart_upload(self, path: str, bucket_name: str, upload_id: str) -> None:
+        """
+        Abort a MinIO multipart upload and discard its parts.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket to store in
+        upload_id : str
+            MinIO upload ID
+
+        Raises
+        ------
+        StorageError
+            If the upload cannot be aborted
+        """
+        try:
+            self.client._abort_multipart_upload(bucket_name, path, upload_id)
+            logger.info(f"Aborted multipart upload {upload_id} for {bucket_name}/{path}")
+
+        except MinioException as e:
+            logger.error(f"Failed to abort multipart upload: {str(e)}")
+            raise StorageError(f"Failed to abort multipart upload: {str(e)}")
+
     def get_model(self, path: str, bucket_name: str) -> BinaryIO:
         """
         Retrieve a model file from MinIO.
@@ -155,7 +423,8 @@ class MinioStorage(BaseStorage):
         Returns
         -------
         Tuple[BinaryIO, Dict[str, str]]
-            Binary file object containing the model data and its metadata
+            Binary file object containing the model data and its metadata,
+            compressed files are decompressed. Deltas are returned as stored.
 
         Raises
         ------
@@ -167,6 +436,10 @@ class MinioStorage(BaseStorage):
         response = None
         try:
             response = self.client.get_object(bucket_name, path)
+            if response.headers.get("x-amz-meta-codec") == ZSTD:
+                return io.BytesIO(
+                    b"".join(decompress_chunks(response.stream(settings.DOWNLOAD_CHUNK_SIZE)))
+                )
             data = io.BytesIO(response.read())
             return data
 
@@ -181,6 +454,125 @@ class MinioStorage(BaseStorage):
                 response.close()
                 response.release_conn()
 
+    def stat_model(self, path: str, bucket_name: str) -> Dict[str, Any]:
+        """
+        Retrieve size and version information of a model file without reading it.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the bucket
+        bucket_name : str
+            Name of the bucket containing the file
+
+        Returns
+        -------
+        Dict[str, Any]
+            Storage information including path, bucket, size, etag and last_modified.
+            Compressed files also report their ``codec`` and ``stored_size``,
+            ``size`` is always the uncompressed size. Deltas report their
+            ``delta_base`` digest and ``delta_depth``.
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If the stat request fails
+        """
+        try:
+            stat = self.client.stat_object(bucket_name, path)
+            info = {
+                "path": path,
+                "bucket": bucket_name,
+                "size": stat.size,
+                "etag": stat.etag,
+                "last_modified": stat.last_modified,
+            }
+            codec = stat.metadata.get("x-amz-meta-codec")
+            if codec:
+                info["codec"] = codec
+                info["stored_size"] = stat.size
+                info["size"] = int(stat.metadata["x-amz-meta-content-size"])
+            if stat.metadata.get("x-amz-meta-delta-base"):
+                info["delta_base"] = stat.metadata["x-amz-meta-delta-base"]
+                info["delta_depth"] = int(stat.metadata["x-amz-meta-delta-depth"])
+            return info
+
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                logger.error(f"Model not found: {bucket_name}/{path}")
+                raise ModelNotFoundError(path)
+            logger.error(f"Failed to stat model: {str(e)}")
+            raise StorageError(f"Failed to stat model: {str(e)}")
+        except MinioException as e:
+            logger.error(f"Failed to stat model: {str(e)}")
+            raise StorageError(f"Failed to stat model: {str(e)}")
+
+    def stream_model(
+        self,
+        path: str,
+        bucket_name: str,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Stream a model file from MinIO in chunks.
+
+        The object request is issued eagerly, so missing files fail here
+        rather than mid-stream. The pooled connection is released once the
+        returned iterator is exhausted or closed.
+
+        Parameters
+        ----------
+        path : str
+            Path to the model file within the bucket
+        bucket_name : str
+            Name of the bucket to retrieve from
+        chunk_size : int, optional
+            Maximum size of each yielded chunk in bytes, by default 1 MiB
+        offset : int, optional
+            Start position of the content to read, by default 0
+        length : int, optional
+            Number of bytes to read, by default 0 (read to the end)
+
+        Returns
+        -------
+        Iterator[bytes]
+            Iterator over the requested file content as stored, compressed
+            files are not decompressed
+
+        Raises
+        ------
+        ModelNotFoundError
+            If the model file does not exist
+        StorageError
+            If retrieving the model fails
+        """
+        try:
+            response = self.client.get_object(bucket_name, path, offset=offset, length=length)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                logger.error(f"Model not found: {bucket_name}/{path}")
+                raise ModelNotFoundError(path)
+            logger.error(f"Failed to retrieve model: {str(e)}")
+            raise StorageError(f"Failed to retrieve model: {str(e)}")
+        except MinioException as e:
+            logger.error(f"Failed to retrieve model: {str(e)}")
+            raise StorageError(f"Failed to retrieve model: {str(e)}")
+
+        return self._iter_response(response, chunk_size)
+
+    @staticmethod
+    def _iter_response(response: urllib3.BaseHTTPResponse, chunk_size: int) -> Iterator[bytes]:
+        """Yield chunks of an object response and release its connection when done."""
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
     def delete_model(self, path: str, bucket_name: str) -> None:
         """
         Delete a model file from MinIO.
@@ -213,3 +605,130 @@ class MinioStorage(BaseStorage):
         except S3Error as e:
             logger.error(f"Failed to delete model: {str(e)}")
             raise StorageError(f"Failed to delete model: {str(e)}")
+
+    def prepare_buckets(self, bucket_names: Iterable[str]) -> None:
+        """
+        Learn the existing buckets and create missing ones ahead of their first use.
+
+        Listing the buckets also opens the first pooled connection to MinIO.
+
+        Parameters
+        ----------
+        bucket_names : Iterable[str]
+            Names of the buckets to create if missing
+
+        Raises
+        ------
+        StorageError
+            If listing or creating buckets fails
+        """
+        try:
+            self._known_buckets.update(bucket.name for bucket in self.client.list_buckets())
+        except (MinioException, urllib3.exceptions.HTTPError) as e:
+            logger.error(f"Failed to list buckets: {str(e)}")
+            raise StorageError(f"Failed to list buckets: {str(e)}")
+        for bucket_name in bucket_names:
+            self._ensure_bucket(bucket_name)
+
+    def presigned_download_url(
+        self,
+        path: str,
+        bucket_name: str,
+        expires: int,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Sign a ``GET`` URL of a model file, valid for ``expires`` seconds.
+
+        Parameters
+        ----------
+        path : str
+            Path of the model file within the bucket
+        bucket_name : str
+            Name of the bucket
+        expires : int
+            Seconds the URL stays valid
+        response_headers : Dict[str, str], optional
+            Headers MinIO sets on the response, sent as ``response-*`` query parameters
+
+        Returns
+        -------
+        str
+            Signed URL on ``settings.MINIO_PUBLIC_ENDPOINT``
+
+        Raises
+        ------
+        StorageError
+            If the URL cannot be signed
+        """
+        params = {
+            f"response-{name.lower()}": value for name, value in (response_headers or {}).items()
+        }
+        try:
+            return self.presign_client.get_presigned_url(
+                "GET",
+                bucket_name,
+                path,
+                expires=timedelta(seconds=expires),
+                response_headers=params,
+            )
+
+        except (MinioException, ValueError) as e:
+            logger.error(f"Failed to sign download of {bucket_name}/{path}: {str(e)}")
+            raise StorageError(f"Failed to sign download: {str(e)}")
+
+    def presigned_upload_part_url(
+        self, path: str, bucket_name: str, upload_id: str, part_number: int, expires: int
+    ) -> Optional[str]:
+        """
+        Sign a ``PUT`` URL of one part of a multipart upload, valid for ``expires`` seconds.
+
+        Parameters
+        ----------
+        path : str
+            Path of the assembled object within the bucket
+        bucket_name : str
+            Name of the bucket
+        upload_id : str
+            MinIO upload ID
+        part_number : int
+            Part number between 1 and 10000
+        expires : int
+            Seconds the URL stays valid
+
+        Returns
+        -------
+        str
+            Signed URL on ``settings.MINIO_PUBLIC_ENDPOINT``
+
+        Raises
+        ------
+        StorageError
+            If the URL cannot be signed
+        """
+        try:
+            return self.presign_client.get_presigned_url(
+                "PUT",
+                bucket_name,
+                path,
+                expires=timedelta(seconds=expires),
+                extra_query_params={"uploadId": upload_id, "partNumber": str(part_number)},
+            )
+
+        except (MinioException, ValueError) as e:
+            logger.error(f"Failed to sign upload of part {part_number}: {str(e)}")
+            raise StorageError(f"Failed to sign upload of part {part_number}: {str(e)}")
+
+    def ping(self) -> None:
+        """
+        Check that the MinIO server answers.
+
+        Raises
+        ------
+        StorageError
+            If the request fails
+        """
+        try:
+            self.client.bucket_exists(settings.MINIO_BUCKET)
+        except (MinioException, urllib3.exceptions.HTTPError) as e:
+            raise StorageError(f"MinIO unavailable: {str(e)}")
@@ -6,17 +6,60 @@ using MongoDB for storing model metadata.
 """
 
 import logging
-from typing import Dict, Any
-from pymongo import MongoClient
+from typing import Dict, Any, List, Optional, Tuple
+from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING, ReturnDocument
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError, OperationFailure
+import datetime
 
-from .base import BaseMetadataStorage
+from .base import BLOB_FIELDS, BaseMetadataStorage
 from ..core.config import settings
-from ..exceptions import RegistryError
+from ..exceptions import RegistryError, DuplicateModelError, ModelNotFoundError
+from ..metrics import instrument_storage
 
 logger = logging.getLogger(__name__)
 
+# Fields list_metadata can order by, each backed by a (field, _id) index
+SORT_FIELDS = ("registration_time", "name", "version")
 
+# Keyset pagination needs an index whose prefix covers the equality filters,
+# followed by the sort field and _id. MongoDB walks these in either direction.
+LIST_INDEXES = (
+    [
+        IndexModel([(field, DESCENDING), ("_id", DESCENDING)], name=f"{field}_id")
+        for field in SORT_FIELDS
+    ]
+    + [
+        IndexModel(
+            [(field, ASCENDING), ("registration_time", DESCENDING), ("_id", DESCENDING)],
+            name=f"{field}_time_id",
+        )
+        for field in ("name", "framework", "storage_group")
+    ]
+    + [
+        IndexModel(
+            [("name", ASCENDING), ("version", DESCENDING), ("_id", DESCENDING)],
+            name="name_version_id",
+        ),
+        IndexModel([("tags.$**", ASCENDING)], name="tags_wildcard"),
+    ]
+)
+
+# One document per model version
+UNIQUE_VERSION_INDEX = IndexModel(
+    [("name", ASCENDING), ("version", ASCENDING)], unique=True, name="name_version_unique"
+)
+
+ALIAS_INDEXES = [
+    IndexModel([("name", ASCENDING), ("alias", ASCENDING)], unique=True, name="name_alias_unique")
+]
+
+# Blob records are keyed by "<bucket>/<sha256>", this finds copies in other buckets
+BLOB_INDEXES = [IndexModel([("sha256", ASCENDING), ("ready", ASCENDING)], name="sha256_ready")]
+
+
+@instrument_storage("mongo")
 class MongoStorage(BaseMetadataStorage):
     """
     MongoDB-based implementation of model metadata storage.
@@ -33,6 +76,12 @@ class MongoStorage(BaseMetadataStorage):
         MongoDB database instance
     collection : Collection
         MongoDB collection for storing model metadata
+    aliases : Collection
+        MongoDB collection mapping (model name, alias) to a metadata ID
+    blobs : Collection
+        MongoDB collection of content-addressed blobs and their reference counts
+    upload_sessions : Collection
+        MongoDB collection of chunked upload sessions in progress
     """
 
     def __init__(self):
@@ -45,14 +94,37 @@ class MongoStorage(BaseMetadataStorage):
             If connection to MongoDB server fails
         """
         try:
-            self.client = MongoClient(settings.MONGODB_URL)
+            self.client = MongoClient(
+                settings.MONGODB_URL,
+                maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            )
             self.db = self.client[settings.MONGODB_DB]
             self.collection = self.db.models
+            self.aliases = self.db.model_aliases
+            self.blobs = self.db.model_blobs
+            self.upload_sessions = self.db.upload_sessions
+            self._ensure_indexes()
             logger.info("Successfully initialized MongoDB storage")
         except Exception as e:
             logger.error(f"Failed to initialize MongoDB client: {str(e)}")
             raise RegistryError(f"MongoDB initialization failed: {str(e)}")
 
+    def _ensure_indexes(self) -> None:
+        """Create the secondary indexes used by listing queries, a no-op if they exist."""
+        names = self.collection.create_indexes(LIST_INDEXES)
+        names += self.aliases.create_indexes(ALIAS_INDEXES)
+        names += self.blobs.create_indexes(BLOB_INDEXES)
+        try:
+            names += self.collection.create_indexes([UNIQUE_VERSION_INDEX])
+        except OperationFailure as e:
+            # Registries created before versions were unique may hold duplicates
+            logger.warning(
+                "Could not create unique (name, version) index, "
+                f"remove duplicate versions: {str(e)}"
+            )
+        logger.info(f"Ensured metadata indexes: {', '.join(names)}")
+
     def store_metadata(self, metadata: Dict[str, Any]) -> str:
         """
         Store model metadata in MongoDB.
@@ -69,6 +141,8 @@ class MongoStorage(BaseMetadataStorage):
 
         Raises
         ------
+        DuplicateModelError
+            If a model with the same name and version is already stored
         RegistryError
             If storing the metadata fails
         """
@@ -78,6 +152,8 @@ class MongoStorage(BaseMetadataStorage):
             result = self.collection.insert_one(metadata)
             logger.info(f"Successfully stored metadata with ID: {result.inserted_id}")
             return str(result.inserted_id)
+        except DuplicateKeyError:
+            raise DuplicateModelError(f"{metadata.get('name')} v{metadata.get('version')}")
         except Exception as e:
             logger.error(f"Failed to store metadata: {str(e)}")
             raise RegistryError(f"Failed to store metadata: {str(e)}")
@@ -98,19 +174,674 @@ class MongoStorage(BaseMetadataStorage):
 
         Raises
         ------
+        ModelNotFoundError
+            If no metadata exists for the given ID
         RegistryError
-            If retrieving the metadata fails or model not found
+            If retrieving the metadata fails
         """
         try:
-            result = self.collection.find_one({"_id": ObjectId(model_id)})
+            try:
+                object_id = ObjectId(model_id)
+            except (InvalidId, TypeError):
+                raise ModelNotFoundError(model_id)
+            result = self.collection.find_one({"_id": object_id})
             if not result:
                 logger.error(f"Metadata not found for ID: {model_id}")
-                raise RegistryError(f"Metadata not found: {model_id}")
+                raise ModelNotFoundError(model_id)
 
             # Convert ObjectId to string for JSON serialization
             result["_id"] = str(result["_id"])
             return result
 
+        except ModelNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to retrieve metadata: {str(e)}")
             raise RegistryError(f"Failed to retrieve metadata: {str(e)}")
+
+    def get_metadata_many(self, model_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata of several models with a single ``$in`` query.
+
+        Parameters
+        ----------
+        model_ids : List[str]
+            Unique identifiers of the models
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Metadata keyed by model ID. Unknown and malformed IDs are left out.
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        object_ids = []
+        for model_id in model_ids:
+            try:
+                object_ids.append(ObjectId(model_id))
+            except (InvalidId, TypeError):
+                logger.warning(f"Skipping invalid metadata ID: {model_id}")
+
+        if not object_ids:
+            return {}
+
+        try:
+            results = {}
+            for result in self.collection.find({"_id": {"$in": object_ids}}):
+                result["_id"] = str(result["_id"])
+                results[result["_id"]] = result
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve metadata batch: {str(e)}")
+            raise RegistryError(f"Failed to retrieve metadata batch: {str(e)}")
+
+    def list_metadata(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        after: Optional[Tuple[Any, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List model metadata with filters and keyset pagination.
+
+        Instead of skipping over earlier pages, the query resumes right after
+        the ``(sort value, _id)`` of the previous page, so every page is an
+        index range scan of ``limit`` documents regardless of its depth.
+
+        Parameters
+        ----------
+        filters : Dict[str, Any]
+            Filters as described in ``BaseMetadataStorage.list_metadata``
+        sort : str, optional
+            Field to order by, one of ``SORT_FIELDS``
+        descending : bool, optional
+            Sort direction, by default True
+        limit : int, optional
+            Maximum number of documents to return, by default 50
+        after : Tuple[Any, str], optional
+            Sort value and ID of the last document of the previous page
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Matching metadata documents
+
+        Raises
+        ------
+        RegistryError
+            If the sort field is unknown or the query fails
+        """
+        if sort not in SORT_FIELDS:
+            raise RegistryError(f"Unsupported sort field: {sort}")
+
+        query: Dict[str, Any] = {
+            field: filters[field]
+            for field in ("name", "version", "framework", "storage_group")
+            if filters.get(field) is not None
+        }
+        for key, value in (filters.get("tags") or {}).items():
+            query[f"tags.{key}"] = value
+
+        time_range = {}
+        if filters.get("registered_after") is not None:
+            time_range["$gte"] = filters["registered_after"]
+        if filters.get("registered_before") is not None:
+            time_range["$lt"] = filters["registered_before"]
+        if time_range:
+            query["registration_time"] = time_range
+
+        try:
+            if after is not None:
+                value, last_id = after
+                op = "$lt" if descending else "$gt"
+                keyset = {
+                    "$or": [{sort: {op: value}}, {sort: value, "_id": {op: ObjectId(last_id)}}]
+                }
+                query = {"$and": [query, keyset]} if query else keyset
+
+            direction = DESCENDING if descending else ASCENDING
+            results = []
+            for result in (
+                self.collection.find(query)
+                .sort([(sort, direction), ("_id", direction)])
+                .limit(limit)
+            ):
+                result["_id"] = str(result["_id"])
+                results.append(result)
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to list metadata: {str(e)}")
+            raise RegistryError(f"Failed to list metadata: {str(e)}")
+
+    def get_latest_metadata(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the most recently registered version of a model.
+
+        Answered by the first entry of the (name, registration_time, _id) index.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Metadata of the newest version, or None if the model is unknown
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            result = self.collection.find_one(
+                {"name": name}, sort=[("registration_time", DESCENDING), ("_id", DESCENDING)]
+            )
+            if result:
+                result["_id"] = str(result["_id"])
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve latest metadata: {str(e)}")
+            raise RegistryError(f"Failed to retrieve latest metadata: {str(e)}")
+
+    def get_alias(self, name: str, alias: str) -> Optional[str]:
+        """
+        Look up the metadata ID an alias of a model points to.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+
+        Returns
+        -------
+        Optional[str]
+            Metadata ID, or None if the alias is not set
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            result = self.aliases.find_one({"name": name, "alias": alias})
+            return result["metadata_id"] if result else None
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve alias: {str(e)}")
+            raise RegistryError(f"Failed to retrieve alias: {str(e)}")
+
+    def set_alias(self, name: str, alias: str, model_id: str) -> None:
+        """
+        Point an alias of a model to a metadata ID.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+        model_id : str
+            Metadata ID the alias should point to
+
+        Raises
+        ------
+        RegistryError
+            If storing the alias fails
+        """
+        try:
+            self.aliases.update_one(
+                {"name": name, "alias": alias},
+                {
+                    "$set": {
+                        "metadata_id": model_id,
+                        "updated_at": datetime.datetime.now(datetime.timezone.utc),
+                    }
+                },
+                upsert=True,
+            )
+            logger.info(f"Alias {name}@{alias} now points to {model_id}")
+
+        except Exception as e:
+            logger.error(f"Failed to set alias: {str(e)}")
+            raise RegistryError(f"Failed to set alias: {str(e)}")
+
+    def delete_alias(self, name: str, alias: str) -> bool:
+        """
+        Remove an alias of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+
+        Returns
+        -------
+        bool
+            True if the alias existed
+
+        Raises
+        ------
+        RegistryError
+            If removing the alias fails
+        """
+        try:
+            return self.aliases.delete_one({"name": name, "alias": alias}).deleted_count > 0
+
+        except Exception as e:
+            logger.error(f"Failed to delete alias: {str(e)}")
+            raise RegistryError(f"Failed to delete alias: {str(e)}")
+
+    def delete_metadata(self, model_id: str) -> bool:
+        """
+        Delete model metadata by ID.
+
+        Parameters
+        ----------
+        model_id : str
+            Unique identifier of the model
+
+        Returns
+        -------
+        bool
+            True if the metadata existed
+
+        Raises
+        ------
+        RegistryError
+            If deleting the metadata fails
+        """
+        try:
+            deleted = self.collection.delete_one({"_id": ObjectId(model_id)}).deleted_count > 0
+            logger.info(f"Deleted metadata with ID: {model_id}")
+            return deleted
+
+        except Exception as e:
+            logger.error(f"Failed to delete metadata: {str(e)}")
+            raise RegistryError(f"Failed to delete metadata: {str(e)}")
+
+    def acquire_blob(self, bucket_name: str, digest: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically add a reference to a blob, creating its record if new.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        path : str
+            Object path of the blob
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Blob record after the increment, or None if the blob is being deleted
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            # The filter skips records being deleted, upserting one of them collides on its _id
+            return self.blobs.find_one_and_update(
+                {"_id": f"{bucket_name}/{digest}", "deleting": {"$ne": True}},
+                {
+                    "$inc": {"refcount": 1},
+                    "$setOnInsert": {
+                        "bucket": bucket_name,
+                        "sha256": digest,
+                        "path": path,
+                        "ready": False,
+                        "created_at": datetime.datetime.now(datetime.timezone.utc),
+                    },
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+
+        except DuplicateKeyError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to acquire blob: {str(e)}")
+            raise RegistryError(f"Failed to acquire blob: {str(e)}")
+
+    def mark_blob_ready(self, bucket_name: str, digest: str, storage_info: Dict[str, Any]) -> None:
+        """
+        Record that a blob's content is stored.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        storage_info : Dict[str, Any]
+            Storage information of the stored content, its size, etag and
+            (for compressed content) codec and stored size are kept
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            fields = {key: storage_info[key] for key in BLOB_FIELDS if key in storage_info}
+            self.blobs.update_one(
+                {"_id": f"{bucket_name}/{digest}"}, {"$set": {"ready": True, **fields}}
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to mark blob ready: {str(e)}")
+            raise RegistryError(f"Failed to mark blob ready: {str(e)}")
+
+    def release_blob(self, bucket_name: str, digest: str, owner: str) -> Optional[Dict[str, Any]]:
+        """
+        Drop a reference to a blob and mark it as being deleted when none are left.
+
+        The record stays as a tombstone until ``remove_blob``, so the content
+        cannot be stored again under the same path while it is deleted. The
+        tombstone holds a deletion lease of ``owner`` starting now.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller as the one deleting the blob
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Blob record if the last reference was dropped and the record marked
+            as being deleted, otherwise None
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        blob_id = f"{bucket_name}/{digest}"
+        try:
+            blob = self.blobs.find_one_and_update(
+                {"_id": blob_id, "deleting": {"$ne": True}},
+                {"$inc": {"refcount": -1}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if blob is None or blob["refcount"] > 0:
+                return None
+            # A concurrent acquire re-increments the count, which keeps the record and its content
+            return self.blobs.find_one_and_update(
+                {"_id": blob_id, "refcount": {"$lte": 0}, "deleting": {"$ne": True}},
+                {
+                    "$set": {
+                        "deleting": True,
+                        "ready": False,
+                        "deleting_owner": owner,
+                        "deleting_since": datetime.datetime.now(datetime.timezone.utc),
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to release blob: {str(e)}")
+            raise RegistryError(f"Failed to release blob: {str(e)}")
+
+    def reclaim_blob(
+        self, bucket_name: str, digest: str, owner: str, expired_before: datetime.datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Take over the deletion of a blob whose deletion lease expired.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller as the one deleting the blob from now on
+        expired_before : datetime.datetime
+            Leases started before this time are expired
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Blob record if its lease was taken over, otherwise None
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            # Tombstones written before deletions were leased have no start time
+            return self.blobs.find_one_and_update(
+                {
+                    "_id": f"{bucket_name}/{digest}",
+                    "deleting": True,
+                    "$or": [
+                        {"deleting_since": {"$lt": expired_before}},
+                        {"deleting_since": {"$exists": False}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "deleting_owner": owner,
+                        "deleting_since": datetime.datetime.now(datetime.timezone.utc),
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to reclaim blob: {str(e)}")
+            raise RegistryError(f"Failed to reclaim blob: {str(e)}")
+
+    def remove_blob(self, bucket_name: str, digest: str, owner: str) -> bool:
+        """
+        Remove the record of a blob marked as being deleted.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token the deletion lease was taken with
+
+        Returns
+        -------
+        bool
+            True if the record was removed, False if it is unknown or its
+            deletion was taken over by another owner
+
+        Raises
+        ------
+        RegistryError
+            If the delete fails
+        """
+        try:
+            return self.blobs.delete_one(
+                {"_id": f"{bucket_name}/{digest}", "deleting": True, "deleting_owner": owner}
+            ).deleted_count > 0
+
+        except Exception as e:
+            logger.error(f"Failed to remove blob: {str(e)}")
+            raise RegistryError(f"Failed to remove blob: {str(e)}")
+
+    def find_blob(self, digest: str, bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored blob by content digest.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 hex digest of the blob content
+        bucket_name : str, optional
+            Bucket to look in, any bucket if not given
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Record of a ready blob, or None
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            if bucket_name is not None:
+                return self.blobs.find_one({"_id": f"{bucket_name}/{digest}", "ready": True})
+            return self.blobs.find_one({"sha256": digest, "ready": True})
+
+        except Exception as e:
+            logger.error(f"Failed to find blob: {str(e)}")
+            raise RegistryError(f"Failed to find blob: {str(e)}")
+
+    def create_upload_session(self, session: Dict[str, Any]) -> str:
+        """
+        Store the state of a new chunked upload session.
+
+        Parameters
+        ----------
+        session : Dict[str, Any]
+            Session state, its ``_id`` is the session identifier
+
+        Returns
+        -------
+        str
+            Identifier of the session
+
+        Raises
+        ------
+        RegistryError
+            If storing the session fails
+        """
+        try:
+            return str(self.upload_sessions.insert_one({**session, "parts": {}}).inserted_id)
+
+        except Exception as e:
+            logger.error(f"Failed to create upload session: {str(e)}")
+            raise RegistryError(f"Failed to create upload session: {str(e)}")
+
+    def get_upload_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Session state, or None if the session is unknown
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            return self.upload_sessions.find_one({"_id": session_id})
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve upload session: {str(e)}")
+            raise RegistryError(f"Failed to retrieve upload session: {str(e)}")
+
+    def record_upload_part(self, session_id: str, part_number: int, etag: str, size: int) -> bool:
+        """
+        Record a stored part of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        part_number : int
+            Position of the part
+        etag : str
+            ETag of the stored part
+        size : int
+            Size of the part in bytes
+
+        Returns
+        -------
+        bool
+            False if the session no longer exists
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            result = self.upload_sessions.update_one(
+                {"_id": session_id},
+                {"$set": {f"parts.{part_number}": {"etag": etag, "size": size}}},
+            )
+            return result.matched_count > 0
+
+        except Exception as e:
+            logger.error(f"Failed to record upload part: {str(e)}")
+            raise RegistryError(f"Failed to record upload part: {str(e)}")
+
+    def delete_upload_session(self, session_id: str) -> bool:
+        """
+        Delete the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        bool
+            True if the session existed
+
+        Raises
+        ------
+        RegistryError
+            If the deletion fails
+        """
+        try:
+            return self.upload_sessions.delete_one({"_id": session_id}).deleted_count > 0
+
+        except Exception as e:
+            logger.error(f"Failed to delete upload session: {str(e)}")
+            raise RegistryError(f"Failed to delete upload session: {str(e)}")
+
+    def ping(self) -> None:
+        """
+        Check that the MongoDB server answers.
+
+        Raises
+        ------
+        RegistryError
+            If the ping command fails
+        """
+        try:
+            self.client.admin.command("ping")
+        except Exception as e:
+            raise RegistryError(f"MongoDB unavailable: {str(e)}")
@@ -0,0 +1,952 @@
+"""
+SQLite storage implementation for model metadata.
+
+This module provides a concrete implementation of the BaseMetadataStorage
+interface using an embedded SQLite database, for single node registries and
+CI runs that should not need a MongoDB server.
+
+Notes
+-----
+The database runs in WAL mode, so readers never block the writer. Every
+thread gets its own connection. Fields that are filtered or sorted on are
+stored in columns with indexes mirroring the MongoDB ones. ``metrics``,
+``parameters`` and ``tags`` are JSON columns; the remaining fields are kept
+in a JSON ``document`` column.
+"""
+
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from bson import ObjectId
+
+from .base import BLOB_FIELDS, BaseMetadataStorage
+from ..core.config import settings
+from ..exceptions import RegistryError, DuplicateModelError, ModelNotFoundError
+from ..metrics import instrument_storage
+
+logger = logging.getLogger(__name__)
+
+# Fields list_metadata can order by, each backed by a (field, id) index
+SORT_FIELDS = ("registration_time", "name", "version")
+
+# Fields stored in columns of their own, filters compare them for equality
+COLUMN_FIELDS = ("name", "version", "framework", "storage_group")
+JSON_FIELDS = ("metrics", "parameters", "tags")
+
+# SQLite limits the number of bound parameters per statement
+MAX_IDS_PER_QUERY = 500
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS models (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    framework TEXT,
+    storage_group TEXT,
+    registration_time TEXT,
+    metrics TEXT,
+    parameters TEXT,
+    tags TEXT,
+    document TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS name_version_unique ON models (name, version);
+CREATE INDEX IF NOT EXISTS registration_time_id ON models (registration_time, id);
+CREATE INDEX IF NOT EXISTS name_id ON models (name, id);
+CREATE INDEX IF NOT EXISTS version_id ON models (version, id);
+CREATE INDEX IF NOT EXISTS name_time_id ON models (name, registration_time, id);
+CREATE INDEX IF NOT EXISTS framework_time_id ON models (framework, registration_time, id);
+CREATE INDEX IF NOT EXISTS storage_group_time_id ON models (storage_group, registration_time, id);
+CREATE INDEX IF NOT EXISTS name_version_id ON models (name, version, id);
+
+CREATE TABLE IF NOT EXISTS model_aliases (
+    name TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    metadata_id TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (name, alias)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS model_blobs (
+    id TEXT PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    path TEXT NOT NULL,
+    ready INTEGER NOT NULL DEFAULT 0,
+    refcount INTEGER NOT NULL DEFAULT 0,
+    deleting INTEGER NOT NULL DEFAULT 0,
+    deleting_owner TEXT,
+    deleting_since TEXT,
+    created_at TEXT NOT NULL,
+    {", ".join(BLOB_FIELDS)}
+);
+CREATE INDEX IF NOT EXISTS sha256_ready ON model_blobs (sha256, ready);
+
+CREATE TABLE IF NOT EXISTS upload_sessions (
+    id TEXT PRIMARY KEY,
+    document TEXT NOT NULL,
+    parts TEXT NOT NULL DEFAULT '{{}}'
+);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON does not support, datetimes as ISO 8601 strings."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default)
+
+
+def _time_key(value: Any) -> Optional[str]:
+    """
+    Normalize a timestamp to an ISO 8601 UTC string of fixed width.
+
+    Strings of this form sort chronologically, so they can be compared and
+    indexed as text. Naive datetimes are taken to be UTC, like MongoDB does.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc).isoformat(timespec="microseconds")
+
+
+def _now() -> str:
+    return _time_key(datetime.datetime.now(datetime.timezone.utc))
+
+
+@instrument_storage("sqlite")
+class SQLiteMetadataStorage(BaseMetadataStorage):
+    """
+    SQLite-based implementation of model metadata storage.
+
+    Documents are returned in the shape ``MongoStorage`` returns them: the
+    metadata ID as a 24 character hex ``_id`` and ``registration_time`` as a
+    datetime. Other datetimes nested in documents come back as ISO 8601 strings.
+
+    Parameters
+    ----------
+    path : str, optional
+        Database file, created if missing, by default ``settings.SQLITE_PATH``
+
+    Attributes
+    ----------
+    path : str
+        Path of the database file
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open the database and create its tables and indexes if necessary.
+
+        Raises
+        ------
+        RegistryError
+            If the database cannot be opened or initialized
+        """
+        self.path = path or settings.SQLITE_PATH
+        self._local = threading.local()
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = self._connection()
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            columns = {row["name"] for row in connection.execute("PRAGMA table_info(model_blobs)")}
+            # Databases created before blobs were tombstoned, and their deletions leased
+            for column, definition in (
+                ("deleting", "INTEGER NOT NULL DEFAULT 0"),
+                ("deleting_owner", "TEXT"),
+                ("deleting_since", "TEXT"),
+            ):
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE model_blobs ADD COLUMN {column} {definition}")
+            logger.info(f"Successfully initialized SQLite storage in {self.path}")
+        except Exception as e:
+            logger.error(f"Failed to initialize SQLite storage: {str(e)}")
+            raise RegistryError(f"SQLite initialization failed: {str(e)}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit, every write is a single atomic statement
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        return self._connection().execute(sql, params)
+
+    @staticmethod
+    def _document(row: sqlite3.Row) -> Dict[str, Any]:
+        """Rebuild a metadata document from its row."""
+        document = json.loads(row["document"])
+        document["_id"] = row["id"]
+        for field in COLUMN_FIELDS:
+            document[field] = row[field]
+        for field in JSON_FIELDS:
+            if row[field] is not None:
+                document[field] = json.loads(row[field])
+        if row["registration_time"] is not None:
+            document["registration_time"] = datetime.datetime.fromisoformat(
+                row["registration_time"]
+            )
+        return document
+
+    @staticmethod
+    def _blob(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        """Convert a blob row to a record, leaving out storage fields that were never set."""
+        if row is None:
+            return None
+        blob = {
+            "_id": row["id"],
+            "bucket": row["bucket"],
+            "sha256": row["sha256"],
+            "path": row["path"],
+            "ready": bool(row["ready"]),
+            "refcount": row["refcount"],
+            "created_at": datetime.datetime.fromisoformat(row["created_at"]),
+        }
+        blob.update({key: row[key] for key in BLOB_FIELDS if row[key] is not None})
+        return blob
+
+    def store_metadata(self, metadata: Dict[str, Any]) -> str:
+        """
+        Store model metadata in SQLite.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            Dictionary containing model metadata
+
+        Returns
+        -------
+        str
+            Unique identifier of the stored metadata, an ObjectId hex string
+
+        Raises
+        ------
+        DuplicateModelError
+            If a model with the same name and version is already stored
+        RegistryError
+            If storing the metadata fails
+        """
+        model_id = str(ObjectId())
+        skipped = ("_id", "registration_time") + COLUMN_FIELDS + JSON_FIELDS
+        document = {key: value for key, value in metadata.items() if key not in skipped}
+        try:
+            self._execute(
+                "INSERT INTO models (id, name, version, framework, storage_group, "
+                "registration_time, metrics, parameters, tags, document) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    model_id,
+                    *(metadata.get(field) for field in COLUMN_FIELDS),
+                    _time_key(metadata.get("registration_time")),
+                    *(
+                        _dumps(metadata[field]) if field in metadata else None
+                        for field in JSON_FIELDS
+                    ),
+                    _dumps(document),
+                ),
+            )
+            logger.info(f"Successfully stored metadata with ID: {model_id}")
+            return model_id
+        except sqlite3.IntegrityError:
+            raise DuplicateModelError(f"{metadata.get('name')} v{metadata.get('version')}")
+        except Exception as e:
+            logger.error(f"Failed to store metadata: {str(e)}")
+            raise RegistryError(f"Failed to store metadata: {str(e)}")
+
+    def get_metadata(self, model_id: str) -> Dict[str, Any]:
+        """
+        Retrieve model metadata from SQLite by ID.
+
+        Parameters
+        ----------
+        model_id : str
+            Unique identifier of the model
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing the model metadata
+
+        Raises
+        ------
+        ModelNotFoundError
+            If no metadata exists for the given ID
+        RegistryError
+            If retrieving the metadata fails
+        """
+        try:
+            row = self._execute("SELECT * FROM models WHERE id = ?", (model_id,)).fetchone()
+            if row is None:
+                logger.error(f"Metadata not found for ID: {model_id}")
+                raise ModelNotFoundError(model_id)
+            return self._document(row)
+
+        except ModelNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to retrieve metadata: {str(e)}")
+            raise RegistryError(f"Failed to retrieve metadata: {str(e)}")
+
+    def get_metadata_many(self, model_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata of several models with ``IN`` queries.
+
+        Parameters
+        ----------
+        model_ids : List[str]
+            Unique identifiers of the models
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Metadata keyed by model ID. Unknown IDs are left out.
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            results = {}
+            for start in range(0, len(model_ids), MAX_IDS_PER_QUERY):
+                batch = model_ids[start:start + MAX_IDS_PER_QUERY]
+                placeholders = ", ".join("?" * len(batch))
+                for row in self._execute(
+                    f"SELECT * FROM models WHERE id IN ({placeholders})", tuple(batch)
+                ):
+                    results[row["id"]] = self._document(row)
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve metadata batch: {str(e)}")
+            raise RegistryError(f"Failed to retrieve metadata batch: {str(e)}")
+
+    def list_metadata(
+        self,
+        filters: Dict[str, Any],
+        sort: str = "registration_time",
+        descending: bool = True,
+        limit: int = 50,
+        after: Optional[Tuple[Any, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List model metadata with filters and keyset pagination.
+
+        Pages resume right after the ``(sort value, id)`` of the previous
+        page, so every page is an index range scan of ``limit`` rows.
+
+        Parameters
+        ----------
+        filters : Dict[str, Any]
+            Filters as described in ``BaseMetadataStorage.list_metadata``
+        sort : str, optional
+            Field to order by, one of ``SORT_FIELDS``
+        descending : bool, optional
+            Sort direction, by default True
+        limit : int, optional
+            Maximum number of documents to return, by default 50
+        after : Tuple[Any, str], optional
+            Sort value and ID of the last document of the previous page
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Matching metadata documents
+
+        Raises
+        ------
+        RegistryError
+            If the sort field is unknown or the query fails
+        """
+        if sort not in SORT_FIELDS:
+            raise RegistryError(f"Unsupported sort field: {sort}")
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        for field in COLUMN_FIELDS:
+            if filters.get(field) is not None:
+                clauses.append(f"{field} = ?")
+                params.append(filters[field])
+        for key, value in (filters.get("tags") or {}).items():
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(models.tags) WHERE key = ? AND value = ?)"
+            )
+            params.extend((key, value))
+
+        try:
+            if filters.get("registered_after") is not None:
+                clauses.append("registration_time >= ?")
+                params.append(_time_key(filters["registered_after"]))
+            if filters.get("registered_before") is not None:
+                clauses.append("registration_time < ?")
+                params.append(_time_key(filters["registered_before"]))
+
+            if after is not None:
+                value, last_id = after
+                if sort == "registration_time":
+                    value = _time_key(value)
+                op = "<" if descending else ">"
+                clauses.append(f"({sort} {op} ? OR ({sort} = ? AND id {op} ?))")
+                params.extend((value, value, last_id))
+
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            direction = "DESC" if descending else "ASC"
+            rows = self._execute(
+                f"SELECT * FROM models {where} ORDER BY {sort} {direction}, id {direction} LIMIT ?",
+                (*params, limit),
+            )
+            return [self._document(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to list metadata: {str(e)}")
+            raise RegistryError(f"Failed to list metadata: {str(e)}")
+
+    def get_latest_metadata(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the most recently registered version of a model.
+
+        Answered by the first entry of the (name, registration_time, id) index.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Metadata of the newest version, or None if the model is unknown
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            row = self._execute(
+                "SELECT * FROM models WHERE name = ? "
+                "ORDER BY registration_time DESC, id DESC LIMIT 1",
+                (name,),
+            ).fetchone()
+            return self._document(row) if row is not None else None
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve latest metadata: {str(e)}")
+            raise RegistryError(f"Failed to retrieve latest metadata: {str(e)}")
+
+    def get_alias(self, name: str, alias: str) -> Optional[str]:
+        """
+        Look up the metadata ID an alias of a model points to.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+
+        Returns
+        -------
+        Optional[str]
+            Metadata ID, or None if the alias is not set
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            row = self._execute(
+                "SELECT metadata_id FROM model_aliases WHERE name = ? AND alias = ?", (name, alias)
+            ).fetchone()
+            return row["metadata_id"] if row is not None else None
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve alias: {str(e)}")
+            raise RegistryError(f"Failed to retrieve alias: {str(e)}")
+
+    def set_alias(self, name: str, alias: str, model_id: str) -> None:
+        """
+        Point an alias of a model to a metadata ID.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+        model_id : str
+            Metadata ID the alias should point to
+
+        Raises
+        ------
+        RegistryError
+            If storing the alias fails
+        """
+        try:
+            self._execute(
+                "INSERT INTO model_aliases (name, alias, metadata_id, updated_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name, alias) DO UPDATE SET metadata_id = excluded.metadata_id, "
+                "updated_at = excluded.updated_at",
+                (name, alias, model_id, _now()),
+            )
+            logger.info(f"Alias {name}@{alias} now points to {model_id}")
+
+        except Exception as e:
+            logger.error(f"Failed to set alias: {str(e)}")
+            raise RegistryError(f"Failed to set alias: {str(e)}")
+
+    def delete_alias(self, name: str, alias: str) -> bool:
+        """
+        Remove an alias of a model.
+
+        Parameters
+        ----------
+        name : str
+            Name of the model
+        alias : str
+            Alias of the model
+
+        Returns
+        -------
+        bool
+            True if the alias existed
+
+        Raises
+        ------
+        RegistryError
+            If removing the alias fails
+        """
+        try:
+            cursor = self._execute(
+                "DELETE FROM model_aliases WHERE name = ? AND alias = ?", (name, alias)
+            )
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Failed to delete alias: {str(e)}")
+            raise RegistryError(f"Failed to delete alias: {str(e)}")
+
+    def delete_metadata(self, model_id: str) -> bool:
+        """
+        Delete model metadata by ID.
+
+        Parameters
+        ----------
+        model_id : str
+            Unique identifier of the model
+
+        Returns
+        -------
+        bool
+            True if the metadata existed
+
+        Raises
+        ------
+        RegistryError
+            If deleting the metadata fails
+        """
+        try:
+            deleted = self._execute("DELETE FROM models WHERE id = ?", (model_id,)).rowcount > 0
+            logger.info(f"Deleted metadata with ID: {model_id}")
+            return deleted
+
+        except Exception as e:
+            logger.error(f"Failed to delete metadata: {str(e)}")
+            raise RegistryError(f"Failed to delete metadata: {str(e)}")
+
+    def acquire_blob(self, bucket_name: str, digest: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically add a reference to a blob, creating its record if new.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        path : str
+            Object path of the blob
+
+        Returns
+        -------
+        Dict[str, Any]
+            Blob record after the increment, or None if the blob is being deleted
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            # fetchall steps the statement to completion, releasing the write lock.
+            # Records being deleted are left alone and nothing is returned.
+            rows = self._execute(
+                "INSERT INTO model_blobs (id, bucket, sha256, path, ready, refcount, created_at) "
+                "VALUES (?, ?, ?, ?, 0, 1, ?) "
+                "ON CONFLICT (id) DO UPDATE SET refcount = refcount + 1 "
+                "WHERE deleting = 0 RETURNING *",
+                (f"{bucket_name}/{digest}", bucket_name, digest, path, _now()),
+            ).fetchall()
+            return self._blob(rows[0]) if rows else None
+
+        except Exception as e:
+            logger.error(f"Failed to acquire blob: {str(e)}")
+            raise RegistryError(f"Failed to acquire blob: {str(e)}")
+
+    def mark_blob_ready(self, bucket_name: str, digest: str, storage_info: Dict[str, Any]) -> None:
+        """
+        Record that a blob's content is stored.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        storage_info : Dict[str, Any]
+            Storage information of the stored content, its ``BLOB_FIELDS`` are kept
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            fields = [key for key in BLOB_FIELDS if key in storage_info]
+            assignments = "".join(f", {key} = ?" for key in fields)
+            self._execute(
+                f"UPDATE model_blobs SET ready = 1{assignments} WHERE id = ?",
+                (*(storage_info[key] for key in fields), f"{bucket_name}/{digest}"),
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to mark blob ready: {str(e)}")
+            raise RegistryError(f"Failed to mark blob ready: {str(e)}")
+
+    def release_blob(self, bucket_name: str, digest: str, owner: str) -> Optional[Dict[str, Any]]:
+        """
+        Drop a reference to a blob and mark it as being deleted when none are left.
+
+        The row stays as a tombstone until ``remove_blob``, so the content
+        cannot be stored again under the same path while it is deleted. The
+        tombstone holds a deletion lease of ``owner`` starting now.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller as the one deleting the blob
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Blob record if the last reference was dropped and the row marked
+            as being deleted, otherwise None
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        blob_id = f"{bucket_name}/{digest}"
+        try:
+            rows = self._execute(
+                "UPDATE model_blobs SET refcount = refcount - 1 "
+                "WHERE id = ? AND deleting = 0 RETURNING refcount",
+                (blob_id,),
+            ).fetchall()
+            if not rows or rows[0]["refcount"] > 0:
+                return None
+            # A concurrent acquire re-increments the count, which keeps the record and its content
+            rows = self._execute(
+                "UPDATE model_blobs SET deleting = 1, ready = 0, "
+                "deleting_owner = ?, deleting_since = ? "
+                "WHERE id = ? AND refcount <= 0 AND deleting = 0 RETURNING *",
+                (owner, _now(), blob_id),
+            ).fetchall()
+            return self._blob(rows[0]) if rows else None
+
+        except Exception as e:
+            logger.error(f"Failed to release blob: {str(e)}")
+            raise RegistryError(f"Failed to release blob: {str(e)}")
+
+    def reclaim_blob(
+        self, bucket_name: str, digest: str, owner: str, expired_before: datetime.datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Take over the deletion of a blob whose deletion lease expired.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token identifying the caller as the one deleting the blob from now on
+        expired_before : datetime.datetime
+            Leases started before this time are expired
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Blob record if its lease was taken over, otherwise None
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            # Tombstones written before deletions were leased have no start time
+            rows = self._execute(
+                "UPDATE model_blobs SET deleting_owner = ?, deleting_since = ? "
+                "WHERE id = ? AND deleting = 1 "
+                "AND (deleting_since IS NULL OR deleting_since < ?) RETURNING *",
+                (owner, _now(), f"{bucket_name}/{digest}", _time_key(expired_before)),
+            ).fetchall()
+            return self._blob(rows[0]) if rows else None
+
+        except Exception as e:
+            logger.error(f"Failed to reclaim blob: {str(e)}")
+            raise RegistryError(f"Failed to reclaim blob: {str(e)}")
+
+    def remove_blob(self, bucket_name: str, digest: str, owner: str) -> bool:
+        """
+        Remove the row of a blob marked as being deleted.
+
+        Parameters
+        ----------
+        bucket_name : str
+            Bucket holding the blob
+        digest : str
+            SHA-256 hex digest of the blob content
+        owner : str
+            Token the deletion lease was taken with
+
+        Returns
+        -------
+        bool
+            True if the row was removed, False if it is unknown or its
+            deletion was taken over by another owner
+
+        Raises
+        ------
+        RegistryError
+            If the delete fails
+        """
+        try:
+            return self._execute(
+                "DELETE FROM model_blobs WHERE id = ? AND deleting = 1 AND deleting_owner = ?",
+                (f"{bucket_name}/{digest}", owner),
+            ).rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Failed to remove blob: {str(e)}")
+            raise RegistryError(f"Failed to remove blob: {str(e)}")
+
+    def find_blob(self, digest: str, bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored blob by content digest.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 hex digest of the blob content
+        bucket_name : str, optional
+            Bucket to look in, any bucket if not given
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Record of a ready blob, or None
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            if bucket_name is not None:
+                row = self._execute(
+                    "SELECT * FROM model_blobs WHERE id = ? AND ready = 1",
+                    (f"{bucket_name}/{digest}",),
+                ).fetchone()
+            else:
+                row = self._execute(
+                    "SELECT * FROM model_blobs WHERE sha256 = ? AND ready = 1 LIMIT 1", (digest,)
+                ).fetchone()
+            return self._blob(row)
+
+        except Exception as e:
+            logger.error(f"Failed to find blob: {str(e)}")
+            raise RegistryError(f"Failed to find blob: {str(e)}")
+
+    def create_upload_session(self, session: Dict[str, Any]) -> str:
+        """
+        Store the state of a new chunked upload session.
+
+        Parameters
+        ----------
+        session : Dict[str, Any]
+            Session state, its ``_id`` is the session identifier
+
+        Returns
+        -------
+        str
+            Identifier of the session
+
+        Raises
+        ------
+        RegistryError
+            If storing the session fails
+        """
+        try:
+            document = {key: value for key, value in session.items() if key != "_id"}
+            self._execute(
+                "INSERT INTO upload_sessions (id, document) VALUES (?, ?)",
+                (session["_id"], _dumps(document)),
+            )
+            return session["_id"]
+
+        except Exception as e:
+            logger.error(f"Failed to create upload session: {str(e)}")
+            raise RegistryError(f"Failed to create upload session: {str(e)}")
+
+    def get_upload_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Session state, or None if the session is unknown
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            row = self._execute(
+                "SELECT * FROM upload_sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return {
+                **json.loads(row["document"]),
+                "_id": row["id"],
+                "parts": json.loads(row["parts"]),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve upload session: {str(e)}")
+            raise RegistryError(f"Failed to retrieve upload session: {str(e)}")
+
+    def record_upload_part(self, session_id: str, part_number: int, etag: str, size: int) -> bool:
+        """
+        Record a stored part of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+        part_number : int
+            Position of the part
+        etag : str
+            ETag of the stored part
+        size : int
+            Size of the part in bytes
+
+        Returns
+        -------
+        bool
+            False if the session no longer exists
+
+        Raises
+        ------
+        RegistryError
+            If the update fails
+        """
+        try:
+            cursor = self._execute(
+                "UPDATE upload_sessions "
+                "SET parts = json_set(parts, ?, json_object('etag', ?, 'size', ?)) WHERE id = ?",
+                (f'$."{int(part_number)}"', etag, size, session_id),
+            )
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Failed to record upload part: {str(e)}")
+            raise RegistryError(f"Failed to record upload part: {str(e)}")
+
+    def delete_upload_session(self, session_id: str) -> bool:
+        """
+        Delete the state of an upload session.
+
+        Parameters
+        ----------
+        session_id : str
+            Identifier of the session
+
+        Returns
+        -------
+        bool
+            True if the session existed
+
+        Raises
+        ------
+        RegistryError
+            If the deletion fails
+        """
+        try:
+            return (
+                self._execute("DELETE FROM upload_sessions WHERE id = ?", (session_id,)).rowcount
+                > 0
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to delete upload session: {str(e)}")
+            raise RegistryError(f"Failed to delete upload session: {str(e)}")
+
+    def ping(self) -> None:
+        """
+        Check that the database can be queried.
+
+        Raises
+        ------
+        RegistryError
+            If the query fails
+        """
+        try:
+            self._execute("SELECT 1").fetchall()
+        except sqlite3.Error as e:
+            raise RegistryError(f"SQLite metadata storage unavailable: {str(e)}")
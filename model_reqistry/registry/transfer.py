@@ -0,0 +1,445 @@
+"""
+Parallel transfer helpers for the registry client.
+
+This module provides a transfer manager that splits large model files into
+byte ranges and moves them concurrently over a shared ``requests.Session``
+connection pool. Downloads write each part straight into a preallocated file,
+uploads read each part of the source file into its own upload session request.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import time
+
+import requests
+
+from .schemas import TransferStats
+from .logger import logger
+
+
+class TransferError(Exception):
+    """
+    Exception raised when a parallel transfer fails.
+
+    This covers parts that cannot be fetched within the retry budget,
+    servers returning unexpected ranges, and checksum mismatches.
+    """
+
+    pass
+
+
+def _parse_content_range(content_range: Optional[str]) -> Tuple[int, int, int]:
+    """Parse a ``bytes start-end/size`` header into its three integers."""
+    try:
+        unit, _, spec = content_range.partition(" ")
+        positions, _, size = spec.partition("/")
+        start, _, end = positions.partition("-")
+        if unit != "bytes":
+            raise ValueError(unit)
+        return int(start), int(end), int(size)
+    except (AttributeError, ValueError):
+        raise TransferError(f"Invalid Content-Range header: {content_range!r}")
+
+
+def _preallocate(path: str, size: int) -> None:
+    """Create ``path`` with ``size`` bytes reserved on disk."""
+    with open(path, "wb") as f:
+        if size and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            f.truncate(size)
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to hash
+    chunk_size : int, optional
+        Read size in bytes, by default 1 MiB
+
+    Returns
+    -------
+    str
+        Hex encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def plan_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """
+    Split ``size`` bytes into inclusive ``(start, end)`` ranges of ``part_size``.
+
+    Parameters
+    ----------
+    size : int
+        Total number of bytes
+    part_size : int
+        Maximum number of bytes per range
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        Consecutive byte ranges covering the whole size
+    """
+    return [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+
+class TransferManager:
+    """
+    Concurrent ranged downloader and part uploader built on a shared HTTP session.
+
+    The first part is requested with a ``Range`` header; its ``Content-Range``
+    reveals the total size, after which the target file is preallocated and
+    the remaining parts are fetched by a thread pool. Each part is retried
+    independently, resuming from the bytes it already wrote. Uploads send
+    fixed-size parts of a local file to an upload session, retrying each
+    failed part on its own.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session whose connection pool is shared by all part requests.
+        Its adapters should allow at least ``max_concurrency`` connections.
+    timeout : int, optional
+        Per-request timeout in seconds. Default is 30.
+    max_concurrency : int, optional
+        Maximum number of parts transferred in parallel. Default is 8.
+    part_size : int, optional
+        Size in bytes of each ranged request. Default is 16 MiB.
+    max_retries : int, optional
+        Maximum number of retries for each part. Default is 3.
+
+    Raises
+    ------
+    ValueError
+        If max_concurrency or part_size is not positive, or max_retries is negative.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        timeout: int = 30,
+        max_concurrency: int = 8,
+        part_size: int = 16 * 1024 * 1024,
+        max_retries: int = 3,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if part_size <= 0:
+            raise ValueError("part_size must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self.session = session
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.part_size = part_size
+        self.max_retries = max_retries
+
+    def download(
+        self,
+        url: str,
+        dest: str,
+        params: Optional[Dict[str, Any]] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> TransferStats:
+        """
+        Download ``url`` into the file ``dest`` using parallel range requests.
+
+        Parameters
+        ----------
+        url : str
+            URL of the file to download.
+        dest : str
+            Destination path. The file is created or overwritten.
+        params : dict, optional
+            Query parameters sent with every request.
+        expected_sha256 : str, optional
+            Hex digest the downloaded file must match.
+
+        Returns
+        -------
+        TransferStats
+            Size, duration, throughput and SHA-256 digest of the transfer.
+
+        Raises
+        ------
+        TransferError
+            If a part cannot be fetched or the checksum does not match.
+        requests.exceptions.RequestException
+            If the initial request fails.
+        """
+        started = time.perf_counter()
+        first_end = self.part_size - 1
+        response = self.session.get(
+            url,
+            params=params,
+            headers={"Range": f"bytes=0-{first_end}"},
+            stream=True,
+            timeout=self.timeout,
+        )
+        if response.status_code != 416:
+            response.raise_for_status()
+
+        if response.status_code == 416:
+            # Empty files cannot satisfy any range
+            response.close()
+            size, parts = 0, 0
+            _preallocate(dest, 0)
+        elif response.status_code != 206:
+            # Server does not support ranges, fall back to a single stream
+            size, parts = 0, 1
+            with response, open(dest, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+                    size += len(chunk)
+        else:
+            _, first_end, size = _parse_content_range(response.headers.get("Content-Range"))
+            etag = response.headers.get("ETag")
+            _preallocate(dest, size)
+
+            ranges = plan_ranges(size, self.part_size)
+            parts = len(ranges)
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = [
+                    executor.submit(
+                        self._fetch_part, url, params, dest, 0, first_end, etag, response
+                    )
+                ]
+                futures += [
+                    executor.submit(self._fetch_part, url, params, dest, start, end, etag)
+                    for start, end in ranges[1:]
+                ]
+                for future in futures:
+                    future.result()
+
+        digest = file_sha256(dest)
+        if expected_sha256 and digest != expected_sha256:
+            raise TransferError(
+                f"Checksum mismatch for {dest}: expected {expected_sha256}, got {digest}"
+            )
+
+        seconds = time.perf_counter() - started
+        stats = TransferStats(
+            path=dest,
+            size=size,
+            parts=parts,
+            seconds=seconds,
+            throughput=size / seconds if seconds > 0 else 0.0,
+            sha256=digest,
+        )
+        logger.info(
+            f"Downloaded {dest}: {size} bytes in {parts} parts, {seconds:.2f}s "
+            f"({stats.throughput / (1024 * 1024):.1f} MiB/s)"
+        )
+        return stats
+
+    def _write_response(self, response: requests.Response, dest: str, start: int, end: int) -> int:
+        """Write a ranged response body into ``dest`` at ``start`` and return bytes written."""
+        written = 0
+        with response, open(dest, "r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                if written + len(chunk) > end - start + 1:
+                    raise TransferError(
+                        f"Server sent more data than requested for bytes {start}-{end}"
+                    )
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def _fetch_part(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        dest: str,
+        start: int,
+        end: int,
+        etag: Optional[str],
+        response: Optional[requests.Response] = None,
+    ) -> None:
+        """
+        Fetch bytes ``start``-``end`` into ``dest``, retrying from the last written byte.
+
+        An already opened ``response`` for the range may be passed in to be
+        consumed on the first attempt.
+        """
+        position = start
+        attempts = 0
+        while position <= end:
+            try:
+                if response is None:
+                    response = self._request_range(url, params, position, end, etag)
+                position += self._write_response(response, dest, position, end)
+                response = None
+                if position <= end:
+                    raise requests.exceptions.ChunkedEncodingError(f"Short read at byte {position}")
+
+            except requests.exceptions.RequestException as e:
+                response = None
+                attempts += 1
+                if attempts > self.max_retries:
+                    raise TransferError(f"Failed to fetch bytes {position}-{end}: {str(e)}")
+                logger.warning(
+                    f"Retrying bytes {position}-{end} ({attempts}/{self.max_retries}): {e}"
+                )
+
+    def _request_range(
+        self, url: str, params: Optional[Dict[str, Any]], start: int, end: int, etag: Optional[str]
+    ) -> requests.Response:
+        """Open a streamed request for bytes ``start``-``end`` and validate the returned range."""
+        headers = {"Range": f"bytes={start}-{end}"}
+        if etag:
+            headers["If-Range"] = etag
+        response = self.session.get(
+            url, params=params, headers=headers, stream=True, timeout=self.timeout
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            response.close()
+            raise TransferError(f"File changed during transfer of bytes {start}-{end}")
+        part_start, part_end, _ = _parse_content_range(response.headers.get("Content-Range"))
+        if part_start != start or part_end != end:
+            response.close()
+            raise TransferError(
+                f"Unexpected range {part_start}-{part_end}, requested {start}-{end}"
+            )
+        return response
+
+    def upload(
+        self,
+        url: str,
+        src: str,
+        part_size: int,
+        sha256: str,
+        direct_parts: Optional[List[Dict[str, Any]]] = None,
+    ) -> TransferStats:
+        """
+        Upload the file ``src`` to an upload session using parallel part requests.
+
+        Part ``n`` (starting at 1) is sent with ``PUT {url}/parts/{n}``.
+
+        Parameters
+        ----------
+        url : str
+            URL of the upload session.
+        src : str
+            Path of the file to upload.
+        part_size : int
+            Size in bytes of each part, the last part may be smaller.
+        sha256 : str
+            Hex digest of the file, reported in the returned statistics.
+        direct_parts : list, optional
+            If given, each part is sent straight to storage with ``PUT`` to the
+            presigned URL from ``GET {url}/parts/{n}/url`` instead, and the
+            part number, ETag and size of every stored part are appended, to
+            be reported when completing the session.
+
+        Returns
+        -------
+        TransferStats
+            Size, duration, throughput and SHA-256 digest of the transfer.
+
+        Raises
+        ------
+        TransferError
+            If a part cannot be uploaded within the retry budget.
+        """
+        started = time.perf_counter()
+        size = os.path.getsize(src)
+        ranges = plan_ranges(size, part_size)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self._send_part, url, src, number, start, end, direct_parts is not None
+                )
+                for number, (start, end) in enumerate(ranges, start=1)
+            ]
+            for future in futures:
+                part = future.result()
+                if direct_parts is not None:
+                    direct_parts.append(part)
+
+        seconds = time.perf_counter() - started
+        stats = TransferStats(
+            path=src,
+            size=size,
+            parts=len(ranges),
+            seconds=seconds,
+            throughput=size / seconds if seconds > 0 else 0.0,
+            sha256=sha256,
+        )
+        logger.info(
+            f"Uploaded {src}: {size} bytes in {len(ranges)} parts, {seconds:.2f}s "
+            f"({stats.throughput / (1024 * 1024):.1f} MiB/s)"
+        )
+        return stats
+
+    def _send_part(
+        self, url: str, src: str, number: int, start: int, end: int, direct: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Upload bytes ``start``-``end`` of ``src`` as part ``number``, retrying the whole part.
+
+        ``direct`` parts go to a presigned storage URL, requested again for every
+        attempt so a retry never uses an expired one. Returns the part number,
+        ETag and size of the stored part.
+        """
+        with open(src, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start + 1)
+
+        attempts = 0
+        while True:
+            delay = 0.0
+            try:
+                if direct:
+                    response = self.session.get(f"{url}/parts/{number}/url", timeout=self.timeout)
+                    if response.status_code == 200:
+                        response = self.session.put(
+                            response.json()["url"], data=data, timeout=self.timeout
+                        )
+                else:
+                    response = self.session.put(
+                        f"{url}/parts/{number}", data=data, timeout=self.timeout
+                    )
+                if response.status_code < 500 and response.status_code != 429:
+                    break
+                error = f"{response.status_code} {response.reason}"
+                # The registry sheds load with 429 and tells when to come back
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else 0.0
+            except requests.exceptions.RequestException as e:
+                error = str(e)
+
+            attempts += 1
+            if attempts > self.max_retries:
+                raise TransferError(f"Failed to upload part {number}: {error}")
+            logger.warning(
+                f"Retrying part {number} in {delay:.0f}s ({attempts}/{self.max_retries}): {error}"
+            )
+            time.sleep(delay)
+
+        if response.status_code >= 400:
+            raise TransferError(
+                f"Part {number} was rejected: {response.status_code} {response.text}"
+            )
+        if direct:
+            return {
+                "part_number": number,
+                "etag": response.headers.get("ETag", "").strip('"'),
+                "size": len(data),
+            }
+        return response.json()
@@ -0,0 +1,281 @@
+"""
+Helper utilities shared across the model registry.
+
+This module contains small stream and HTTP helpers used by the storage and
+API layers to move model artifacts without loading them fully into memory,
+and an in-process LRU cache with expiry.
+"""
+
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Hashable, List, Optional, Tuple
+import base64
+import hashlib
+import json
+import threading
+import time
+
+
+class CountingReader:
+    """
+    File-like wrapper that counts and hashes the bytes read from a stream.
+
+    Used to learn the size and SHA-256 digest of uploads whose length is not
+    known up front, so they can be streamed to storage without seeking or
+    buffering.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Readable binary stream to wrap
+
+    Attributes
+    ----------
+    bytes_read : int
+        Total number of bytes read so far
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._sha256 = hashlib.sha256()
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes and update the byte counter and digest."""
+        chunk = self._stream.read(size)
+        self.bytes_read += len(chunk)
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 hex digest of the bytes read so far."""
+        return self._sha256.hexdigest()
+
+
+def stream_sha256(stream: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a seekable stream and rewind it.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Seekable binary stream, read from its current position
+    chunk_size : int, optional
+        Read size in bytes, by default 1 MiB
+
+    Returns
+    -------
+    str
+        Hex encoded SHA-256 digest
+    """
+    start = stream.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(start)
+    return digest.hexdigest()
+
+
+# Ranges served from one request, each is read from storage separately
+MAX_RANGES = 16
+
+
+def parse_range_header(range_header: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse an HTTP ``Range`` header into inclusive byte ranges.
+
+    Supports ``bytes=start-end``, open-ended ``bytes=start-`` and suffix
+    ``bytes=-length`` specs, separated by commas for multiple ranges.
+    Overlapping and adjacent ranges are merged and returned in ascending
+    order. Headers asking for more than ``MAX_RANGES`` ranges after merging
+    are ignored, so the full content is sent instead.
+
+    Parameters
+    ----------
+    range_header : str
+        Value of the ``Range`` request header
+    size : int
+        Total size of the resource in bytes
+
+    Returns
+    -------
+    Optional[List[Tuple[int, int]]]
+        List of ``(start, end)`` inclusive byte positions, or None if the
+        header is malformed or asks for too many ranges and should be ignored
+
+    Raises
+    ------
+    ValueError
+        If the header is well formed but none of the ranges can be satisfied
+    """
+    unit, _, specs = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
+        return None
+
+    ranges = []
+    for spec in specs.split(","):
+        start_str, sep, end_str = spec.strip().partition("-")
+        start_str, end_str = start_str.strip(), end_str.strip()
+        if not sep or not (start_str.isdigit() or end_str.isdigit()):
+            return None
+        if start_str and end_str and not (start_str.isdigit() and end_str.isdigit()):
+            return None
+
+        if not start_str:
+            # Suffix range: last N bytes
+            length = int(end_str)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+
+        start = int(start_str)
+        end = int(end_str) if end_str else size - 1
+        if end_str and end < start:
+            return None
+        if start >= size:
+            continue
+        ranges.append((start, min(end, size - 1)))
+
+    if not ranges:
+        raise ValueError(f"Range not satisfiable: {range_header}")
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    if len(merged) > MAX_RANGES:
+        return None
+    return merged
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check whether an ``If-None-Match`` header matches an entity tag.
+
+    Parameters
+    ----------
+    if_none_match : str
+        Value of the ``If-None-Match`` request header, possibly a list or ``*``
+    etag : str
+        Quoted entity tag of the current resource
+
+    Returns
+    -------
+    bool
+        True if any listed tag (compared weakly) or ``*`` matches
+    """
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.strip().removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+METADATA_HEADER = "X-Model-Metadata"
+# Stays well below the 64 KiB header line limit of http.client and most proxies
+METADATA_HEADER_MAX_SIZE = 32 * 1024
+
+
+def encode_metadata_header(metadata: str) -> str:
+    """
+    Encode a JSON metadata document as a ``X-Model-Metadata`` header value.
+
+    Parameters
+    ----------
+    metadata : str
+        JSON serialized metadata document
+
+    Returns
+    -------
+    str
+        URL-safe base64 of the UTF-8 encoded document, valid in any HTTP header
+    """
+    return base64.urlsafe_b64encode(metadata.encode()).decode()
+
+
+def decode_metadata_header(value: str) -> Dict[str, Any]:
+    """Decode a ``X-Model-Metadata`` header value, see ``encode_metadata_header``."""
+    return json.loads(base64.urlsafe_b64decode(value.encode()))
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after a fixed time.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of entries kept; the least recently used is evicted first
+    ttl : float
+        Time to live of each entry in seconds
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups answered from the cache
+    misses : int
+        Number of lookups that found no live entry
+    evictions : int
+        Number of entries dropped because the cache was full
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for ``key`` and mark it recently used, or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hit/miss/eviction counters and the hit ratio."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -4,6 +4,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
 import pickle
 import io
+import uuid
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -70,7 +71,7 @@ def model_metadata():
     return ModelMetadata(
         id="model123",
         name="example_model",
-        version="1.0.0",
+        version=f"1.0.0+{uuid.uuid4().hex[:8]}",  # (name, version) is unique in the registry
         file_extension="pkl",
         storage_group="ml-models",
         description="Example model for testing",
@@ -1,5 +1,17 @@
+import asyncio
+import io
+import os
+import threading
+import time
+import uuid
 import pickle
 import numpy as np
+import pytest
+import requests
+import zstandard
+
+from registry.async_client import AsyncModelRegistryClient
+from registry.client import ModelNotFoundError, ModelUploadError
 
 def test_create_client_intance(get_host_url, get_client_lib):
     client = get_client_lib(get_host_url)
@@ -67,4 +79,421 @@ def test_model_prediction_consistency(get_host_url, get_client_lib, trained_mode
     downloaded_predictions = downloaded_model.predict(X_test)
     
     assert np.array_equal(original_predictions, downloaded_predictions),"Predictions before and after storage should match"
-    
\ No newline at end of file
+    
+
+def test_parallel_download_model_file(
+    get_host_url, get_client_lib, trained_model, model_metadata, tmp_path
+):
+    """Parallel ranged download writes the same bytes that were uploaded"""
+    client = get_client_lib(get_host_url, transfer_concurrency=4, transfer_part_size=256)
+    model_buffer, _, _ = trained_model
+
+    result = client.upload_model(model_buffer, model_metadata)
+
+    dest = tmp_path / "model.pkl"
+    stats = client.download_model_file(result.file_path, result.storage_group, str(dest))
+
+    assert stats.size == len(model_buffer.getvalue())
+    assert stats.parts > 1, "Model should be split into several ranged parts"
+    assert dest.read_bytes() == model_buffer.getvalue()
+
+
+def test_download_model_to_disk_and_mmap(
+    get_host_url, get_client_lib, trained_model, model_metadata, tmp_path
+):
+    """Model file can be streamed to disk and memory-mapped without an in-memory copy"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, (X_test, _) = trained_model
+
+    result = client.upload_model(model_buffer, model_metadata)
+
+    dest = tmp_path / "model.pkl"
+    path = client.get_model_file(result.file_path, result.storage_group, dest=dest)
+    assert path.read_bytes() == model_buffer.getvalue()
+
+    mapped = client.get_model_file(result.file_path, result.storage_group, mmap_mode=True)
+    downloaded_model = pickle.loads(mapped)
+    assert len(downloaded_model.predict(X_test)) == len(X_test)
+
+
+def test_model_cache_revalidation(
+    get_host_url, get_client_lib, trained_model, model_metadata, tmp_path
+):
+    """Repeated downloads are served from the local cache"""
+    client = get_client_lib(get_host_url, cache_dir=tmp_path / "cache")
+    model_buffer, _, _ = trained_model
+
+    result = client.upload_model(model_buffer, model_metadata)
+
+    first, _ = client.get_model(file_path=result.file_path, metadata_id=result.metadata_id)
+    second = client.get_model_file(result.file_path, result.storage_group)
+
+    assert first.getvalue() == second.getvalue() == model_buffer.getvalue()
+    assert client.cache_stats["misses"] == 1
+    assert client.cache_stats["hits"] == 1
+
+
+def test_async_client_bulk_operations(get_host_url, trained_model, model_metadata):
+    """Async client uploads and fetches several models concurrently"""
+    model_buffer, _, _ = trained_model
+
+    async def run():
+        async with AsyncModelRegistryClient(get_host_url, max_concurrency=2) as client:
+            assert await client.health_check()
+            versions = [
+                model_metadata.model_copy(update={"version": f"{model_metadata.version}.{i}"})
+                for i in range(3)
+            ]
+            results = await client.upload_many(
+                [(model_buffer.getvalue(), metadata) for metadata in versions]
+            )
+            return await client.get_many([(r.file_path, r.metadata_id) for r in results])
+
+    models = asyncio.run(run())
+
+    assert len(models) == 3
+    for buffer, metadata in models:
+        assert buffer.getvalue() == model_buffer.getvalue()
+        assert metadata["name"] == model_metadata.name
+
+
+def test_get_metadata_many(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Batch metadata lookup returns found models and per-ID errors"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+
+    model_metadata.name = f"batch_{uuid.uuid4().hex}"
+    ids = [
+        client.upload_model(
+            model_buffer, model_metadata.model_copy(update={"version": f"1.0.{i}"})
+        ).metadata_id
+        for i in range(3)
+    ]
+    missing_id = "0" * 24
+
+    batch = client.get_metadata_many(ids + [missing_id], chunk_size=2)
+
+    assert set(batch["results"]) == set(ids)
+    assert all(metadata["name"] == model_metadata.name for metadata in batch["results"].values())
+    assert set(batch["errors"]) == {missing_id}
+
+
+def test_list_models_pagination(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Cursor pagination visits every matching model exactly once, newest first"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+
+    model_metadata.name = f"listing_{uuid.uuid4().hex}"
+    ids = [
+        client.upload_model(
+            model_buffer, model_metadata.model_copy(update={"version": f"1.0.{i}"})
+        ).metadata_id
+        for i in range(5)
+    ]
+
+    first_page = client.list_models(name=model_metadata.name, limit=2)
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"]
+
+    listed = [
+        metadata["metadata_id"]
+        for metadata in client.iter_models(name=model_metadata.name, limit=2)
+    ]
+    assert listed == ids[::-1]
+
+
+def test_resolve_latest_and_alias(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Latest version and aliases resolve to the right metadata, duplicates are rejected"""
+    client = get_client_lib(get_host_url, resolve_ttl=0)
+    model_buffer, _, _ = trained_model
+
+    model_metadata.name = f"resolve_{uuid.uuid4().hex}"
+    first = client.upload_model(
+        model_buffer, model_metadata.model_copy(update={"version": "1.0.0"})
+    )
+    second = client.upload_model(
+        model_buffer, model_metadata.model_copy(update={"version": "1.1.0"})
+    )
+
+    with pytest.raises(ModelUploadError):
+        client.upload_model(model_buffer, model_metadata.model_copy(update={"version": "1.1.0"}))
+
+    assert client.resolve(model_metadata.name)["metadata_id"] == second.metadata_id
+
+    client.set_alias(model_metadata.name, "production", first.metadata_id)
+    assert (
+        client.resolve(model_metadata.name, alias="production")["metadata_id"] == first.metadata_id
+    )
+
+    with pytest.raises(ModelNotFoundError):
+        client.resolve(model_metadata.name, alias="staging")
+
+
+def test_duplicate_content_is_stored_once(
+    get_host_url, get_client_lib, trained_model, model_metadata
+):
+    """Identical model files share one stored blob that outlives deleted versions"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+
+    model_metadata.name = f"dedup_{uuid.uuid4().hex}"
+    first = client.upload_model(
+        model_buffer, model_metadata.model_copy(update={"version": "1.0.0"})
+    )
+    second = client.upload_model(
+        model_buffer, model_metadata.model_copy(update={"version": "1.0.1"})
+    )
+    assert first.file_path == second.file_path
+
+    client.delete_model(first.metadata_id)
+    downloaded, _ = client.get_model(file_path=second.file_path, metadata_id=second.metadata_id)
+    assert downloaded.getvalue() == model_buffer.getvalue()
+
+
+def test_upload_model_file_in_parts(get_host_url, get_client_lib, model_metadata, tmp_path):
+    """Large files are uploaded as parallel parts and registered on completion"""
+    client = get_client_lib(get_host_url)
+    content = os.urandom(12 * 1024 * 1024)
+    model_path = tmp_path / "model.pkl"
+    model_path.write_bytes(content)
+
+    info = client.upload_model_file(model_path, model_metadata, part_size=5 * 1024 * 1024)
+    assert client.get_metadata(info.metadata_id)["storage_info"]["size"] == len(content)
+
+    dest = tmp_path / "downloaded.pkl"
+    client.download_model_file(info.file_path, info.storage_group, str(dest))
+    assert dest.read_bytes() == content
+
+
+def test_download_zstd_encoded_and_ranges(
+    get_host_url, get_client_lib, trained_model, model_metadata
+):
+    """Compressed files are served encoded on request, otherwise whole and decompressed"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+    content = model_buffer.getvalue()
+    result = client.upload_model(model_buffer, model_metadata)
+
+    url = f"{get_host_url}/model/file/{result.file_path}"
+    params = {"bucket_name": result.storage_group}
+    response = requests.get(url, params=params, headers={"Accept-Encoding": "zstd"}, stream=True)
+    body = response.raw.read(decode_content=False)
+    if response.headers.get("Content-Encoding") == "zstd":
+        body = zstandard.ZstdDecompressor().decompress(body)
+    assert body == content
+
+    encoded_etag = response.headers["ETag"]
+    response = requests.get(
+        url, params=params, headers={"Accept-Encoding": "identity", "Range": "bytes=10-19"}
+    )
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.content == content
+    if response.headers["Accept-Ranges"] == "none":
+        # Compressed files have no ranges, and their representations have different ETags
+        assert response.headers["ETag"] != encoded_etag
+
+
+def test_download_range_requests(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Ranges get 206, unsatisfiable ones 416 and a stale If-Range the full file"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+    content = model_buffer.getvalue()
+    size = len(content)
+    result = client.upload_model(model_buffer, model_metadata)
+
+    url = f"{get_host_url}/model/file/{result.file_path}"
+    params = {"bucket_name": result.storage_group}
+    full = requests.get(url, params=params)
+    assert full.headers["Accept-Ranges"] == "bytes"
+    etag = full.headers["ETag"]
+
+    response = requests.get(url, params=params, headers={"Range": "bytes=-16"})
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes {size - 16}-{size - 1}/{size}"
+    assert response.content == content[-16:]
+
+    response = requests.get(url, params=params, headers={"Range": "bytes=100-", "If-Range": etag})
+    assert response.status_code == 206
+    assert response.content == content[100:]
+
+    response = requests.get(
+        url, params=params, headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.content == content
+
+    response = requests.get(url, params=params, headers={"Range": "bytes=0-1,4-5"})
+    assert response.status_code == 206
+    assert response.headers["Content-Type"].startswith("multipart/byteranges")
+    assert content[0:2] in response.content and content[4:6] in response.content
+
+    response = requests.get(
+        url, params=params, headers={"Range": "bytes=" + ",".join(["0-"] * 500)}
+    )
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 0-{size - 1}/{size}"
+
+    scattered = ",".join(f"{i * 4}-{i * 4 + 1}" for i in range(100))
+    response = requests.get(url, params=params, headers={"Range": f"bytes={scattered}"})
+    assert response.status_code == 200
+    assert response.content == content
+
+    response = requests.get(url, params=params, headers={"Range": f"bytes={size}-"})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{size}"
+
+
+def test_delta_version_is_reconstructed(get_host_url, get_client_lib, model_metadata):
+    """A version declaring its parent is stored as a delta and downloads unchanged"""
+    client = get_client_lib(get_host_url)
+    parent_content = os.urandom(1024 * 1024)
+    child_content = parent_content[:4096] + os.urandom(4096) + parent_content[8192:]
+
+    model_metadata.name = f"delta_{uuid.uuid4().hex}"
+    client.upload_model(parent_content, model_metadata.model_copy(update={"version": "1.0.0"}))
+    child = client.upload_model(
+        child_content,
+        model_metadata.model_copy(update={"version": "1.1.0", "parent_version": "1.0.0"}),
+    )
+
+    storage_info = client.get_metadata(child.metadata_id)["storage_info"]
+    assert storage_info["codec"] == "delta"
+    assert storage_info["stored_size"] < len(child_content) // 2
+    downloaded, _ = client.get_model(file_path=child.file_path, metadata_id=child.metadata_id)
+    assert downloaded.getvalue() == child_content
+
+
+def test_metrics_endpoint(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Request, transfer and storage metrics are exposed per route template"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+    client.upload_model(model_buffer, model_metadata)
+
+    response = requests.get(f"{get_host_url}/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'registry_request_duration_seconds_count{method="POST",route="/model/upload",status="200"}'
+        in body
+    )
+    assert 'registry_uploaded_bytes_total{route="/model/upload"}' in body
+    assert (
+        'registry_storage_call_duration_seconds_count{backend="minio",operation="store_model"}'
+        in body
+    )
+    assert (
+        'registry_storage_call_duration_seconds_count{backend="mongo",operation="store_metadata"}'
+        in body
+    )
+    assert 'registry_transfers_in_progress{direction="upload"}' in body
+
+
+def test_get_model_bundle(get_host_url, get_client_lib, trained_model, model_metadata):
+    """The model file and its metadata are fetched with one request"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+    result = client.upload_model(model_buffer, model_metadata)
+
+    requested = []
+    client.session.hooks["response"].append(
+        lambda response, *args, **kwargs: requested.append(response.url)
+    )
+    buffer, metadata = client.get_model(file_path=result.file_path, metadata_id=result.metadata_id)
+
+    assert buffer.getvalue() == model_buffer.getvalue()
+    assert metadata == client.get_metadata(result.metadata_id)
+    assert len(requested) == 2 and "/bundle" in requested[0]
+
+    response = requests.get(
+        f"{get_host_url}/model/{result.metadata_id}/bundle", headers={"Range": "bytes=0-9"}
+    )
+    assert response.status_code == 206
+    assert response.content == model_buffer.getvalue()[:10]
+    assert "X-Model-Metadata" in response.headers
+
+    # The file location comes from the metadata, another model's file is fetched separately
+    other = client.upload_model(
+        io.BytesIO(b"other model"), model_metadata.model_copy(update={"version": "9.9.9"})
+    )
+    response = requests.get(
+        f"{get_host_url}/model/{result.metadata_id}/bundle",
+        params={"file_path": other.file_path, "bucket_name": other.storage_group},
+    )
+    assert response.content == model_buffer.getvalue()
+    buffer, metadata = client.get_model(file_path=other.file_path, metadata_id=result.metadata_id)
+    assert buffer.getvalue() == b"other model"
+    assert metadata["storage_path"] == result.file_path
+
+
+def test_unknown_metadata_id_returns_404(get_host_url):
+    """Unknown and malformed metadata IDs are reported as 404 by the metadata and bundle routes"""
+    for metadata_id in ("0" * 24, "not-an-id"):
+        assert requests.get(f"{get_host_url}/model/metadata/{metadata_id}").status_code == 404
+        assert requests.get(f"{get_host_url}/model/{metadata_id}/bundle").status_code == 404
+
+
+def test_health_probes(get_host_url):
+    """Liveness answers without backends, readiness reports the latency of each backend"""
+    assert requests.get(f"{get_host_url}/health/live").json() == {"status": "alive"}
+
+    response = requests.get(f"{get_host_url}/health/ready")
+    assert response.status_code == 200
+    backends = response.json()["backends"]
+    assert set(backends) == {"model_storage", "metadata_storage"}
+    assert all(check["status"] == "ok" and check["latency_ms"] >= 0 for check in backends.values())
+
+
+def test_presigned_url_redirects(get_host_url, get_client_lib, model_metadata, tmp_path):
+    """With presigned URLs, downloads redirect to storage and session parts are sent to it"""
+    client = get_client_lib(get_host_url)
+    content = os.urandom(12 * 1024 * 1024)
+    model_path = tmp_path / "model.pkl"
+    model_path.write_bytes(content)
+    info = client.upload_model_file(model_path, model_metadata, part_size=5 * 1024 * 1024)
+
+    url = f"{get_host_url}/model/file/{info.file_path}"
+    response = requests.get(url, params={"bucket_name": info.storage_group}, allow_redirects=False)
+    if response.status_code != 307:
+        pytest.skip("Registry does not serve presigned URLs")
+    assert response.headers["Cache-Control"] == "no-store"
+    assert requests.get(response.headers["Location"]).content == content
+
+    response = requests.get(
+        url, params={"bucket_name": info.storage_group}, headers={"Range": "bytes=10-19"}
+    )
+    assert response.status_code == 206 and response.history
+    assert response.content == content[10:20]
+    assert client.get_model_file(info.file_path, info.storage_group).getvalue() == content
+
+
+def test_watch_events(get_host_url, get_client_lib, trained_model, model_metadata):
+    """Registrations and alias changes of a model are pushed to watchers, and can be replayed"""
+    client = get_client_lib(get_host_url)
+    model_buffer, _, _ = trained_model
+    events = []
+
+    def follow():
+        for event in get_client_lib(get_host_url).watch(name=model_metadata.name):
+            events.append(event)
+            if len(events) == 2:
+                return
+
+    watcher = threading.Thread(target=follow, daemon=True)
+    watcher.start()
+    time.sleep(0.5)
+    result = client.upload_model(model_buffer, model_metadata)
+    client.set_alias(model_metadata.name, "production", result.metadata_id)
+    watcher.join(timeout=5)
+
+    assert [event["type"] for event in events] == ["register", "alias"]
+    assert events[0]["data"]["metadata_id"] == result.metadata_id
+    assert events[1]["data"] == {
+        "name": model_metadata.name,
+        "alias": "production",
+        "metadata_id": result.metadata_id,
+    }
+
+    replayed = client.watch(name=model_metadata.name, last_event_id=events[0]["id"])
+    assert next(replayed)["id"] == events[1]["id"]
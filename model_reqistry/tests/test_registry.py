@@ -0,0 +1,668 @@
+import asyncio
+import datetime
+import inspect
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from minio import Minio
+from minio.datatypes import Part
+
+from registry.admission import AdmissionController, AdmissionMiddleware
+from registry.client import ModelRegistryClient
+from registry.core.config import settings
+from registry.events import EventLog, format_event
+from registry.exceptions import (
+    DuplicateModelError,
+    ModelNotFoundError,
+    ResourceBusyError,
+    StorageError,
+)
+from registry.schemas import ModelMetadata
+from registry import services
+from registry.services import AsyncModelRegistry, ModelRegistry
+from registry.storage.cached import CachedMetadataStorage
+from registry.storage.disk_cache import CachedModelStorage
+from registry.storage.filesystem import FilesystemStorage
+from registry.storage.sqlite import SQLiteMetadataStorage
+from registry.util import MAX_RANGES, parse_range_header
+
+
+def test_filesystem_storage_round_trip(tmp_path):
+    """Files are published with their sidecar, streamed from a memory map, copied and assembled"""
+    storage = FilesystemStorage(root=str(tmp_path))
+    content = os.urandom(6 * 1024 * 1024 + 17)
+
+    stored = storage.store_model(io.BytesIO(content), "sha256-abc", "models")
+    assert stored["size"] == len(content)
+    assert storage.stat_model("sha256-abc", "models")["etag"] == stored["etag"]
+    assert b"".join(storage.stream_model("sha256-abc", "models", chunk_size=1024 * 1024)) == content
+    assert (
+        b"".join(storage.stream_model("sha256-abc", "models", offset=10, length=20))
+        == content[10:30]
+    )
+    assert not os.listdir(tmp_path / "models" / ".tmp")
+    stream = storage.stream_model("sha256-abc", "models", chunk_size=1024)
+    next(stream)
+    stream.close()
+
+    copied = storage.copy_model("sha256-abc", "models", "sha256-abc", "other")
+    assert copied["size"] == len(content)
+    storage.delete_model("sha256-abc", "models")
+    assert storage.get_model("sha256-abc", "other").getvalue() == content
+    with pytest.raises(ModelNotFoundError):
+        storage.stat_model("sha256-abc", "models")
+
+    upload_id = storage.create_multipart_upload("upload-1", "models")
+    parts = [
+        (1, storage.upload_part("upload-1", "models", upload_id, 1, content[: 5 * 1024 * 1024]))
+    ]
+    parts.append(
+        (2, storage.upload_part("upload-1", "models", upload_id, 2, content[5 * 1024 * 1024 :]))
+    )
+    assembled = storage.complete_multipart_upload("upload-1", "models", upload_id, parts)
+    assert assembled["etag"].endswith("-2")
+    assert storage.get_model("upload-1", "models").getvalue() == content
+
+    with pytest.raises(StorageError):
+        storage.stat_model("sha256-abc", "..")
+
+    # Files are published before their sidecar and missing until it exists
+    os.unlink(storage._file_path("upload-1", "models") + ".json")
+    with pytest.raises(ModelNotFoundError):
+        storage.stream_model("upload-1", "models")
+
+    storage.prepare_buckets(["prepared"])
+    assert (tmp_path / "prepared").is_dir()
+    storage.ping()
+
+
+def test_sqlite_metadata_storage(tmp_path):
+    """The SQLite backend stores, pages, aliases, refcounts and tracks sessions like MongoStorage"""
+    storage = SQLiteMetadataStorage(path=str(tmp_path / "metadata.db"))
+    start = datetime.datetime.now(datetime.timezone.utc)
+    ids = [
+        storage.store_metadata({
+            "name": "sqlite_model",
+            "version": f"1.0.{i}",
+            "storage_group": "models",
+            "tags": {"stage": "prod" if i % 2 else "dev"},
+            "metrics": {"accuracy": i / 10},
+            "registration_time": start + datetime.timedelta(seconds=i),
+        })
+        for i in range(5)
+    ]
+    with pytest.raises(DuplicateModelError):
+        storage.store_metadata({"name": "sqlite_model", "version": "1.0.0"})
+
+    assert storage.get_metadata(ids[2])["metrics"] == {"accuracy": 0.2}
+    assert set(storage.get_metadata_many(ids[:2] + ["unknown"])) == set(ids[:2])
+    assert storage.get_latest_metadata("sqlite_model")["_id"] == ids[4]
+
+    first = storage.list_metadata({"name": "sqlite_model"}, limit=2)
+    last = first[-1]
+    second = storage.list_metadata(
+        {"name": "sqlite_model"}, limit=2, after=(last["registration_time"], last["_id"])
+    )
+    assert [m["_id"] for m in first + second] == ids[::-1][:4]
+    assert [m["_id"] for m in storage.list_metadata({"tags": {"stage": "prod"}})] == [
+        ids[3],
+        ids[1],
+    ]
+
+    storage.set_alias("sqlite_model", "production", ids[1])
+    storage.set_alias("sqlite_model", "production", ids[3])
+    assert storage.get_alias("sqlite_model", "production") == ids[3]
+    assert storage.delete_alias("sqlite_model", "production")
+
+    assert storage.acquire_blob("models", "abc", "sha256-abc")["refcount"] == 1
+    storage.mark_blob_ready("models", "abc", {"size": 3, "etag": "e"})
+    assert storage.acquire_blob("models", "abc", "sha256-abc")["refcount"] == 2
+    assert storage.find_blob("abc")["size"] == 3
+    assert not storage.release_blob("models", "abc", "owner")
+    assert storage.release_blob("models", "abc", "owner")["size"] == 3
+    assert storage.find_blob("abc", "models") is None
+    assert storage.acquire_blob("models", "abc", "sha256-abc") is None
+    assert not storage.release_blob("models", "abc", "owner")
+    assert not storage.reclaim_blob("models", "abc", "other", start)
+    assert storage.reclaim_blob(
+        "models", "abc", "other", datetime.datetime.now(datetime.timezone.utc)
+    )
+    assert not storage.remove_blob("models", "abc", "owner")
+    assert storage.remove_blob("models", "abc", "other")
+    assert storage.acquire_blob("models", "abc", "sha256-abc")["ready"] is False
+
+    storage.create_upload_session(
+        {"_id": "s1", "bucket": "models", "metadata": {"name": "sqlite_model"}}
+    )
+    assert storage.record_upload_part("s1", 2, "etag2", 10)
+    assert storage.get_upload_session("s1")["parts"] == {"2": {"etag": "etag2", "size": 10}}
+    assert storage.delete_upload_session("s1")
+    assert not storage.record_upload_part("s1", 1, "etag1", 10)
+    assert storage.delete_metadata(ids[0])
+    storage.ping()
+
+
+def test_disk_cache_single_flight(tmp_path):
+    """Concurrent reads of an uncached file share one backend read, overwrites are not stale"""
+    backend = FilesystemStorage(root=str(tmp_path / "backend"))
+    content = os.urandom(8 * 1024 * 1024)
+    backend.store_model(io.BytesIO(content), "sha256-abc", "models")
+
+    reads = []
+    stream_model = backend.stream_model
+
+    def counting_stream_model(*args, **kwargs):
+        reads.append(args)
+        return stream_model(*args, **kwargs)
+
+    backend.stream_model = counting_stream_model
+    cache = CachedModelStorage(
+        backend, cache_dir=str(tmp_path / "cache"), max_bytes=20 * 1024 * 1024
+    )
+
+    with ThreadPoolExecutor(16) as pool:
+        results = list(
+            pool.map(lambda _: b"".join(cache.stream_model("sha256-abc", "models")), range(32))
+        )
+    assert all(result == content for result in results)
+    assert len(reads) == 1
+    assert (
+        b"".join(cache.stream_model("sha256-abc", "models", offset=100, length=10))
+        == content[100:110]
+    )
+
+    changed = os.urandom(1024)
+    backend.store_model(io.BytesIO(changed), "sha256-abc", "models")
+    assert cache.get_model("sha256-abc", "models").getvalue() == changed
+    assert len(reads) == 2
+    assert cache.stats()["files"] == 2
+
+    cache.delete_model("sha256-abc", "models")
+    assert cache.stats() == {"files": 0, "bytes": 0, "max_bytes": 20 * 1024 * 1024, "fills": 0}
+
+
+def test_upload_admission_queue_and_rejection():
+    """Uploads beyond the budgets wait in order, rejected if the queue is full or on timeout"""
+
+    async def run():
+        controller = AdmissionController(
+            max_uploads=2, max_bytes=100, max_queue=1, queue_timeout=0.2
+        )
+        assert await controller.acquire(60)
+        waiting = asyncio.create_task(controller.acquire(50))
+        await asyncio.sleep(0)
+        assert controller.stats()["queued"] == 1
+        assert not await controller.acquire(1)
+
+        controller.release(60)
+        assert await waiting
+        assert controller.stats()["bytes"] == 50
+
+        controller.release(50)
+        assert await controller.acquire(controller.charge(10**9))
+        assert not await controller.acquire(10)
+        assert controller.stats() == {
+            "uploads": 1,
+            "bytes": 100,
+            "queued": 0,
+            "max_uploads": 2,
+            "max_bytes": 100,
+            "max_queue": 1,
+        }
+
+    asyncio.run(run())
+
+
+def test_upload_completion_is_admitted_by_session_size():
+    """Completing a session is charged the size its body describes, by-hash only holds a slot"""
+    controller = AdmissionController(max_uploads=2, max_bytes=1000, max_queue=1, queue_timeout=0.2)
+    seen = []
+
+    async def app(scope, receive, send):
+        body = (await receive())["body"]
+        seen.append((scope["path"], body, controller.uploads, controller.bytes))
+
+    async def described_size(path, body):
+        assert path == "/model/upload-sessions/abc/complete"
+        return 300 + len(body)
+
+    async def run():
+        middleware = AdmissionMiddleware(app, controller, described_size=described_size)
+        requests = (
+            ("/model/upload-sessions/abc/complete", b'{"parts": []}'),
+            ("/model/upload/by-hash", b'{"sha256": "00"}'),
+        )
+        for path, body in requests:
+            chunks = [
+                {"type": "http.request", "body": body[:5], "more_body": True},
+                {"type": "http.request", "body": body[5:], "more_body": False},
+            ]
+            headers = [(b"content-length", str(len(body)).encode())]
+            scope = {"type": "http", "method": "POST", "path": path, "headers": headers}
+            await middleware(scope, lambda chunks=chunks: asyncio.sleep(0, chunks.pop(0)), None)
+
+    asyncio.run(run())
+    assert seen == [
+        ("/model/upload-sessions/abc/complete", b'{"parts": []}', 1, 313),
+        ("/model/upload/by-hash", b'{"sha', 1, 16),
+    ]
+    assert controller.stats()["uploads"] == 0 and controller.bytes == 0
+
+
+def test_event_log_resume_and_eviction():
+    """Events are replayed after a known ID, evicted or foreign IDs cannot be resumed"""
+    log = EventLog(max_events=3)
+    woken = []
+    log.subscribe(lambda: woken.append(log.position))
+    events = [log.publish("register", {"name": "model", "version": str(i)}) for i in range(5)]
+    assert woken == [1, 2, 3, 4, 5]
+
+    assert log.read(log.parse_id(events[2]["id"])) == events[3:]
+    assert log.read(log.parse_id(events[1]["id"])) == events[2:]
+    assert log.read(log.parse_id(events[0]["id"])) is None
+    assert log.read(log.position) == []
+    assert log.parse_id("unknown-1") is None
+    assert log.parse_id(log.event_id(6)) is None
+
+    assert format_event(events[4]).startswith(
+        f"id: {events[4]['id']}\nevent: register\ndata: ".encode()
+    )
+    assert format_event(None) == b": heartbeat\n\n"
+    assert log.stats()["subscribers"] == 1
+
+
+def test_parse_range_header():
+    """Ranges are clamped to the size and merged, unsatisfiable ones raise, too many are ignored"""
+    assert parse_range_header("bytes=10-19", 100) == [(10, 19)]
+    assert parse_range_header("bytes=90-", 100) == [(90, 99)]
+    assert parse_range_header("bytes=95-200", 100) == [(95, 99)]
+    assert parse_range_header("bytes=-10", 100) == [(90, 99)]
+    assert parse_range_header("bytes=-500", 100) == [(0, 99)]
+    assert parse_range_header("bytes=0-0, 50-59, 200-", 100) == [(0, 0), (50, 59)]
+    assert parse_range_header("bytes=50-59, 0-9, 5-20, 21-30, -45", 100) == [(0, 30), (50, 99)]
+    assert parse_range_header("bytes=" + ",".join(["0-"] * 1000), 100) == [(0, 99)]
+    spread = ",".join(f"{i * 2}-{i * 2}" for i in range(MAX_RANGES))
+    assert len(parse_range_header(f"bytes={spread}", 100)) == MAX_RANGES
+    assert parse_range_header(f"bytes={spread},99-", 100) is None
+
+    for malformed in ("items=0-1", "bytes=", "bytes=5", "bytes=a-b", "bytes=20-10"):
+        assert parse_range_header(malformed, 100) is None
+    for unsatisfiable in ("bytes=100-", "bytes=-0", "bytes=200-300, 150-"):
+        with pytest.raises(ValueError):
+            parse_range_header(unsatisfiable, 100)
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=0-", 0)
+
+
+def test_client_resumes_interrupted_download():
+    """A download cut off mid-body is resumed with Range and If-Range from the last received byte"""
+    content = os.urandom(256 * 1024)
+    cut = 96 * 1024
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests_seen.append((self.headers.get("Range"), self.headers.get("If-Range")))
+            if self.headers.get("Range") is None:
+                self.send_response(200)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content[:cut])
+                self.wfile.flush()
+                self.close_connection = True
+                return
+            start, _ = parse_range_header(self.headers["Range"], len(content))[0]
+            self.send_response(206)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+            self.send_header("Content-Length", str(len(content) - start))
+            self.end_headers()
+            self.wfile.write(content[start:])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ModelRegistryClient(f"http://127.0.0.1:{server.server_port}", max_retries=1)
+        out = io.BytesIO()
+        received, etag = client._download(f"{client.base_url}/model/file/model.pkl", {}, out)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert out.getvalue() == content
+    assert received == len(content) and etag == '"v1"'
+    assert requests_seen == [(None, None), (f"bytes={cut}-", '"v1"')]
+
+
+def test_metadata_cache_misses_and_copies(tmp_path):
+    """Unknown IDs raise ModelNotFoundError through the cache, cached documents are not mutable"""
+    storage = CachedMetadataStorage(
+        SQLiteMetadataStorage(path=str(tmp_path / "metadata.db")), max_size=10, ttl=60
+    )
+    model_id = storage.store_metadata(
+        {"name": "cached_model", "version": "1.0.0", "tags": {"stage": "dev"}}
+    )
+
+    with pytest.raises(ModelNotFoundError):
+        storage.get_metadata("0" * 24)
+
+    storage.get_metadata(model_id)["tags"]["stage"] = "prod"
+    storage.get_metadata_many([model_id])[model_id]["tags"]["stage"] = "prod"
+    assert storage.get_metadata(model_id)["tags"] == {"stage": "dev"}
+    assert storage.stats()["hits"] == 2
+
+
+def _local_registry(tmp_path, monkeypatch):
+    """Build a ModelRegistry on the filesystem and SQLite backends inside ``tmp_path``."""
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "filesystem")
+    monkeypatch.setattr(settings, "FILESYSTEM_ROOT", str(tmp_path / "models"))
+    monkeypatch.setattr(settings, "METADATA_BACKEND", "sqlite")
+    monkeypatch.setattr(settings, "SQLITE_PATH", str(tmp_path / "metadata.db"))
+    monkeypatch.setattr(settings, "DISK_CACHE_BYTES", 0)
+    return ModelRegistry()
+
+
+def _model_metadata(version, parent_version=None):
+    return ModelMetadata(
+        id="local",
+        name="local_model",
+        version=version,
+        file_extension="pkl",
+        storage_group="models",
+        framework="none",
+        parent_version=parent_version,
+    ).model_dump()
+
+
+def test_event_loop_stays_responsive_during_blocking_storage(tmp_path, monkeypatch):
+    """Blocking storage calls run on the worker pools, the loop and the lookup pool keep serving"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    model_id = registry.metadata_storage.store_metadata({"name": "local_model", "version": "1.0.0"})
+
+    store_model = registry.model_storage.store_model
+
+    def slow_store_model(*args, **kwargs):
+        time.sleep(0.5)
+        return store_model(*args, **kwargs)
+
+    registry.model_storage.store_model = slow_store_model
+    async_registry = AsyncModelRegistry(registry, transfer_workers=1, lookup_workers=1)
+    metadata = _model_metadata("2.0.0")
+
+    async def run():
+        upload = asyncio.create_task(async_registry.register_model(io.BytesIO(b"model"), metadata))
+        await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        assert (await async_registry.get_metadata(model_id))["name"] == "local_model"
+        lookup_seconds = time.perf_counter() - started
+
+        ticks = []
+        while not upload.done():
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            ticks.append(time.perf_counter() - started)
+        await upload
+        return lookup_seconds, ticks
+
+    lookup_seconds, ticks = asyncio.run(run())
+    assert lookup_seconds < 0.2, "Lookups must not queue behind blocking transfers"
+    assert len(ticks) > 10 and max(ticks) < 0.1, (
+        "The event loop must not be blocked by storage calls"
+    )
+
+
+def test_cancelled_stream_is_closed_after_its_pending_read(tmp_path, monkeypatch):
+    """A download cancelled during a read closes its storage stream once that read returned"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    async_registry = AsyncModelRegistry(registry, transfer_workers=2, lookup_workers=1)
+    reading, release = threading.Event(), threading.Event()
+    closed = []
+
+    def stream():
+        try:
+            yield b"first"
+            reading.set()
+            release.wait(5)
+            yield b"second"
+        finally:
+            closed.append(threading.current_thread().name)
+
+    async def run():
+        chunks = async_registry._iterate(stream())
+
+        async def consume():
+            async for _ in chunks:
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.get_running_loop().run_in_executor(None, reading.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await chunks.aclose()
+
+    asyncio.run(run())
+    assert not closed, "The stream must not be closed while its read is running"
+    release.set()
+    async_registry._transfer_executor.shutdown(wait=True)
+    assert len(closed) == 1 and closed[0].startswith("registry-transfer")
+
+
+def test_content_registered_while_its_file_is_deleted(tmp_path, monkeypatch):
+    """Registering content whose last reference is being deleted fails fast, a retry stores it"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    first = registry.register_model(io.BytesIO(b"shared content"), _model_metadata("1.0.0"))
+
+    delete_model = registry.model_storage.delete_model
+    errors = []
+
+    def racing_delete_model(path, bucket_name):
+        # Errors raised here would be logged and swallowed by the release
+        if path == first.storage_path:
+            try:
+                registry.register_model(io.BytesIO(b"shared content"), _model_metadata("2.0.0"))
+            except Exception as e:
+                errors.append(e)
+        delete_model(path, bucket_name)
+
+    registry.model_storage.delete_model = racing_delete_model
+    registry.delete_model(first.metadata_id)
+    registry.model_storage.delete_model = delete_model
+
+    assert len(errors) == 1 and isinstance(errors[0], ResourceBusyError)
+    registered = registry.register_model(io.BytesIO(b"shared content"), _model_metadata("2.0.0"))
+    assert registered.storage_path == first.storage_path
+    assert (
+        registry.model_storage.get_model(first.storage_path, "models").getvalue()
+        == b"shared content"
+    )
+
+
+class _OneShotReader(io.RawIOBase):
+    """Unseekable stream counting the bytes read from it."""
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self.data.readinto(buffer)
+        self.bytes_read += count
+        return count
+
+
+def test_upload_is_read_once_and_staged_copy_dropped(tmp_path, monkeypatch):
+    """Uploads are hashed while stored, deltas of unseekable uploads are encoded from the stage"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    content = os.urandom(512 * 1024)
+    stream = _OneShotReader(content)
+    first = registry.register_model(stream, _model_metadata("1.0.0"))
+    assert stream.bytes_read == len(content)
+
+    changed = content + b"appended"
+    delta = registry.register_model(_OneShotReader(changed), _model_metadata("1.0.1", "1.0.0"))
+    assert registry.get_model_file_info(delta.storage_path, "models")["codec"] == "delta"
+    assert registry.get_model_file(delta.storage_path, "models").read() == changed
+
+    registry.register_model(_OneShotReader(content), _model_metadata("1.0.2"))
+    stored = [
+        name for _, _, names in os.walk(tmp_path / "models" / "models") for name in names
+        if not name.endswith(".json")
+    ]
+    assert len(stored) == 2, "Only the full and the delta file remain, staged copies are dropped"
+    assert (
+        registry.metadata_storage.find_blob(first.storage_path.removeprefix("sha256-"))["refcount"]
+        == 3
+    )
+
+
+def test_expired_blob_deletion_is_taken_over(tmp_path, monkeypatch):
+    """A deletion that never finished is completed by the next registration after its lease"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    first = registry.register_model(io.BytesIO(b"stuck content"), _model_metadata("1.0.0"))
+    digest = first.storage_path.removeprefix("sha256-")
+    registry.metadata_storage.delete_metadata(first.metadata_id)
+    assert registry.metadata_storage.release_blob("models", digest, "crashed")
+
+    with pytest.raises(ResourceBusyError):
+        registry.register_model(io.BytesIO(b"stuck content"), _model_metadata("2.0.0"))
+
+    monkeypatch.setattr(services, "BLOB_DELETE_LEASE", 0)
+    second = registry.register_model(io.BytesIO(b"stuck content"), _model_metadata("2.0.0"))
+    assert second.storage_path == first.storage_path
+    assert registry.metadata_storage.find_blob(digest, "models")["refcount"] == 1
+    assert not registry.metadata_storage.remove_blob("models", digest, "crashed")
+    assert (
+        registry.model_storage.get_model(first.storage_path, "models").getvalue()
+        == b"stuck content"
+    )
+
+
+def test_failed_blob_delete_keeps_tombstone_and_base_reference(tmp_path, monkeypatch):
+    """Deltas release their base from the blob record, failed deletes keep the tombstone"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    base = os.urandom(256 * 1024)
+    first = registry.register_model(io.BytesIO(base), _model_metadata("1.0.0"))
+    base_digest = first.storage_path.removeprefix("sha256-")
+
+    def failing(*args, **kwargs):
+        raise StorageError("unavailable")
+
+    delta = registry.register_model(io.BytesIO(base + b"more"), _model_metadata("1.0.1", "1.0.0"))
+    assert registry.metadata_storage.find_blob(base_digest, "models")["refcount"] == 2
+    registry.model_storage.stat_model = failing
+    registry.delete_model(delta.metadata_id)
+    del registry.model_storage.stat_model
+    assert registry.metadata_storage.find_blob(base_digest, "models")["refcount"] == 1
+
+    delta = registry.register_model(io.BytesIO(base + b"other"), _model_metadata("1.0.2", "1.0.0"))
+    registry.model_storage.delete_model = failing
+    registry.delete_model(delta.metadata_id)
+    del registry.model_storage.delete_model
+    delta_digest = delta.storage_path.removeprefix("sha256-")
+    assert (
+        registry.metadata_storage.acquire_blob("models", delta_digest, delta.storage_path) is None
+    )
+    assert registry.metadata_storage.find_blob(base_digest, "models")["refcount"] == 2
+
+
+def test_minio_multipart_api():
+    """The private Minio multipart methods used by MinioStorage keep the signatures it relies on"""
+    expected = {
+        "_create_multipart_upload": ["bucket_name", "object_name", "headers"],
+        "_upload_part": [
+            "bucket_name",
+            "object_name",
+            "data",
+            "headers",
+            "upload_id",
+            "part_number",
+        ],
+        "_complete_multipart_upload": ["bucket_name", "object_name", "upload_id", "parts"],
+        "_abort_multipart_upload": ["bucket_name", "object_name", "upload_id"],
+    }
+    for name, params in expected.items():
+        signature = inspect.signature(getattr(Minio, name))
+        positional = [
+            param for param in list(signature.parameters.values())[1:]
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        ]
+        assert [param.name for param in positional[:len(params)]] == params, name
+        assert all(param.default is not param.empty for param in positional[len(params):]), name
+
+    part = Part(3, "etag")
+    assert (part.part_number, part.etag) == (3, "etag")
+
+
+def test_delta_chain_is_encoded_and_rebuilt_from_files(tmp_path, monkeypatch):
+    """Delta versions are encoded and rebuilt through temporary files, with and without the cache"""
+    monkeypatch.setattr(settings, "DOWNLOAD_CHUNK_SIZE", 64 * 1024)
+    monkeypatch.setattr(settings, "DELTA_CACHE_BYTES", 0)
+    registry = _local_registry(tmp_path, monkeypatch)
+    contents = [os.urandom(1024 * 1024)]
+    for _ in range(2):
+        changed = bytearray(contents[-1])
+        changed[300_000:300_100] = os.urandom(100)
+        contents.append(bytes(changed) + os.urandom(1000))
+
+    registry.register_model(io.BytesIO(contents[0]), _model_metadata("1.0.0"))
+    registry.register_model(
+        io.BytesIO(contents[1]), _model_metadata("1.0.1", parent_version="1.0.0")
+    )
+    last = registry.register_model(
+        io.BytesIO(contents[2]), _model_metadata("1.0.2", parent_version="1.0.1")
+    )
+
+    info = registry.get_model_file_info(last.storage_path, "models")
+    assert info["codec"] == "delta" and info["stored_size"] < 100 * 1024
+    assert registry.get_model_file(last.storage_path, "models").read() == contents[2]
+    chunks = registry.stream_model_file(
+        last.storage_path, "models", 64 * 1024, 1000, 200_000, codec="delta"
+    )
+    assert b"".join(chunks) == contents[2][1000:201_000]
+    assert not registry.serves_ranges(info)
+
+
+def test_cached_delta_version_is_rebuilt_once(tmp_path, monkeypatch):
+    """Concurrent reads of a delta version fitting the reconstruction cache share one rebuild"""
+    registry = _local_registry(tmp_path, monkeypatch)
+    base = os.urandom(512 * 1024)
+    registry.register_model(io.BytesIO(base), _model_metadata("1.0.0"))
+    delta = registry.register_model(io.BytesIO(base + b"next"), _model_metadata("1.0.1", "1.0.0"))
+    info = registry.get_model_file_info(delta.storage_path, "models")
+    assert info["codec"] == "delta" and registry.serves_ranges(info)
+
+    rebuilds = []
+    apply_delta = services.apply_delta
+
+    def slow_apply_delta(*args):
+        rebuilds.append(threading.current_thread().name)
+        time.sleep(0.2)
+        return apply_delta(*args)
+
+    monkeypatch.setattr(services, "apply_delta", slow_apply_delta)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        parts = list(pool.map(
+            lambda offset: b"".join(registry.stream_model_file(
+                delta.storage_path, "models", 64 * 1024, offset, 1000, codec="delta"
+            )),
+            range(0, 4000, 1000),
+        ))
+    assert b"".join(parts) == (base + b"next")[:4000]
+    assert len(rebuilds) == 1
+    assert registry._rebuild_locks == {}